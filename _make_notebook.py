@@ -37,7 +37,8 @@ Notebook ini mengikuti poin tugas 4(a) sampai 4(h):
 
 cells.append(code_cell(
 """import gzip
-import re
+import json
+from functools import lru_cache
 from pathlib import Path
 from collections import Counter
 
@@ -63,10 +64,12 @@ DATA_SOURCE = Path('dir_g21_small_workload_with_gt/dir_no_packets_etc/edges_12hr
 
 MAX_FILES = None         # batasi jumlah file jika source adalah folder
 SELECT_GRAPH_ID = None   # None -> otomatis pilih graph id dengan edge terbanyak
+                         # diisi (mis. 'g15') -> hanya graf ini yang dimuat
 TOP_K = 50
 SAMPLE_NODES_VIS = 80
 ADJ_MATRIX_NODES = 20
 RANDOM_SEED = 7
+CHUNK_ROWS = 500_000     # baris per chunk saat membaca file edge
 """
 ))
 
@@ -100,56 +103,107 @@ def open_maybe_gz(path: Path):
     return open(path, mode='r', encoding='utf-8', errors='ignore')
 
 
-def parse_ports(raw):
-    # Parse token seperti: 1p6-22,1p17-4 -> [(1,6,22), (1,17,4)]
-    out = []
-    if raw is None:
-        return out
-    for token in str(raw).split(','):
-        token = token.strip()
-        if not token:
-            continue
-        m = re.match(r'^(\\d+)p(\\d+)(?:-(\\d+))?$', token)
-        if not m:
-            continue
-        port = int(m.group(1))
-        proto = int(m.group(2))
-        packets = int(m.group(3)) if m.group(3) else 0
-        out.append((port, proto, packets))
-    return out
-
-
-def load_edges(path: Path, max_files=None):
+@lru_cache(maxsize=None)
+def load_graph_index(folder: Path):
+    # Indeks sidecar dari indeks_graf.py: nama file -> ukuran, mtime_ns, jumlah baris per graph id
+    try:
+        return json.loads((folder / '.indeks_graf.json').read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+
+
+def may_contain_graph(path: Path, graph_id):
+    # False hanya jika indeks masih cocok dengan file dan graf tidak ada di dalamnya
+    entry = load_graph_index(path.parent).get(path.name)
+    st = path.stat()
+    if entry is None or entry['ukuran'] != st.st_size or entry['mtime_ns'] != st.st_mtime_ns:
+        return True
+    return graph_id in entry['graf']
+
+
+# Token port: 1p6-22 -> port=1, protocol=6, packets=22 (packets opsional)
+PORT_PATTERN = r'(\\d+)p(\\d+)(?:-(\\d+))?'
+NODE_MAX = np.iinfo(np.int32).max
+BLOB_TO_CSV = str.maketrans({'p': ',', '-': ','})
+
+
+def parse_ports(blobs):
+    # Semua blob port satu chunk sekaligus -> (index baris asal, array [port, protocol, packets])
+    n_tokens = blobs.str.count(',').to_numpy() + 1
+    rows = np.repeat(blobs.index.to_numpy(), n_tokens)
+    try:
+        # Jalur cepat: semua token lengkap (port p proto - packets) -> satu konversi numpy
+        nums = np.array(','.join(blobs.tolist()).translate(BLOB_TO_CSV).split(','), dtype=np.int64)
+        if len(nums) == 3 * len(rows):
+            return rows, nums.reshape(-1, 3)
+    except ValueError:
+        pass
+
+    # Jalur lambat: ada token tanpa packets / token rusak -> regex per token
+    tok = blobs.str.extractall(PORT_PATTERN)
+    return tok.index.get_level_values(0), tok.fillna(0).astype(np.int64).to_numpy()
+
+
+def parse_chunk(chunk, file_code, file_dtype):
+    # Satu chunk read_csv -> kolom pair dan port dengan dtype ringkas
+    src = pd.to_numeric(chunk['src'], errors='coerce')
+    dst = pd.to_numeric(chunk['dst'], errors='coerce')
+    ok = src.between(0, NODE_MAX) & dst.between(0, NODE_MAX)
+    n = int(ok.sum())
+
+    pair = pd.DataFrame({
+        'graph_id': chunk['graph_id'][ok].astype('category'),
+        'src': src[ok].astype(np.int32),
+        'dst': dst[ok].astype(np.int32),
+        'file': pd.Categorical.from_codes(np.full(n, file_code, dtype=np.int16), dtype=file_dtype),
+    })
+
+    rows, port_cols = parse_ports(chunk['ports'][ok].dropna())
+    port = pair.loc[rows].reset_index(drop=True)
+    for i, (name, dtype) in enumerate([('port', np.int32), ('protocol', np.int16), ('packets', np.int64)]):
+        port.insert(3 + i, name, port_cols[:, i].astype(dtype))
+    return pair, port
+
+
+def concat_chunks(frames):
+    # graph_id tiap chunk punya kategori sendiri: samakan dulu agar hasil concat tetap categorical
+    categories = pd.api.types.union_categoricals([f['graph_id'] for f in frames]).categories
+    for f in frames:
+        f['graph_id'] = f['graph_id'].cat.set_categories(categories)
+    return pd.concat(frames, ignore_index=True)
+
+
+def load_edges(path: Path, max_files=None, chunk_rows=CHUNK_ROWS, graph_id=None):
+    # Dibaca per chunk langsung ke kolom categorical/int32 (tanpa tuple Python per baris)
     files = edge_files_from_path(path, max_files=max_files)
-    pair_records = []
-    port_records = []
-
-    for f in files:
+    if graph_id is not None:
+        # File yang menurut indeks tidak berisi graf ini tidak dibuka
+        files = [f for f in files if may_contain_graph(f, graph_id)]
+    file_dtype = pd.CategoricalDtype([str(f) for f in files])
+    pair_frames = []
+    port_frames = []
+
+    for code, f in enumerate(files):
         with open_maybe_gz(f) as fh:
-            for line in fh:
-                line = line.strip()
-                if not line or line.startswith('#'):
-                    continue
-
-                parts = line.split()
-                if len(parts) < 3:
-                    continue
-
-                graph_id = parts[0]
-                src = str(parts[1])
-                dst = str(parts[2])
-                port_blob = parts[3] if len(parts) >= 4 else None
-
-                pair_records.append((graph_id, src, dst, str(f)))
-
-                for port, proto, packets in parse_ports(port_blob):
-                    port_records.append((graph_id, src, dst, port, proto, packets, str(f)))
-
-    if not pair_records:
+            reader = pd.read_csv(
+                fh, sep=r'\\s+', header=None, comment='#', engine='c',
+                names=['graph_id', 'src', 'dst', 'ports'], usecols=[0, 1, 2, 3],
+                dtype={'graph_id': str, 'ports': str},
+                chunksize=chunk_rows, on_bad_lines='skip',
+            )
+            for chunk in reader:
+                if graph_id is not None:
+                    # Graf lain dibuang sebelum konversi angka dan parse port
+                    chunk = chunk[chunk['graph_id'] == graph_id]
+                pair, port = parse_chunk(chunk, code, file_dtype)
+                pair_frames.append(pair)
+                port_frames.append(port)
+
+    if not pair_frames or sum(len(f) for f in pair_frames) == 0:
         raise ValueError('Tidak ada edge valid yang terbaca.')
 
-    df_pair = pd.DataFrame(pair_records, columns=['graph_id', 'src', 'dst', 'file'])
-    df_port = pd.DataFrame(port_records, columns=['graph_id', 'src', 'dst', 'port', 'protocol', 'packets', 'file'])
+    df_pair = concat_chunks(pair_frames)
+    df_port = concat_chunks(port_frames)
     return files, df_pair, df_port
 
 
@@ -159,35 +213,38 @@ def choose_graph_id(df_pair, selected=None):
     return df_pair['graph_id'].value_counts().index[0]
 
 
+def weighted_edges(src, dst):
+    # (u, v, frekuensi) lewat groupby, bukan has_edge per baris
+    w = pd.DataFrame({'u': src, 'v': dst}).groupby(['u', 'v'], sort=False).size()
+    return zip(w.index.get_level_values(0).tolist(), w.index.get_level_values(1).tolist(), w.tolist())
+
+
 def build_graphs(df_pair, graph_id):
-    d = df_pair[df_pair['graph_id'] == graph_id][['src', 'dst']].copy()
+    d = df_pair.loc[df_pair['graph_id'] == graph_id, ['src', 'dst']].reset_index(drop=True)
+    src = d['src'].to_numpy()
+    dst = d['dst'].to_numpy()
 
-    # DiGraph: edge unik terarah (u,v)
+    # DiGraph: edge unik terarah (u,v), weight = jumlah kemunculan
     dg = nx.DiGraph()
-    for u, v in d.itertuples(index=False):
-        if dg.has_edge(u, v):
-            dg[u][v]['weight'] += 1
-        else:
-            dg.add_edge(u, v, weight=1)
+    dg.add_weighted_edges_from(weighted_edges(src, dst))
 
+    # Graph: (u,v) dan (v,u) digabung sebagai (min, max)
     ug = nx.Graph()
-    for u, v in d.itertuples(index=False):
-        if ug.has_edge(u, v):
-            ug[u][v]['weight'] += 1
-        else:
-            ug.add_edge(u, v, weight=1)
+    ug.add_weighted_edges_from(weighted_edges(np.minimum(src, dst), np.maximum(src, dst)))
 
     return d, dg, ug
 """
 ))
 
 cells.append(code_cell(
-"""files, df_pair, df_port = load_edges(DATA_SOURCE, max_files=MAX_FILES)
+"""files, df_pair, df_port = load_edges(DATA_SOURCE, max_files=MAX_FILES, graph_id=SELECT_GRAPH_ID)
 active_graph_id = choose_graph_id(df_pair, SELECT_GRAPH_ID)
 df_selected, Gd, Gu = build_graphs(df_pair, active_graph_id)
 
 print(f'Jumlah file dibaca: {len(files)}')
 print(f'Graph ID aktif: {active_graph_id}')
+print(f'Memori df_pair: {df_pair.memory_usage(deep=True).sum() / 2**20:.1f} MB, '
+      f'df_port: {df_port.memory_usage(deep=True).sum() / 2**20:.1f} MB')
 print('Graph ID tersedia (top 10):')
 print(df_pair['graph_id'].value_counts().head(10))
 """
@@ -4,6 +4,9 @@ import sys
 import os
 import csv
 
+from baris_edge import baris_file
+import metrik
+
 def format_size(size_bytes):
     """Mengubah byte menjadi KB, MB, atau GB agar mudah dibaca."""
     if size_bytes < 1024:
@@ -29,25 +32,22 @@ def analyze_representation(filepath):
     graph_id = "unknown"
 
     try:
-        with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-            for line in f:
-                if line.startswith('#'): continue
-                parts = line.split()
-                if len(parts) < 3: continue
-                
-                # Validasi angka
-                if not (parts[1].isdigit() and parts[2].isdigit()):
-                    continue
-
-                if edge_count == 0:
-                    graph_id = parts[0]
-
-                u, v = parts[1], parts[2]
-                
-                # Kita asumsikan Directed Graph untuk representasi
-                unique_nodes.add(u)
-                unique_nodes.add(v)
-                edge_count += 1
+        for parts in baris_file(filepath):
+            if len(parts) < 3: continue
+            
+            # Validasi angka
+            if not (parts[1].isdigit() and parts[2].isdigit()):
+                continue
+
+            if edge_count == 0:
+                graph_id = parts[0]
+
+            u, v = parts[1], parts[2]
+            
+            # Kita asumsikan Directed Graph untuk representasi
+            unique_nodes.add(u)
+            unique_nodes.add(v)
+            edge_count += 1
 
     except Exception as e:
         return None
@@ -144,7 +144,7 @@ def main(path):
     # --- SIMPAN KE CSV ---
     output_csv = "analisis_representasi.csv"
     try:
-        with open(output_csv, mode='w', newline='', encoding='utf-8') as f:
+        with metrik.fase('tulis_csv'), open(output_csv, mode='w', newline='', encoding='utf-8') as f:
             writer = csv.writer(f)
             writer.writerow(['Graph ID', 'Nama File', 'Nodes (V)', 'Edges (E)', 'Density', 'Est. Memori Matrix', 'Est. Memori List', 'Rekomendasi', 'Alasan'])
             
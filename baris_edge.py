@@ -0,0 +1,79 @@
+#!/usr/bin/python
+
+# Sumber baris edge bersama untuk skrip analisis per file (hitung_total.py,
+# hitung_derajat.py, hitung_rata_derajat.py, cek_jenis_graf.py,
+# distribusi_derajat.py, analisa_representasi.py, visualisasi_graf.py).
+#
+# Normalnya setiap file dibaca langsung dari disk (generator, hemat memori).
+# Jika beberapa subcommand dijalankan berurutan lewat graf.py, cache diaktifkan
+# sehingga setiap file hanya dibaca dan di-split SATU kali; skrip berikutnya
+# memakai baris yang sudah ada di memori.
+#
+# Jika filter graf aktif (--graph, lihat indeks_graf.py), file yang tidak berisi
+# graf tsb tidak dibuka, dan baris graf lain ditolak lewat cek prefix sebelum split.
+
+import os
+
+import metrik
+import indeks_graf
+
+_cache = None
+
+
+def aktifkan_cache():
+    """Simpan baris hasil baca di memori (dipakai bila subcommand dirangkai)."""
+    global _cache
+    if _cache is None:
+        _cache = {}
+
+
+def kosongkan_cache():
+    global _cache
+    _cache = None
+
+
+def _iter_baris(fopen, filepath):
+    n_baris = n_komentar = n_kurang = n_lain = 0
+    prefix = indeks_graf.prefix_graf()
+    try:
+        with fopen:
+            for line in fopen:
+                n_baris += 1
+                if prefix is not None and not line.startswith(prefix):
+                    n_lain += 1
+                    continue
+                if line.startswith('#'):
+                    n_komentar += 1
+                    continue
+                parts = line.split()
+                # Semua skrip butuh minimal 3 kolom (ID, Node1, Node2)
+                if len(parts) < 3:
+                    n_kurang += 1
+                    continue
+                yield parts
+    finally:
+        # Juga tercatat bila pembaca berhenti di tengah (mis. sampel visualisasi)
+        metrik.tambah('file')
+        metrik.tambah('baris', n_baris)
+        metrik.tambah('byte', os.path.getsize(filepath))
+        metrik.tolak({'komentar': n_komentar, 'kolom_kurang': n_kurang, 'graf_lain': n_lain})
+
+
+def baris_file(filepath):
+    """
+    Baris edge satu file yang sudah di-split (tanpa komentar dan baris < 3 kolom).
+    File langsung dibuka di sini, jadi error buka file muncul saat pemanggilan.
+    Jika filter graf aktif dan file tidak berisi graf tsb, hasilnya kosong tanpa membuka file.
+    """
+    # Indeks yang diperbarui ditulis sekali saat proses selesai, bukan per file
+    if not indeks_graf.perlu_dibaca(filepath, simpan=False):
+        return []
+    if _cache is not None:
+        kunci = os.path.abspath(filepath)
+        baris = _cache.get(kunci)
+        if baris is None:
+            with metrik.fase('baca_cache'):
+                baris = _cache[kunci] = list(_iter_baris(
+                    open(filepath, 'r', encoding='utf-8', errors='ignore'), filepath))
+        return baris
+    return _iter_baris(open(filepath, 'r', encoding='utf-8', errors='ignore'), filepath)
@@ -0,0 +1,254 @@
+#!/usr/bin/python
+
+# Benchmark semua pembaca dan analisis di atas data sintetis (generator_sintetis.py)
+# pada beberapa skala (default 1x, 10x, 100x). Setiap entry point dijalankan di
+# proses terpisah (cwd sementara, stdout dibuang) agar peak RSS tidak tercampur
+# dan file CSV hasil analisis tidak mengotori folder kerja.
+#
+# Hasil ditambahkan (append) ke benchmark_hasil.csv: waktu, commit git, skala,
+# entry, jumlah baris/byte, detik, lines/s, MB/s, peak RSS, dan waktu per fase,
+# sehingga run lama dan baru bisa dibandingkan (regression tracking).
+#
+# Contoh:
+#
+# python benchmark_graf.py                      # profil e1, basis 0.002, skala 1,10,100
+# python benchmark_graf.py g2 0.0005 1,10
+# python benchmark_graf.py e1 0.002 1 total,muat_edges,statistik_port
+
+import sys
+import os
+import csv
+import json
+import time
+import shutil
+import tempfile
+import subprocess
+import contextlib
+
+import metrik
+
+BASIS_DEFAULT = 0.002        # skala 1x = 0.2% profil (e1: ~10 ribu baris)
+SKALA_DEFAULT = (1, 10, 100)
+FOLDER_DATA = 'bench_data'
+OUTPUT_HASIL = 'benchmark_hasil.csv'
+PENANDA = '#BENCH '
+
+FOLDER_SKRIP = os.path.dirname(os.path.abspath(__file__))
+
+
+# --- ENTRY POINT YANG DIUKUR ---
+# Setiap fungsi menerima (folder, fase) dan mengisi fase[nama] = detik.
+# visualisasi_graf.py tidak diukur: hanya menggambar sampel 50 simpul per file.
+def _fase(fase, nama, fungsi, *args, **kwargs):
+    mulai = time.perf_counter()
+    hasil = fungsi(*args, **kwargs)
+    fase[nama] = time.perf_counter() - mulai
+    return hasil
+
+
+def bench_read_graphs(folder, fase):
+    from read_graphs import read_edges_with_ports_to_stats_multiple_files
+    _fase(fase, 'baca', read_edges_with_ports_to_stats_multiple_files, folder)
+
+
+def bench_daemon(folder, fase):
+    from daemon_graf import muat_data
+    _fase(fase, 'muat', muat_data, folder)
+
+
+def bench_muat_edges(folder, fase):
+    from muat_edges import baca_folder_array
+    _fase(fase, 'baca', baca_folder_array, folder)
+
+
+def bench_statistik_port(folder, fase):
+    from muat_edges import baca_folder_array
+    from statistik_port import hitung_statistik_port
+    data, _ = _fase(fase, 'baca', baca_folder_array, folder)
+    _fase(fase, 'analisis', lambda: [hitung_statistik_port(a) for a in data.values()])
+
+
+def bench_volume_paket(folder, fase):
+    from muat_edges import baca_folder_array
+    from volume_paket import graf_berbobot, volume_node, volume_port
+    data, _ = _fase(fase, 'baca', baca_folder_array, folder)
+    _fase(fase, 'analisis', lambda: [(volume_node(graf_berbobot(a)), volume_port(a))
+                                     for a in data.values()])
+
+
+def bench_kemiripan_port(folder, fase):
+    from muat_edges import baca_folder_array
+    from kemiripan_port import fitur_port, topk_tetangga, grouping_tetangga
+    data, _ = _fase(fase, 'baca', baca_folder_array, folder)
+    arr = max(data.values(), key=lambda a: len(a['src']))
+    _, _, x = _fase(fase, 'fitur', fitur_port, arr)
+    indeks, skor = _fase(fase, 'topk', topk_tetangga, x, verbose=False)
+    _fase(fase, 'grouping', grouping_tetangga, indeks, skor)
+
+
+def bench_minhash(folder, fase):
+    from minhash_lsh import bangun_signature, pilih_band, kandidat_lsh
+    sig = _fase(fase, 'signature', bangun_signature, folder, verbose=False)
+    b, r = pilih_band(128, 0.8)
+    _fase(fase, 'lsh', lambda: [kandidat_lsh(s, b, r) for _, s in sig.values()])
+
+
+def _bench_skrip(modul):
+    def jalan(folder, fase):
+        import importlib
+        m = importlib.import_module(modul)
+        _fase(fase, 'total', m.main, folder)
+    return jalan
+
+
+ENTRY = {
+    'read_graphs': bench_read_graphs,
+    'daemon_graf': bench_daemon,
+    'muat_edges': bench_muat_edges,
+    'statistik_port': bench_statistik_port,
+    'volume_paket': bench_volume_paket,
+    'kemiripan_port': bench_kemiripan_port,
+    'minhash_lsh': bench_minhash,
+    'total': _bench_skrip('hitung_total'),
+    'derajat': _bench_skrip('hitung_derajat'),
+    'rata': _bench_skrip('hitung_rata_derajat'),
+    'jenis': _bench_skrip('cek_jenis_graf'),
+    'distribusi': _bench_skrip('distribusi_derajat'),
+    'representasi': _bench_skrip('analisa_representasi'),
+}
+
+
+# --- FUNGSI BANTU ---
+def ukuran_data(folder):
+    """Jumlah file, baris, dan byte semua file di folder."""
+    n_file, n_baris, n_byte = 0, 0, 0
+    for root, dirs, files in os.walk(folder):
+        for file in files:
+            with open(os.path.join(root, file), 'rb') as f:
+                for blok in iter(lambda: f.read(1 << 20), b''):
+                    n_baris += blok.count(b'\n')
+                    n_byte += len(blok)
+            n_file += 1
+    return n_file, n_baris, n_byte
+
+
+def commit_git():
+    try:
+        out = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=FOLDER_SKRIP,
+                             capture_output=True, text=True, timeout=10)
+        return out.stdout.strip() or '-'
+    except Exception:
+        return '-'
+
+
+def jalankan_anak(nama, folder):
+    """Dipanggil di proses anak: jalankan satu entry, cetak hasil JSON di baris terakhir."""
+    fase = {}
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        mulai = time.perf_counter()
+        ENTRY[nama](folder, fase)
+        total = time.perf_counter() - mulai
+    print(PENANDA + json.dumps({'detik': total, 'fase': fase, 'rss': metrik.peak_rss_mb()}))
+
+
+def ukur(nama, folder):
+    """Menjalankan entry di proses baru. Mengembalikan dict hasil atau None jika gagal."""
+    kerja = tempfile.mkdtemp(prefix='bench_')
+    env = dict(os.environ, PYTHONPATH=FOLDER_SKRIP + os.pathsep + os.environ.get('PYTHONPATH', ''))
+    try:
+        out = subprocess.run([sys.executable, os.path.abspath(__file__), '--jalankan', nama,
+                              os.path.abspath(folder)],
+                             cwd=kerja, env=env, capture_output=True, text=True)
+    finally:
+        shutil.rmtree(kerja, ignore_errors=True)
+
+    for line in reversed(out.stdout.splitlines()):
+        if line.startswith(PENANDA):
+            return json.loads(line[len(PENANDA):])
+    pesan = (out.stderr.strip().splitlines() or ['tanpa pesan'])[-1]
+    print(f"      [ERROR] {nama}: {pesan}")
+    return None
+
+
+def siapkan_data(profil, skala):
+    """Folder data sintetis untuk skala tsb (dibuat sekali, dipakai ulang)."""
+    from generator_sintetis import generate
+    folder = os.path.join(FOLDER_DATA, f"{profil}_{skala:g}")
+    if not os.path.isdir(folder):
+        generate(profil, skala, folder)
+    return folder
+
+
+# --- FUNGSI UTAMA ---
+def main(profil='e1', basis=BASIS_DEFAULT, daftar_skala=SKALA_DEFAULT, daftar_entry=None):
+    daftar_entry = daftar_entry or list(ENTRY)
+    waktu = time.strftime('%Y-%m-%d %H:%M:%S')
+    commit = commit_git()
+
+    print(f"\n{'='*100}")
+    print(f"{'BENCHMARK PEMBACA DAN ANALISIS GRAF':^100}")
+    print(f"{'='*100}")
+    print(f"# Profil={profil} basis={basis:g} skala={','.join(map(str, daftar_skala))} commit={commit}")
+
+    baris_hasil = []
+    for k in daftar_skala:
+        folder = siapkan_data(profil, basis * k)
+        n_file, n_baris, n_byte = ukuran_data(folder)
+        mb = n_byte / 1024 ** 2
+        print(f"\n>>> SKALA {k}x: {n_file} file, {n_baris} baris, {mb:.1f} MB ({folder})")
+        print(f"{'Entry':<16} {'Detik':>9} {'Lines/s':>12} {'MB/s':>8} {'RSS (MB)':>9}  Fase")
+        print('-' * 100)
+
+        for nama in daftar_entry:
+            h = ukur(nama, folder)
+            if h is None:
+                continue
+            detik = max(h['detik'], 1e-9)
+            fase = ';'.join(f"{f}={t:.3f}" for f, t in h['fase'].items())
+            print(f"{nama:<16} {detik:>9.3f} {n_baris / detik:>12.0f} {mb / detik:>8.2f} "
+                  f"{h['rss']:>9.1f}  {fase}")
+            baris_hasil.append([waktu, commit, profil, f"{basis * k:g}", k, nama, n_file, n_baris,
+                                f"{mb:.3f}", f"{detik:.4f}", f"{n_baris / detik:.0f}",
+                                f"{mb / detik:.3f}", f"{h['rss']:.1f}", fase])
+
+    # --- SIMPAN KE CSV (append) ---
+    try:
+        baru = not os.path.exists(OUTPUT_HASIL)
+        with open(OUTPUT_HASIL, 'a', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            if baru:
+                writer.writerow(['Waktu', 'Commit', 'Profil', 'Skala Profil', 'Skala', 'Entry',
+                                 'Files', 'Lines', 'MB', 'Detik', 'Lines/s', 'MB/s',
+                                 'Peak RSS (MB)', 'Fase (detik)'])
+            writer.writerows(baris_hasil)
+        print(f"\n[SUKSES] {len(baris_hasil)} hasil ditambahkan ke: {OUTPUT_HASIL}\n")
+    except Exception as e:
+        print(f"\n[ERROR] Gagal menyimpan CSV: {e}")
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1 and sys.argv[1] == '--jalankan':
+        jalankan_anak(sys.argv[2], sys.argv[3])
+        sys.exit(0)
+
+    if len(sys.argv) > 1 and sys.argv[1] in ('-h', '--help'):
+        print("Usage: python benchmark_graf.py [profil: g2|g4|e1] [basis_skala] [skala,...] [entry,...]")
+        print(f"Entry: {', '.join(ENTRY)}")
+        sys.exit(1)
+
+    profil = sys.argv[1] if len(sys.argv) > 1 else 'e1'
+    basis = float(sys.argv[2]) if len(sys.argv) > 2 else BASIS_DEFAULT
+    daftar_skala = [int(s) for s in sys.argv[3].split(',')] if len(sys.argv) > 3 else SKALA_DEFAULT
+    daftar_entry = sys.argv[4].split(',') if len(sys.argv) > 4 else None
+
+    from generator_sintetis import PROFIL
+    if profil not in PROFIL:
+        print(f"[ERROR] Profil '{profil}' tidak dikenal (pilihan: {', '.join(PROFIL)})")
+        sys.exit(1)
+
+    salah = [e for e in (daftar_entry or []) if e not in ENTRY]
+    if salah:
+        print(f"[ERROR] Entry tidak dikenal: {', '.join(salah)} (pilihan: {', '.join(ENTRY)})")
+        sys.exit(1)
+
+    main(profil, basis, daftar_skala, daftar_entry)
@@ -0,0 +1,177 @@
+#!/usr/bin/python
+
+# Benchmark urutan simpul CSR (graf_csr.URUTAN) untuk analisis yang banyak
+# menelusuri graf: BFS, hitung segitiga, dan PageRank.
+#
+# Setiap graf dibekukan sekali per urutan (bangun_csr(arr, urutan)), lalu
+# ketiga kernel dijalankan di adjacency tak berarahnya (scipy.sparse):
+#   bfs       : jarak hop dari K_SUMBER sumber tetap (node id asli yang sama di
+#               semua urutan)
+#   segitiga  : jumlah segitiga = sum((A @ A) .* A) / 6
+#   pagerank  : ITERASI_PR iterasi power method (damping 0.85)
+# Waktu = minimum dari beberapa ulangan. Hasil setiap urutan dicek sama dengan
+# urutan asli (setelah dipetakan balik ke node id asli), lalu dilaporkan
+# speedup terhadap 'asli' dan biaya penomoran ulang (bangun_csr termasuk relabel).
+#
+# Input bisa folder edges, atau nama profil generator_sintetis (g2, g4, e1)
+# beserta skala profil; data sintetis dibuat sekali di bench_data/.
+#
+# Contoh:
+#
+# python benchmark_urutan.py dir_g22_extra_graph_with_gt/dir_edges
+# python benchmark_urutan.py g2 0.01
+# python benchmark_urutan.py g4 0.05 --graph g4
+
+import sys
+import os
+import csv
+import time
+import numpy as np
+
+import metrik
+import indeks_graf
+import graf_csr
+from muat_edges import baca_folder_array
+
+K_SUMBER = 16
+ITERASI_PR = 20
+ULANGAN = 3
+SKALA_DEFAULT = 0.01
+
+
+# --- KERNEL ---
+def matriks(csr):
+    """Adjacency tak berarah csr sebagai scipy csr_matrix float64 (n x n)."""
+    from scipy.sparse import csr_matrix
+    indptr, indices = graf_csr.tak_berarah(csr)
+    n = len(csr['node_ids'])
+    return csr_matrix((np.ones(len(indices)), indices, indptr), shape=(n, n))
+
+
+def kernel_bfs(adj, sumber):
+    """Jarak hop dari setiap sumber (id internal), array (len(sumber), n)."""
+    from scipy.sparse.csgraph import shortest_path
+    return shortest_path(adj, directed=False, unweighted=True, indices=sumber)
+
+
+def kernel_segitiga(adj):
+    return int(round((adj @ adj).multiply(adj).sum() / 6))
+
+
+def kernel_pagerank(adj, iterasi=ITERASI_PR, d=0.85):
+    n = adj.shape[0]
+    deg = np.asarray(adj.sum(axis=1)).ravel()
+    inv = np.divide(1.0, deg, out=np.zeros(n), where=deg > 0)
+    pr = np.full(n, 1.0 / n)
+    for _ in range(iterasi):
+        x = pr * inv
+        # Massa simpul tanpa tetangga dibagi rata
+        pr = d * (adj @ x) + (d * pr[deg == 0].sum() + 1.0 - d) / n
+    return pr
+
+
+def _ukur(fungsi, *args):
+    """(hasil, detik minimum dari ULANGAN kali)."""
+    terbaik = None
+    for _ in range(ULANGAN):
+        mulai = time.perf_counter()
+        hasil = fungsi(*args)
+        detik = time.perf_counter() - mulai
+        terbaik = detik if terbaik is None else min(terbaik, detik)
+    return hasil, terbaik
+
+
+# --- BENCHMARK SATU GRAF ---
+def bench_graf(arr):
+    """Baris hasil per urutan: (urutan, detik bangun, bfs, segitiga, pagerank, bandwidth)."""
+    hasil = []
+    acuan = None
+    sumber_asli = None
+    for urutan in graf_csr.URUTAN:
+        mulai = time.perf_counter()
+        csr = graf_csr.bangun_csr(arr, urutan)
+        t_bangun = time.perf_counter() - mulai
+        adj = matriks(csr)
+        n = adj.shape[0]
+
+        if sumber_asli is None:
+            # Sumber tetap dalam node id asli: sebar rata di id terurut
+            ids = np.sort(csr['node_ids'])
+            sumber_asli = ids[np.linspace(0, n - 1, min(K_SUMBER, n)).astype(np.int64)]
+        sumber = graf_csr.indeks_node(csr, sumber_asli)
+
+        jarak, t_bfs = _ukur(kernel_bfs, adj, sumber)
+        segitiga, t_seg = _ukur(kernel_segitiga, adj)
+        pr, t_pr = _ukur(kernel_pagerank, adj)
+
+        # Dipetakan balik ke urutan node id asli untuk dicek antar urutan
+        urut_asli = np.argsort(csr['node_ids'], kind='stable')
+        ringkas = (jarak[:, urut_asli], segitiga, pr[urut_asli])
+        if acuan is None:
+            acuan = ringkas
+        elif not (np.array_equal(ringkas[0], acuan[0]) and ringkas[1] == acuan[1]
+                  and np.allclose(ringkas[2], acuan[2], rtol=1e-9, atol=1e-15)):
+            print(f"   [ERROR] Hasil urutan '{urutan}' berbeda dari urutan asli!")
+
+        # Bandwidth rata-rata: jarak id rata-rata antar tetangga (makin kecil makin lokal)
+        baris = np.repeat(np.arange(n), np.diff(adj.indptr))
+        lebar = float(np.abs(adj.indices - baris).mean()) if adj.nnz else 0.0
+        hasil.append((urutan, t_bangun, t_bfs, t_seg, t_pr, lebar, segitiga))
+    return hasil
+
+
+# --- FUNGSI UTAMA ---
+def main(path):
+    wload_to_arrays, files = baca_folder_array(path)
+    print(f'\n# Done reading from {len(files)} file(s).')
+    if not wload_to_arrays:
+        print("\n[!] Tidak ada graf yang ditemukan.")
+        return
+
+    baris_csv = []
+    for w in sorted(wload_to_arrays):
+        arr = wload_to_arrays[w]
+        print(f"\n# Graf {w}: {len(arr['src'])} baris edge, {ULANGAN} ulangan per kernel")
+        hasil = bench_graf(arr)
+        _, _, b0, s0, p0, _, segitiga = hasil[0]
+        print(f"{'Urutan':<9} {'Bangun':>8} {'BFS':>9} {'x':>6} {'Segitiga':>9} {'x':>6} "
+              f"{'PageRank':>9} {'x':>6} {'Lebar':>10}")
+        print('-' * 82)
+        for urutan, t_bangun, t_bfs, t_seg, t_pr, lebar, _ in hasil:
+            print(f"{urutan:<9} {t_bangun:>7.2f}s {t_bfs:>8.3f}s {b0 / t_bfs:>5.2f}x "
+                  f"{t_seg:>8.3f}s {s0 / t_seg:>5.2f}x {t_pr:>8.3f}s {p0 / t_pr:>5.2f}x {lebar:>10.1f}")
+            baris_csv.append([w, urutan, f"{t_bangun:.4f}", f"{t_bfs:.4f}", f"{b0 / t_bfs:.3f}",
+                              f"{t_seg:.4f}", f"{s0 / t_seg:.3f}", f"{t_pr:.4f}", f"{p0 / t_pr:.3f}",
+                              f"{lebar:.2f}", segitiga])
+
+    # --- SIMPAN KE CSV ---
+    output_csv = "benchmark_urutan.csv"
+    try:
+        with open(output_csv, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(['Graph ID', 'Urutan', 'Bangun CSR (s)', 'BFS (s)', 'Speedup BFS',
+                             'Segitiga (s)', 'Speedup Segitiga', 'PageRank (s)', 'Speedup PageRank',
+                             'Lebar Rata-rata', 'Jumlah Segitiga'])
+            writer.writerows(baris_csv)
+        print(f"\n[SUKSES] Hasil benchmark urutan disimpan di: {output_csv}\n")
+    except Exception as e:
+        print(f"\n[ERROR] Gagal menyimpan CSV: {e}")
+
+
+if __name__ == '__main__':
+    sys.argv = indeks_graf.dari_argv(metrik.dari_argv(sys.argv))
+    if len(sys.argv) < 2:
+        print("Usage: python benchmark_urutan.py <folder_name | profil: g2|g4|e1> [skala_profil] "
+              "[--graph <id>] [--metrik[=file.json]] [--profile[=file.prof]]")
+        sys.exit(1)
+
+    path = sys.argv[1]
+    if not os.path.exists(path):
+        from generator_sintetis import PROFIL
+        if path not in PROFIL:
+            print(f"[ERROR] Folder '{path}' tidak ditemukan!")
+            sys.exit(1)
+        from benchmark_graf import siapkan_data
+        path = siapkan_data(path, float(sys.argv[2]) if len(sys.argv) > 2 else SKALA_DEFAULT)
+
+    main(path)
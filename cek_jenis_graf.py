@@ -4,6 +4,9 @@ import sys
 import os
 import csv
 
+from baris_edge import baris_file
+import metrik
+
 def determine_graph_type(filepath):
     """
     Menganalisa file .txt untuk menentukan karakteristik graf:
@@ -28,38 +31,34 @@ def determine_graph_type(filepath):
     graph_id = "unknown"
 
     try:
-        with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-            for line in f:
-                if line.startswith('#'): continue
-                parts = line.split()
-                
-                # Format minimal: ID u v ...
-                if len(parts) < 3: continue
-                
-                # Pastikan u dan v adalah angka
-                if not (parts[1].isdigit() and parts[2].isdigit()):
-                    continue
-
-                if valid_lines == 0:
-                    graph_id = parts[0]
-
-                u = parts[1]
-                v = parts[2]
-                
-                # Cek Self Loop (Simpul mengarah ke diri sendiri)
-                if u == v:
-                    has_self_loop = True
-
-                # Cek Multigraph (Apakah edge u->v sudah pernah ada?)
-                # Kita anggap ini Directed (Berarah) karena data jaringan
-                edge_pair = (u, v)
-                
-                if edge_pair in edge_set:
-                    is_multigraph = True
-                else:
-                    edge_set.add(edge_pair)
-                
-                valid_lines += 1
+        for parts in baris_file(filepath):
+            # Format minimal: ID u v ...
+            if len(parts) < 3: continue
+            
+            # Pastikan u dan v adalah angka
+            if not (parts[1].isdigit() and parts[2].isdigit()):
+                continue
+
+            if valid_lines == 0:
+                graph_id = parts[0]
+
+            u = parts[1]
+            v = parts[2]
+            
+            # Cek Self Loop (Simpul mengarah ke diri sendiri)
+            if u == v:
+                has_self_loop = True
+
+            # Cek Multigraph (Apakah edge u->v sudah pernah ada?)
+            # Kita anggap ini Directed (Berarah) karena data jaringan
+            edge_pair = (u, v)
+            
+            if edge_pair in edge_set:
+                is_multigraph = True
+            else:
+                edge_set.add(edge_pair)
+            
+            valid_lines += 1
 
     except Exception as e:
         print(f"[ERROR] {filename}: {e}")
@@ -132,7 +131,7 @@ def main(path):
     # 2. SIMPAN KE CSV
     output_csv = "jenis_graf.csv"
     try:
-        with open(output_csv, mode='w', newline='', encoding='utf-8') as f:
+        with metrik.fase('tulis_csv'), open(output_csv, mode='w', newline='', encoding='utf-8') as f:
             writer = csv.DictWriter(f, fieldnames=['Graph ID', 'Nama File', 'Ada Self-Loop', 'Apakah Multigraph', 'Jenis Graf'])
             writer.writeheader()
             
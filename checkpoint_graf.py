@@ -0,0 +1,253 @@
+#!/usr/bin/python
+
+# Checkpoint / resume untuk scan multi-file read_graphs.py
+# (read_edges_with_ports_to_stats_multiple_files).
+#
+# Scan 4 hari atas korpus 20 graf cukup lama sehingga OOM atau Ctrl-C di
+# dekat akhir membuang semua pekerjaan. Di sini state agregat disimpan
+# berkala (setelah sebuah file SELESAI, paling cepat tiap INTERVAL_DETIK,
+# dan saat Ctrl-C) bersama daftar file yang sudah selesai.
+#
+# Format (satu file .npz, ditulis ke file sementara lalu os.replace, jadi
+# checkpoint lama tetap utuh bila proses mati saat menulis):
+#   tabel string  : graph id, node id, port -> bytes dipisah '\n' (uint8)
+#   adjacency     : graf -> simpul u -> (v, jumlah), dikelompokkan seperti CSR:
+#                   adj_graf, adj_n_u, adj_u, adj_n_v, adj_v, adj_n
+#   port_info     : graf -> port -> pasangan (u, v):
+#                   port_graf, port_n_p, port_p, port_n_pasangan, port_u, port_v
+#   longevity     : graf -> triple: long_graf, long_n_t, long_u, long_v, long_p, long_n
+#   meta (JSON)   : path, filter graf, mode containment, file selesai
+# Semua kolom berupa indeks ke tabel string, dengan dtype integer terkecil
+# yang cukup (mis. uint16 untuk < 65536 simpul).
+# Tidak ada pickle dict: setiap entri disimpan sebagai kolom integer, urutan
+# dict (urutan sisip) ikut tersimpan sehingga hasil resume identik dengan
+# run tanpa henti (termasuk urutan graf / simpul yang dipakai visualisasi).
+#
+# Flag (read_graphs.py):
+#   --checkpoint[=file.npz]   simpan checkpoint berkala (default checkpoint_graf.npz)
+#   --resume[=file.npz]       lanjutkan dari checkpoint (dan terus menyimpan ke file itu)
+#
+# Contoh:
+#
+# python read_graphs.py data_graf --checkpoint
+# python read_graphs.py data_graf --resume          # setelah Ctrl-C / OOM
+# python checkpoint_graf.py checkpoint_graf.npz     # isi checkpoint
+
+import sys
+import os
+import json
+import time
+import numpy as np
+from collections import defaultdict, Counter
+
+import metrik
+
+NAMA_DEFAULT = 'checkpoint_graf.npz'
+INTERVAL_DETIK = 60
+VERSI = 1
+
+_file = None       # file checkpoint (None = mati)
+_resume = False
+
+
+# --- FUNGSI BANTU ---
+def atur_checkpoint(nama_file, resume=False):
+    """Aktifkan checkpoint ke nama_file (None = mati); resume=True memuatnya dulu."""
+    global _file, _resume
+    _file = nama_file
+    _resume = bool(resume and nama_file)
+
+
+def checkpoint_aktif():
+    return _file
+
+
+def resume_aktif():
+    return _resume
+
+
+def _tabel_ke_array(tabel):
+    return np.frombuffer('\n'.join(tabel).encode('utf-8'), dtype=np.uint8)
+
+
+def _array_ke_tabel(arr):
+    teks = arr.tobytes().decode('utf-8')
+    return teks.split('\n') if teks else []
+
+
+# --- SIMPAN / MUAT ---
+def _kolom(x):
+    """Array integer non-negatif dengan dtype terkecil yang cukup (uint8/16/32, int64)."""
+    arr = np.array(x, dtype=np.int64)
+    maks = int(arr.max()) if len(arr) else 0
+    for dt in (np.uint8, np.uint16, np.uint32):
+        if maks <= np.iinfo(dt).max:
+            return arr.astype(dt)
+    return arr
+
+
+def _ulang(kelompok, jumlah):
+    """Memperluas nilai per kelompok sesuai jumlah anggotanya (kebalikan pengelompokan)."""
+    return np.repeat(np.asarray(kelompok, dtype=np.int64), np.asarray(jumlah, dtype=np.int64)).tolist()
+
+
+def simpan_checkpoint(nama_file, wload_to_graph, wload_to_port_info, wload_to_directed_longevity,
+                      meta):
+    """Serialisasi state agregat + meta ke nama_file (atomik)."""
+    graf_idx, node_idx, port_idx = {}, {}, {}
+
+    def gi(w):
+        return graf_idx.setdefault(w, len(graf_idx))
+
+    def ni(n):
+        return node_idx.setdefault(n, len(node_idx))
+
+    def pi(p):
+        return port_idx.setdefault(p, len(port_idx))
+
+    with metrik.fase('checkpoint_simpan'):
+        kolom = {}
+        # Adjacency: graf -> simpul u (jumlah per graf) -> tetangga v (jumlah per u)
+        urutan, n_u, u, n_v, v, n = [], [], [], [], [], []
+        for w, g in wload_to_graph.items():
+            urutan.append(gi(w))
+            n_u.append(len(g))
+            for a, tetangga in g.items():
+                u.append(ni(a))
+                n_v.append(len(tetangga))
+                v.extend(ni(b) for b in tetangga)
+                n.extend(tetangga.values())
+        kolom.update(adj_graf=urutan, adj_n_u=n_u, adj_u=u, adj_n_v=n_v, adj_v=v, adj_n=n)
+
+        # Port info: graf -> port (jumlah per graf) -> pasangan (u, v) (jumlah per port)
+        urutan, n_p, p, n_pas, u, v = [], [], [], [], [], []
+        for w, st in wload_to_port_info.items():
+            urutan.append(gi(w))
+            n_p.append(len(st))
+            for port, pasangan in st.items():
+                p.append(pi(port))
+                n_pas.append(len(pasangan))
+                for a, b in pasangan:
+                    u.append(ni(a))
+                    v.append(ni(b))
+        kolom.update(port_graf=urutan, port_n_p=n_p, port_p=p, port_n_pasangan=n_pas,
+                     port_u=u, port_v=v)
+
+        # Longevity: graf -> triple (jumlah per graf)
+        urutan, n_t, u, v, p, n = [], [], [], [], [], []
+        for w, trip in wload_to_directed_longevity.items():
+            urutan.append(gi(w))
+            n_t.append(len(trip))
+            for (a, b, port), k in trip.items():
+                u.append(ni(a))
+                v.append(ni(b))
+                p.append(pi(port))
+                n.append(k)
+        kolom.update(long_graf=urutan, long_n_t=n_t, long_u=u, long_v=v, long_p=p, long_n=n)
+
+        meta = dict(meta, versi=VERSI, waktu=time.strftime('%Y-%m-%d %H:%M:%S'))
+        array = {k: _kolom(x) for k, x in kolom.items()}
+        sementara = nama_file + '.tmp'
+        with open(sementara, 'wb') as f:
+            np.savez(f,
+                     meta=np.frombuffer(json.dumps(meta).encode('utf-8'), dtype=np.uint8),
+                     tabel_graf=_tabel_ke_array(graf_idx), tabel_node=_tabel_ke_array(node_idx),
+                     tabel_port=_tabel_ke_array(port_idx), **array)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(sementara, nama_file)
+    metrik.tambah('checkpoint')
+
+
+def muat_checkpoint(nama_file):
+    """
+    Kebalikan simpan_checkpoint. Mengembalikan
+    (wload_to_graph, wload_to_port_info, wload_to_directed_longevity, meta).
+    """
+    with metrik.fase('checkpoint_muat'), np.load(nama_file) as d:
+        meta = json.loads(d['meta'].tobytes().decode('utf-8'))
+        if meta.get('versi') != VERSI:
+            raise ValueError(f"versi checkpoint {meta.get('versi')} tidak didukung (harus {VERSI})")
+        graf = _array_ke_tabel(d['tabel_graf'])
+        node = _array_ke_tabel(d['tabel_node'])
+        port = _array_ke_tabel(d['tabel_port'])
+
+        wload_to_graph = {graf[i]: defaultdict(Counter) for i in d['adj_graf'].tolist()}
+        # Setiap u / port punya minimal satu anggota, jadi urutan sisip ikut terbentuk
+        graf_per_v = _ulang(_ulang(d['adj_graf'], d['adj_n_u']), d['adj_n_v'])
+        u_per_v = _ulang(d['adj_u'], d['adj_n_v'])
+        for w, a, b, k in zip(graf_per_v, u_per_v, d['adj_v'].tolist(), d['adj_n'].tolist()):
+            wload_to_graph[graf[w]][node[a]][node[b]] = k
+
+        wload_to_port_info = {graf[i]: defaultdict(set) for i in d['port_graf'].tolist()}
+        graf_per_p = _ulang(d['port_graf'], d['port_n_p'])
+        for w, p, a, b in zip(_ulang(graf_per_p, d['port_n_pasangan']),
+                              _ulang(d['port_p'], d['port_n_pasangan']),
+                              d['port_u'].tolist(), d['port_v'].tolist()):
+            wload_to_port_info[graf[w]][port[p]].add((node[a], node[b]))
+
+        wload_to_directed_longevity = defaultdict(Counter)
+        for i in d['long_graf'].tolist():
+            wload_to_directed_longevity[graf[i]] = Counter()
+        for w, a, b, p, k in zip(_ulang(d['long_graf'], d['long_n_t']), d['long_u'].tolist(),
+                                 d['long_v'].tolist(), d['long_p'].tolist(), d['long_n'].tolist()):
+            wload_to_directed_longevity[graf[w]][(node[a], node[b], port[p])] = k
+    return wload_to_graph, wload_to_port_info, wload_to_directed_longevity, meta
+
+
+def cocokkan_meta(meta, path, graph_id, containment, files):
+    """
+    Cek checkpoint dibuat untuk scan yang sama. Mengembalikan set file yang
+    sudah selesai; ValueError jika checkpoint tidak cocok.
+    """
+    if os.path.abspath(path) != meta['path']:
+        raise ValueError(f"checkpoint untuk folder '{meta['path']}', bukan '{os.path.abspath(path)}'")
+    if graph_id != meta['graf'] or containment != meta['containment']:
+        raise ValueError(f"checkpoint dibuat dengan --graph={meta['graf']} "
+                         f"--containment={meta['containment']}, flag sekarang berbeda")
+    selesai = set(meta['selesai'])
+    hilang = selesai - set(files)
+    if hilang:
+        raise ValueError(f"{len(hilang)} file di checkpoint tidak ada lagi di folder "
+                         f"(mis. {sorted(hilang)[0]})")
+    return selesai
+
+
+# --- FLAG COMMAND LINE ---
+def dari_argv(argv):
+    """Membuang '--checkpoint[=file]' / '--resume[=file]' dari argv dan mengaktifkannya."""
+    sisa = []
+    for arg in argv:
+        if arg == '--checkpoint' or arg.startswith('--checkpoint='):
+            atur_checkpoint(arg.partition('=')[2] or NAMA_DEFAULT, resume=_resume)
+        elif arg == '--resume' or arg.startswith('--resume='):
+            atur_checkpoint(arg.partition('=')[2] or _file or NAMA_DEFAULT, resume=True)
+        else:
+            sisa.append(arg)
+    return sisa
+
+
+# --- FUNGSI UTAMA ---
+def main(nama_file):
+    """Menampilkan isi checkpoint."""
+    graphs, stats, longev, meta = muat_checkpoint(nama_file)
+    print(f"\n# Checkpoint: {nama_file} ({os.path.getsize(nama_file) / 1024 ** 2:.1f} MB, {meta['waktu']})")
+    print(f"# Folder: {meta['path']}  --graph={meta['graf']}  --containment={meta['containment']}")
+    print(f"# {len(meta['selesai'])} file selesai")
+    print(f"\n{'Graph ID':<16} {'Simpul':>10} {'Adjacency':>12} {'Port':>8} {'Triple':>12}")
+    for w, g in graphs.items():
+        print(f"{w:<16} {len(g):>10} {sum(len(t) for t in g.values()):>12} "
+              f"{len(stats.get(w, {})):>8} {len(longev.get(w, {})):>12}")
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        print("Usage: python checkpoint_graf.py <file_checkpoint.npz>")
+        sys.exit(1)
+
+    nama_file = sys.argv[1]
+    if not os.path.isfile(nama_file):
+        print(f"[ERROR] File '{nama_file}' tidak ditemukan!")
+        sys.exit(1)
+
+    main(nama_file)
@@ -0,0 +1,188 @@
+#!/usr/bin/python
+
+# Churn edge / simpul / port dari jam ke jam (atau file ke file) untuk seri
+# file edge berurutan, mis. 96 file per jam g21 di
+# dir_includes_packets_and_other_nodes/ atau file harian e1 di dir_g22.../dir_edges/.
+#
+# File diurutkan secara natural (angka di nama file dibandingkan sebagai angka,
+# jadi out2022_9_3 sebelum out2022_9_13), lalu dibaca SATU kali berurutan.
+# Untuk setiap graf hanya himpunan jam sebelumnya yang disimpan, sebagai array
+# int64 terurut unik:
+#   edge : src<<32|dst      (muat_edges.kunci_edge)
+#   node : node id
+#   port : port<<8|proto    (muat_edges.kunci_port)
+# Irisan dua array terurut dihitung dengan merge linear: kedua array
+# digabung lalu di-sort stabil (timsort mendeteksi dua run terurut, jadi
+# hanya satu kali merge), elemen kembar bersebelahan = elemen yang bertahan.
+#
+# Output churn_edge.csv, satu baris per (file, graf):
+#   jumlah, lahir (baru dibanding jam sebelumnya), mati (hilang), bertahan, Jaccard
+#   untuk edge, node, dan port.
+#
+# Contoh:
+#
+# python churn_edge.py dir_g21_small_workload_with_gt/dir_includes_packets_and_other_nodes
+# python churn_edge.py dir_g22_extra_graph_with_gt/dir_edges --graph e1 --metrik
+
+import sys
+import os
+import re
+import csv
+import numpy as np
+
+from muat_edges import daftar_file_edges, baca_file_array, kunci_edge, kunci_port
+import metrik
+import indeks_graf
+import dedup_file
+import pipeline_baca
+
+JENIS = ('edge', 'node', 'port')
+_KOSONG = np.zeros(0, dtype=np.int64)
+
+
+# --- FUNGSI BANTU ---
+def urut_natural(files):
+    """Urutan file dengan angka di nama dibandingkan sebagai angka (jam / tanggal)."""
+    def kunci(f):
+        return [int(t) if t.isdigit() else t for t in re.split(r'(\d+)', os.path.basename(f))]
+    return sorted(files, key=kunci)
+
+
+def himpunan_jam(arr):
+    """Array terurut unik edge, node, dan port untuk satu graf di satu file."""
+    src, dst = arr['src'], arr['dst']
+    return {
+        'edge': np.unique(kunci_edge(src, dst)),
+        'node': np.unique(np.concatenate((src, dst))),
+        'port': np.unique(kunci_port(arr['port'], arr['proto'])),
+    }
+
+
+def jumlah_irisan(a, b):
+    """
+    |a ∩ b| untuk dua array int64 terurut unik, lewat merge linear
+    (sort stabil = timsort atas dua run terurut).
+    """
+    if len(a) == 0 or len(b) == 0:
+        return 0
+    gabung = np.concatenate((a, b))
+    gabung.sort(kind='stable')
+    return int(np.count_nonzero(gabung[1:] == gabung[:-1]))
+
+
+def churn(lama, baru):
+    """Lahir, mati, bertahan, Jaccard antara dua himpunan terurut."""
+    sama = jumlah_irisan(lama, baru)
+    gabungan = len(lama) + len(baru) - sama
+    return {
+        'jumlah': len(baru),
+        'lahir': len(baru) - sama,
+        'mati': len(lama) - sama,
+        'bertahan': sama,
+        'jaccard': sama / gabungan if gabungan else 1.0,
+    }
+
+
+# --- FUNGSI UTAMA STREAMING ---
+def hitung_churn(files, verbose=True):
+    """
+    Satu lintasan berurutan atas files. Mengembalikan list dict per (file, graf).
+    Graf yang tidak muncul di sebuah file dianggap kosong di jam itu.
+    """
+    sebelumnya = {}   # graf -> himpunan jam sebelumnya
+    dikenal = set()   # graf yang sudah pernah muncul (baris tetap dibuat saat kosong)
+    hasil = []
+    if pipeline_baca.prefetch_aktif():
+        sumber = pipeline_baca.prefetch(files)
+    else:
+        sumber = ((fname, None) for fname in files)
+    for jam, (fname, isi) in enumerate(sumber):
+        per_graf = baca_file_array(fname, jam, verbose=verbose, isi=isi)
+        with metrik.fase('churn'):
+            sekarang = {w: himpunan_jam(arr) for w, arr in per_graf.items() if len(arr['src'])}
+            for w in sorted(set(sekarang) | dikenal):
+                baru = sekarang.get(w) or {j: _KOSONG for j in JENIS}
+                lama = sebelumnya.get(w) or {j: _KOSONG for j in JENIS}
+                baris = {'jam': jam, 'file': os.path.basename(fname), 'graf': w,
+                         'pertama': w not in dikenal}
+                for j in JENIS:
+                    baris[j] = churn(lama[j], baru[j])
+                hasil.append(baris)
+            # Hanya jam terakhir yang disimpan (memori = satu jam per graf)
+            sebelumnya = sekarang
+            dikenal.update(sekarang)
+    return hasil
+
+
+def main(path):
+    print(f"\n{'='*100}")
+    print(f"{'CHURN EDGE / NODE / PORT ANTAR FILE BERURUTAN':^100}")
+    print(f"{'='*100}")
+
+    print(f'\n# Memulai SCAN di folder: {path}')
+    # Deret waktu: setiap file = satu jam, jadi file kembar (mis. hari kosong) tidak di-dedup
+    files = urut_natural(daftar_file_edges(path, dedup=False))
+    if not files:
+        print("\n[!] Folder KOSONG atau path salah.\n")
+        return
+    print(f'# {len(files)} file, urutan: {os.path.basename(files[0])} ... {os.path.basename(files[-1])}')
+
+    hasil = hitung_churn(files)
+    if not hasil:
+        print("\n[!] Tidak ada graf yang ditemukan.")
+        return
+
+    print(f"\n{'Jam':>4} {'Graph':<8} {'Edge':>8} {'+Lahir':>8} {'-Mati':>8} {'Jacc':>6}  "
+          f"{'Node':>7} {'+':>6} {'-':>6} {'Jacc':>6}  {'Port':>6} {'+':>5} {'-':>5} {'Jacc':>6}")
+    print('-' * 100)
+    for b in hasil:
+        e, n, p = b['edge'], b['node'], b['port']
+        jacc = (lambda c: '   -  ' if b['pertama'] else f"{c['jaccard']:>6.3f}")
+        print(f"{b['jam']:>4} {b['graf']:<8} {e['jumlah']:>8} {e['lahir']:>8} {e['mati']:>8} {jacc(e)}  "
+              f"{n['jumlah']:>7} {n['lahir']:>6} {n['mati']:>6} {jacc(n)}  "
+              f"{p['jumlah']:>6} {p['lahir']:>5} {p['mati']:>5} {jacc(p)}")
+
+    # Ringkasan per graf (tanpa jam pertama, karena semua masih 'lahir')
+    print('\n# Rata-rata per transisi (tanpa file pertama graf):')
+    for w in sorted({b['graf'] for b in hasil}):
+        seri = [b for b in hasil if b['graf'] == w and not b['pertama']]
+        if not seri:
+            continue
+        ringkas = ', '.join(
+            f"{j}: Jaccard={np.mean([b[j]['jaccard'] for b in seri]):.3f} "
+            f"bertahan={np.mean([b[j]['bertahan'] for b in seri]):.0f}" for j in JENIS)
+        print(f"   {w} ({len(seri)} transisi) {ringkas}")
+
+    # --- SIMPAN KE CSV ---
+    output_csv = "churn_edge.csv"
+    header = ['Jam', 'File', 'Graph ID']
+    for j in JENIS:
+        header += [f"{j.capitalize()} {k}" for k in ('Jumlah', 'Lahir', 'Mati', 'Bertahan', 'Jaccard')]
+    try:
+        with metrik.fase('tulis_csv'), open(output_csv, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(header)
+            for b in hasil:
+                row = [b['jam'], b['file'], b['graf']]
+                for j in JENIS:
+                    c = b[j]
+                    row += [c['jumlah'], c['lahir'], c['mati'], c['bertahan'], f"{c['jaccard']:.6f}"]
+                writer.writerow(row)
+        print(f"\n[SUKSES] Time series churn disimpan di: {output_csv}\n")
+    except Exception as e:
+        print(f"\n[ERROR] Gagal menyimpan CSV: {e}")
+
+
+if __name__ == '__main__':
+    sys.argv = pipeline_baca.dari_argv(dedup_file.dari_argv(indeks_graf.dari_argv(metrik.dari_argv(sys.argv))))
+    if len(sys.argv) < 2:
+        print("Usage: python churn_edge.py <folder_name> [--graph <id>] [--containment[=tandai|lewati]] [--prefetch=N] "
+              "[--metrik[=file.json]] [--profile[=file.prof]]")
+        sys.exit(1)
+
+    path = sys.argv[1]
+    if not os.path.exists(path):
+        print(f"[ERROR] Folder '{path}' tidak ditemukan!")
+        sys.exit(1)
+
+    main(path)
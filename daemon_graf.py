@@ -0,0 +1,230 @@
+#!/usr/bin/python
+
+# Daemon query graf: folder edge dibaca SEKALI lewat read_graphs.py, lalu
+# disimpan di memori dan dilayani lewat HTTP lokal (127.0.0.1) dengan respons JSON.
+# Setiap request ditangani thread sendiri (ThreadingHTTPServer); data hanya
+# dibaca setelah dimuat sehingga banyak pembaca bisa berjalan bersamaan.
+#
+# Endpoint (GET):
+#   /status                                   -> info data yang dimuat
+#   /graf                                     -> daftar graf + jumlah simpul/edge
+#   /tetangga?graf=g21&node=5                 -> tetangga (undirected + out/in)
+#   /derajat?graf=g21&node=5                  -> derajat undirected, in, out
+#   /port?graf=g21&node=5                     -> port yang dilayani / dipakai simpul
+#   /subgraf?graf=g21&nodes=1,2,3             -> edge berarah induced subgraph
+#
+# Contoh:
+#
+# python daemon_graf.py dir_g21_small_workload_with_gt/dir_no_packets_etc 8765
+# python daemon_graf.py data_graf 8765 --graph g15       # hanya satu workload di memori
+# curl 'http://127.0.0.1:8765/tetangga?graf=g21&node=5'
+
+import sys
+import os
+import json
+import time
+from collections import defaultdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+from read_graphs import read_edges_with_ports_to_stats_multiple_files
+import indeks_graf
+import dedup_file
+
+PORT_DEFAULT = 8765
+
+
+# --- FUNGSI MEMUAT DATA ---
+def muat_data(path):
+    """
+    Membaca folder lewat read_graphs.py lalu membuat indeks tambahan untuk query:
+    out/in adjacency berarah dan port per simpul (dari triple longevity).
+    """
+    graphs, stats, longev = read_edges_with_ports_to_stats_multiple_files(path)
+
+    out_adj, in_adj, port_srv, port_cli = {}, {}, {}, {}
+    for w, triples in longev.items():
+        o, i = defaultdict(set), defaultdict(set)
+        ps, pc = defaultdict(set), defaultdict(set)
+        for (v1, v2, port) in triples:
+            o[v1].add(v2)
+            i[v2].add(v1)
+            ps[v2].add(port)
+            pc[v1].add(port)
+        out_adj[w], in_adj[w], port_srv[w], port_cli[w] = o, i, ps, pc
+
+    ringkasan = []
+    for w, g in graphs.items():
+        ringkasan.append({'graf': w, 'simpul': len(g),
+                          'edge_berarah': sum(len(s) for s in out_adj[w].values()),
+                          'edge_port': len(longev[w])})
+    ringkasan.sort(key=lambda x: x['simpul'], reverse=True)
+
+    return {
+        'path': path,
+        'ringkasan': ringkasan,
+        'graphs': graphs,
+        'stats': stats,
+        'out': out_adj,
+        'in': in_adj,
+        'port_server': port_srv,
+        'port_client': port_cli,
+        'dimuat': time.strftime('%Y-%m-%d %H:%M:%S'),
+    }
+
+
+# --- FUNGSI QUERY ---
+class QueryError(Exception):
+    pass
+
+
+def _graf(data, q):
+    w = q.get('graf')
+    if w is None:
+        raise QueryError("parameter 'graf' wajib diisi")
+    if w not in data['graphs']:
+        raise QueryError(f"graf '{w}' tidak ditemukan")
+    return w
+
+
+def _node(data, w, q):
+    n = q.get('node')
+    if n is None:
+        raise QueryError("parameter 'node' wajib diisi")
+    if n not in data['graphs'][w]:
+        raise QueryError(f"node '{n}' tidak ada di graf '{w}'")
+    return n
+
+
+def q_status(data, q):
+    return {'path': data['path'], 'dimuat': data['dimuat'], 'jumlah_graf': len(data['graphs'])}
+
+
+def q_graf(data, q):
+    return {'graf': data['ringkasan']}
+
+
+def q_tetangga(data, q):
+    w = _graf(data, q)
+    n = _node(data, w, q)
+    nb = data['graphs'][w][n]
+    return {
+        'graf': w, 'node': n,
+        'tetangga': {v: c for v, c in sorted(nb.items(), key=lambda x: -x[1])},
+        'out': sorted(data['out'][w].get(n, ())),
+        'in': sorted(data['in'][w].get(n, ())),
+    }
+
+
+def q_derajat(data, q):
+    w = _graf(data, q)
+    n = _node(data, w, q)
+    return {
+        'graf': w, 'node': n,
+        'derajat': len(data['graphs'][w][n]),
+        'out_degree': len(data['out'][w].get(n, ())),
+        'in_degree': len(data['in'][w].get(n, ())),
+    }
+
+
+def q_port(data, q):
+    w = _graf(data, q)
+    n = _node(data, w, q)
+    return {
+        'graf': w, 'node': n,
+        'port_dilayani': sorted(data['port_server'][w].get(n, ())),
+        'port_dipakai': sorted(data['port_client'][w].get(n, ())),
+    }
+
+
+def q_subgraf(data, q):
+    w = _graf(data, q)
+    raw = q.get('nodes', '')
+    nodes = {x for x in raw.split(',') if x}
+    if not nodes:
+        raise QueryError("parameter 'nodes' (csv node id) wajib diisi")
+    out_w = data['out'][w]
+    edges = []
+    for u in nodes:
+        for v in out_w.get(u, ()):
+            if v in nodes:
+                edges.append([u, v])
+    edges.sort()
+    ada = sorted(n for n in nodes if n in data['graphs'][w])
+    return {'graf': w, 'simpul': ada, 'edges': edges}
+
+
+QUERY = {
+    '/status': q_status,
+    '/graf': q_graf,
+    '/tetangga': q_tetangga,
+    '/derajat': q_derajat,
+    '/port': q_port,
+    '/subgraf': q_subgraf,
+}
+
+
+# --- SERVER HTTP ---
+def buat_handler(data):
+    class Handler(BaseHTTPRequestHandler):
+        def _kirim(self, kode, isi):
+            body = json.dumps(isi).encode('utf-8')
+            self.send_response(kode)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            mulai = time.perf_counter()
+            url = urlparse(self.path)
+            fungsi = QUERY.get(url.path)
+            if fungsi is None:
+                self._kirim(404, {'error': f"endpoint tidak dikenal: {url.path}",
+                                  'endpoint': sorted(QUERY)})
+                return
+            q = {k: v[-1] for k, v in parse_qs(url.query).items()}
+            try:
+                isi = fungsi(data, q)
+                isi['ms'] = round((time.perf_counter() - mulai) * 1000, 3)
+                self._kirim(200, isi)
+            except QueryError as e:
+                self._kirim(400, {'error': str(e)})
+
+        def log_message(self, format, *args):
+            # Tidak mencetak log setiap request (terlalu ramai di terminal)
+            pass
+
+    return Handler
+
+
+def main(path, port=PORT_DEFAULT):
+    mulai = time.time()
+    data = muat_data(path)
+    print(f"\n# Data dimuat dalam {time.time() - mulai:.2f} detik ({len(data['graphs'])} graf).")
+
+    server = ThreadingHTTPServer(('127.0.0.1', port), buat_handler(data))
+    server.daemon_threads = True
+    print(f"# Daemon berjalan di http://127.0.0.1:{port}/  (Ctrl-C untuk berhenti)")
+    print(f"# Endpoint: {', '.join(sorted(QUERY))}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n[SELESAI] Daemon dihentikan.")
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    sys.argv = dedup_file.dari_argv(indeks_graf.dari_argv(sys.argv))
+    if len(sys.argv) < 2:
+        print("Usage: python daemon_graf.py <folder_name> [port] [--graph <id>] [--containment[=tandai|lewati]]")
+        sys.exit(1)
+
+    path = sys.argv[1]
+    if not os.path.exists(path):
+        print(f"[ERROR] Folder '{path}' tidak ditemukan!")
+        sys.exit(1)
+
+    port = int(sys.argv[2]) if len(sys.argv) > 2 else PORT_DEFAULT
+    main(path, port)
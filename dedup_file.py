@@ -0,0 +1,305 @@
+#!/usr/bin/python
+
+# Deteksi file edge yang berulang di lapisan pencarian file.
+#
+# 1. Duplikat persis: file dikelompokkan per ukuran dulu (gratis, dari stat),
+#    hanya file dengan ukuran kembar yang di-hash (blake2b isi file). File
+#    dengan hash sama dengan file sebelumnya (urutan daftar) dilewati, jadi
+#    scan folder induk (mis. data_graf/ + dir_g21.../ yang isinya sama)
+#    tidak menghitung byte yang sama dua kali. File kosong (0 byte) tidak
+#    pernah dianggap duplikat: tidak ada yang terhitung dua kali, sedangkan
+#    posisinya di daftar file tetap berarti (mis. jam kosong di churn_edge.py).
+# 2. Containment (opsional): README menyebut file di dir_no_packets_etc bisa
+#    overlap atau saling mengandung. Setiap file diringkas menjadi array
+#    terurut kunci token per graph id: (edge src<<32|dst, port/protokol,
+#    paket) untuk setiap token port; A terkandung di B jika semua kunci A ada
+#    di B (cek merge lewat searchsorted, tanpa set Python). Edge yang sama
+#    dengan port atau jumlah paket lain TIDAK terkandung, jadi mode 'lewati'
+#    tidak pernah membuang data port / paket yang hanya ada di file A.
+#    Mode 'tandai' hanya melaporkan, mode 'lewati' juga membuang file A.
+#    Catatan: melewati file terkandung mengubah hitungan longevity read_graphs.py
+#    (jumlah file tempat edge muncul), karena itu default-nya mati.
+#
+# Duplikat persis SELALU dilewati, jadi daftar file yang diproses (dan indeks
+# file / longevity per file) juga berubah bila ada file kembar. Pembaca yang
+# butuh posisi setiap file (deret waktu) memanggil
+# muat_edges.daftar_file_edges(path, dedup=False).
+#
+# Skrip yang memakai dedup_file.dari_argv() menerima flag:
+#   --containment[=tandai|lewati]
+#
+# Contoh:
+#
+# python dedup_file.py .                                    # laporan duplikat persis
+# python dedup_file.py dir_g21_small_workload_with_gt --containment
+# python muat_edges.py . --containment=lewati
+
+import sys
+import os
+import re
+import csv
+import gzip
+import hashlib
+import numpy as np
+from collections import defaultdict
+
+import metrik
+
+MODE_CONTAINMENT = ('tandai', 'lewati')
+UKURAN_BLOK = 8 << 20
+
+# Kolom graph id, client, server, blob port dari setiap baris (di-parse per file dalam C)
+_POLA_EDGE = re.compile(rb'^([^\s#]\S*)[ \t]+(\d+)[ \t]+(\d+)[ \t]+(\S+)', re.MULTILINE)
+# Token port valid dalam blob (aturan muat_edges.POLA_TOKEN): port, protokol, paket
+_POLA_TOKEN = re.compile(rb'(?:^|,)(\d+)p(\d+)(?:-(\d+))?(?=,|$)')
+
+_containment = None   # None, 'tandai', atau 'lewati'
+_hash = {}            # (path, ukuran, mtime_ns) -> hex digest
+
+
+# --- FUNGSI BANTU ---
+def atur_containment(mode):
+    """Aktifkan cek containment ('tandai' / 'lewati'), None = mati."""
+    global _containment
+    if mode is not None and mode not in MODE_CONTAINMENT:
+        raise ValueError(f"mode containment harus salah satu dari {MODE_CONTAINMENT}")
+    _containment = mode
+
+
+def mode_containment():
+    return _containment
+
+
+def hash_file(filepath):
+    """blake2b isi file (byte mentah), disimpan di memori per (path, ukuran, mtime)."""
+    st = os.stat(filepath)
+    kunci = (os.path.abspath(filepath), st.st_size, st.st_mtime_ns)
+    hasil = _hash.get(kunci)
+    if hasil is None:
+        with open(filepath, 'rb') as f, metrik.fase('hash_file'):
+            hasil = _hash[kunci] = hashlib.file_digest(f, lambda: hashlib.blake2b(digest_size=16)).hexdigest()
+        metrik.tambah('file_di_hash')
+    return hasil
+
+
+def kunci_file(filepath):
+    """
+    Ringkasan token satu file: dict graph id -> array terurut unik kunci token
+    (edge src<<32|dst, port<<8|protokol, paket) sebagai baris void 24 byte,
+    sehingga bisa diurutkan dan dicari seperti array 1 dimensi. Baris tanpa
+    token port yang valid (tidak dibaca pembaca mana pun) tidak ikut.
+    """
+    from muat_edges import kunci_edge, kunci_port, BATAS_NODE
+
+    fopen = gzip.open(filepath, 'rb') if filepath.endswith('.gz') else open(filepath, 'rb')
+    per_graf = defaultdict(lambda: ([], [], [], [], []))
+    with fopen, metrik.fase('kunci_containment'):
+        while True:
+            blok = fopen.read(UKURAN_BLOK)
+            if not blok:
+                break
+            # Lengkapi baris terakhir yang terpotong blok
+            blok += fopen.readline()
+            for g, s, d, blob in _POLA_EDGE.findall(blok):
+                kolom = per_graf[g]
+                for port, proto, paket in _POLA_TOKEN.findall(blob):
+                    kolom[0].append(s)
+                    kolom[1].append(d)
+                    kolom[2].append(port)
+                    kolom[3].append(proto)
+                    kolom[4].append(paket or b'0')
+
+        hasil = {}
+        for g, (s, d, port, proto, paket) in per_graf.items():
+            src = np.array(s, dtype=np.int64)
+            dst = np.array(d, dtype=np.int64)
+            ok = (src < BATAS_NODE) & (dst < BATAS_NODE)
+            baris = np.stack((kunci_edge(src[ok], dst[ok]),
+                              kunci_port(np.array(port, dtype=np.int64)[ok], np.array(proto, dtype=np.int64)[ok]),
+                              np.array(paket, dtype=np.int64)[ok]), axis=1)
+            hasil[g.decode('utf-8', 'ignore')] = np.unique(_sebagai_void(baris))
+    return hasil
+
+
+def _sebagai_void(baris):
+    """Array (n, 3) int64 -> array 1 dimensi void 24 byte (satu elemen per baris)."""
+    baris = np.ascontiguousarray(baris, dtype=np.int64)
+    return baris.view(np.dtype((np.void, baris.shape[1] * 8))).ravel()
+
+
+def terkandung(a, b):
+    """True jika semua kunci array terurut a ada di array terurut b."""
+    if len(a) > len(b):
+        return False
+    if len(a) == 0:
+        return True
+    pos = np.searchsorted(b, a)
+    pos[pos == len(b)] = len(b) - 1
+    return bool(np.all(b[pos] == a))
+
+
+def _kunci_terkandung(ka, kb):
+    return all(g in kb and terkandung(k, kb[g]) for g, k in ka.items())
+
+
+# --- FUNGSI DETEKSI ---
+def cari_duplikat(files):
+    """
+    Mengembalikan dict file -> file asli (muncul lebih dulu di daftar) untuk
+    file yang isinya persis sama. Hanya file dengan ukuran kembar yang di-hash;
+    file kosong tidak ikut dikelompokkan.
+    """
+    per_ukuran = defaultdict(list)
+    for f in files:
+        try:
+            ukuran = os.path.getsize(f)
+        except OSError:
+            continue
+        if ukuran > 0:
+            per_ukuran[ukuran].append(f)
+
+    duplikat = {}
+    for kelompok in per_ukuran.values():
+        if len(kelompok) < 2:
+            continue
+        asli = {}
+        for f in kelompok:
+            try:
+                h = hash_file(f)
+            except OSError:
+                continue
+            if h in asli:
+                duplikat[f] = asli[h]
+            else:
+                asli[h] = f
+    return duplikat
+
+
+def cari_containment(files):
+    """
+    Mengembalikan dict file -> file lain yang mengandung semua token
+    (edge, port, paket)-nya (file diperiksa dari yang paling sedikit token).
+    """
+    ringkas = {}
+    for f in files:
+        try:
+            ringkas[f] = kunci_file(f)
+        except OSError:
+            continue
+
+    urutan = {f: i for i, f in enumerate(files)}
+    ukuran = {f: sum(len(k) for k in kg.values()) for f, kg in ringkas.items()}
+    # Ukuran sama: file yang lebih akhir di daftar diperiksa lebih dulu,
+    # jadi dari dua file dengan token identik yang ditandai adalah yang lebih akhir
+    daftar = sorted(ringkas, key=lambda f: (ukuran[f], -urutan[f]))
+
+    hasil = {}
+    for i, a in enumerate(daftar):
+        if ukuran[a] == 0:
+            continue
+        for b in daftar[i + 1:]:
+            if _kunci_terkandung(ringkas[a], ringkas[b]):
+                hasil[a] = b
+                break
+    return hasil
+
+
+def saring_file(files, verbose=True):
+    """
+    Lapisan dedup untuk daftar file edge: duplikat persis selalu dibuang,
+    file terkandung ditandai / dibuang sesuai mode containment.
+    """
+    files = list(files)
+    duplikat = cari_duplikat(files)
+    if duplikat:
+        metrik.tambah('file_duplikat', len(duplikat))
+        if verbose:
+            print(f"# Dedup: {len(duplikat)} file berisi sama persis dengan file lain, dilewati.")
+        files = [f for f in files if f not in duplikat]
+
+    if _containment is not None:
+        kandung = cari_containment(files)
+        if verbose:
+            for a, b in kandung.items():
+                print(f"   [!] Semua edge + port {a} ada di {b}")
+        metrik.tambah('file_terkandung', len(kandung))
+        if _containment == 'lewati' and kandung:
+            if verbose:
+                print(f"# Dedup: {len(kandung)} file terkandung di file lain, dilewati.")
+            files = [f for f in files if f not in kandung]
+    return files
+
+
+# --- FLAG COMMAND LINE ---
+def dari_argv(argv):
+    """Membuang '--containment[=tandai|lewati]' dari argv dan mengaktifkannya."""
+    sisa = []
+    for arg in argv:
+        if arg == '--containment' or arg.startswith('--containment='):
+            mode = arg.partition('=')[2] or 'tandai'
+            if mode not in MODE_CONTAINMENT:
+                print(f"[ERROR] Mode containment '{mode}' tidak dikenal (pilihan: {', '.join(MODE_CONTAINMENT)})")
+                sys.exit(1)
+            atur_containment(mode)
+        else:
+            sisa.append(arg)
+    return sisa
+
+
+# --- FUNGSI UTAMA ---
+def main(path):
+    from muat_edges import FILTER_METADATA
+
+    files = []
+    for root, dirs, fs in os.walk(path):
+        dirs.sort()
+        for file in sorted(fs):
+            if not file.startswith(FILTER_METADATA):
+                files.append(os.path.join(root, file))
+
+    print(f"\n# Dedup {len(files)} file di: {path}")
+    duplikat = cari_duplikat(files)
+    sisa = [f for f in files if f not in duplikat]
+    kandung = cari_containment(sisa) if _containment is not None else {}
+
+    baris = []
+    for f in files:
+        if f in duplikat:
+            status, acuan = 'duplikat', duplikat[f]
+        elif f in kandung:
+            status, acuan = 'terkandung', kandung[f]
+        else:
+            status, acuan = 'unik', ''
+        baris.append([f, status, acuan, os.path.getsize(f)])
+
+    byte_dup = sum(b[3] for b in baris if b[1] == 'duplikat')
+    print(f"# {len(duplikat)} duplikat persis ({byte_dup / 1024 ** 2:.1f} MB tidak perlu dibaca), "
+          f"{len(kandung)} file terkandung di file lain"
+          + ("" if _containment is not None else " (cek dengan --containment)"))
+    for f, status, acuan, _ in baris:
+        if status != 'unik':
+            print(f"   [{status.upper()}] {f}\n      -> {acuan}")
+
+    output_csv = 'dedup_file.csv'
+    try:
+        with metrik.fase('tulis_csv'), open(output_csv, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(['File', 'Status', 'Sama Dengan / Terkandung Di', 'Ukuran (byte)'])
+            writer.writerows(baris)
+        print(f"\n[SUKSES] Laporan disimpan di: {output_csv}")
+    except Exception as e:
+        print(f"\n[ERROR] Gagal menyimpan CSV: {e}")
+
+
+if __name__ == '__main__':
+    sys.argv = dari_argv(sys.argv)
+    if len(sys.argv) < 2:
+        print("Usage: python dedup_file.py <folder_name> [--containment]")
+        sys.exit(1)
+
+    path = sys.argv[1]
+    if not os.path.exists(path):
+        print(f"[ERROR] Folder '{path}' tidak ditemukan!")
+        sys.exit(1)
+
+    main(path)
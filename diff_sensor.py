@@ -0,0 +1,247 @@
+#!/usr/bin/python
+
+# Diff cakupan sensor antara dua graf yang sama, mis. g21 dengan 49 sensor
+# (edges_*_all_49sensors) vs. sedikit sensor (dir_few_sensors/, *_partial_sensors).
+#
+# A dan B masing-masing dibaca ke array (muat_edges.py), lalu diringkas jadi
+# array int64 terurut unik: kunci edge (src<<32|dst), node id, dan kunci port.
+# Keanggotaan edge/node/port di A saja, B saja, atau keduanya dihitung dengan
+# satu merge linear (muat_edges.tanda_irisan), bukan set Python.
+#
+# Cakupan per node: untuk setiap node A, berapa bagian edge berarah A yang
+# menyentuh node itu juga teramati di B (bincount atas mask edge).
+#
+# Simulasi sensor (greedy): model sensor di node v melihat semua edge yang
+# menyentuh v. Dari graf A dipilih k node satu per satu yang menambah edge
+# tertutup paling banyak. Gain setiap node disimpan di array dan hanya dikurangi
+# untuk edge yang baru tertutup (lewat adjacency CSR); node terbaik diambil dari
+# heap lazy, jadi seluruh kurva k = 1..semua node dihitung dalam O((E + N) log N).
+#
+# Output:
+#   diff_sensor_<id>.csv     ringkasan edge/node/port A saja, B saja, keduanya
+#   cakupan_node_<id>.csv    derajat di A dan B, cakupan edge per node
+#   greedy_sensor_<id>.csv   urutan sensor greedy dan cakupan kumulatif
+#
+# Contoh:
+#
+# python diff_sensor.py dir_g21_small_workload_with_gt/dir_no_packets_etc/edges_4days_feb10thruFeb13_all_49sensors.csv.txt dir_g21_small_workload_with_gt/dir_no_packets_etc/dir_few_sensors/edges_6days_tillFeb9_partial_sensors.csv.txt
+
+import sys
+import os
+import re
+import csv
+import heapq
+import numpy as np
+
+from muat_edges import baca_folder_array, kunci_edge, kunci_port, tanda_irisan
+import metrik
+
+JENIS = ('edge', 'node', 'port')
+
+
+# --- FUNGSI RINGKASAN ---
+def ringkas_graf(arr):
+    """Array terurut unik edge, node, port (dan src/dst edge unik) satu graf."""
+    ekey = np.unique(kunci_edge(arr['src'], arr['dst']))
+    return {
+        'edge': ekey,
+        'node': np.unique(np.concatenate((arr['src'], arr['dst']))),
+        'port': np.unique(kunci_port(arr['port'], arr['proto'])),
+        'e_src': ekey >> 32,
+        'e_dst': ekey & 0xFFFFFFFF,
+    }
+
+
+def diff_graf(ra, rb):
+    """Jumlah A saja / B saja / keduanya per jenis, plus mask keanggotaan."""
+    hasil, mask = {}, {}
+    for j in JENIS:
+        ma, mb = tanda_irisan(ra[j], rb[j])
+        sama = int(ma.sum())
+        hasil[j] = {'a': len(ra[j]), 'b': len(rb[j]), 'hanya_a': len(ra[j]) - sama,
+                    'hanya_b': len(rb[j]) - sama, 'keduanya': sama,
+                    'cakupan': sama / len(ra[j]) if len(ra[j]) else 0.0}
+        mask[j] = (ma, mb)
+    return hasil, mask
+
+
+def cakupan_node(ra, rb, mask_edge_a):
+    """
+    Per node A: derajat (edge berarah unik, masuk + keluar) di A, di B,
+    edge A yang teramati di B, rasio cakupan, dan apakah node teramati di B.
+    """
+    nodes = ra['node']
+    n = len(nodes)
+    u = np.searchsorted(nodes, ra['e_src'])
+    v = np.searchsorted(nodes, ra['e_dst'])
+    loop = u == v
+    # Self-loop dihitung sekali per node
+    deg_a = np.bincount(u, minlength=n) + np.bincount(v[~loop], minlength=n)
+    lihat = mask_edge_a.astype(np.int64)
+    deg_lihat = np.bincount(u, weights=lihat, minlength=n) + \
+        np.bincount(v[~loop], weights=lihat[~loop], minlength=n)
+
+    deg_b = np.zeros(n, dtype=np.int64)
+    ada_b = tanda_irisan(nodes, rb['node'])[0]
+    bu = np.searchsorted(nodes, rb['e_src'])
+    bv = np.searchsorted(nodes, rb['e_dst'])
+    # Edge B yang node-nya tidak ada di A tidak ikut dihitung
+    ok_u = (bu < n) & (nodes[np.minimum(bu, n - 1)] == rb['e_src'])
+    ok_v = (bv < n) & (nodes[np.minimum(bv, n - 1)] == rb['e_dst']) & (rb['e_src'] != rb['e_dst'])
+    deg_b += np.bincount(bu[ok_u], minlength=n) + np.bincount(bv[ok_v], minlength=n)
+
+    rasio = np.divide(deg_lihat, deg_a, out=np.zeros(n), where=deg_a > 0)
+    return {'node': nodes, 'deg_a': deg_a, 'deg_b': deg_b,
+            'deg_lihat': deg_lihat.astype(np.int64), 'cakupan': rasio, 'ada_b': ada_b}
+
+
+# --- SIMULASI SENSOR ---
+def greedy_sensor(ra, k=None):
+    """
+    Memilih sensor (node A) secara greedy untuk memaksimalkan edge berarah A
+    yang tertutup. Mengembalikan (urutan node, edge tertutup kumulatif).
+    """
+    nodes = ra['node']
+    n, m = len(nodes), len(ra['edge'])
+    k = n if k is None else min(k, n)
+    u = np.searchsorted(nodes, ra['e_src'])
+    v = np.searchsorted(nodes, ra['e_dst'])
+
+    # CSR node -> edge yang menyentuh node (self-loop sekali)
+    loop = u == v
+    ujung = np.concatenate((u, v[~loop]))
+    edge_id = np.concatenate((np.arange(m), np.flatnonzero(~loop)))
+    urut = np.argsort(ujung, kind='stable')
+    edge_id = edge_id[urut]
+    offset = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(ujung, minlength=n), out=offset[1:])
+
+    gain = np.bincount(ujung, minlength=n).astype(np.int64)
+    # Lazy greedy: gain hanya bisa turun, jadi entri heap yang basi cukup
+    # didorong ulang dengan gain terbaru saat muncul di puncak
+    heap = [(-int(g), i) for i, g in enumerate(gain.tolist())]
+    heapq.heapify(heap)
+    tertutup = np.zeros(m, dtype=bool)
+    dipilih, kumulatif, total = [], [], 0
+    while heap and len(dipilih) < k:
+        g, s = heapq.heappop(heap)
+        if -g != gain[s]:
+            heapq.heappush(heap, (-int(gain[s]), s))
+            continue
+        if gain[s] <= 0:
+            break
+        e = edge_id[offset[s]:offset[s + 1]]
+        baru = e[~tertutup[e]]
+        tertutup[baru] = True
+        total += len(baru)
+        # Edge baru tertutup tidak lagi menambah gain kedua ujungnya
+        np.subtract.at(gain, u[baru], 1)
+        lain = v[baru][~loop[baru]]
+        np.subtract.at(gain, lain, 1)
+        dipilih.append(int(nodes[s]))
+        kumulatif.append(total)
+    return dipilih, kumulatif
+
+
+# --- FUNGSI UTAMA ---
+def _pilih_graf(data_a, data_b, graph_id):
+    if graph_id is not None:
+        return graph_id if graph_id in data_a and graph_id in data_b else None
+    bersama = set(data_a) & set(data_b)
+    if not bersama:
+        return None
+    return max(bersama, key=lambda w: len(data_a[w]['src']))
+
+
+def main(path_a, path_b, graph_id=None, k=None):
+    print(f"\n{'='*80}")
+    print(f"{'DIFF CAKUPAN SENSOR: A (LENGKAP) vs B (SEBAGIAN)':^80}")
+    print(f"{'='*80}")
+
+    data_a, _ = baca_folder_array(path_a)
+    data_b, _ = baca_folder_array(path_b)
+    w = _pilih_graf(data_a, data_b, graph_id)
+    if w is None:
+        print(f"\n[!] Tidak ada graf yang sama di A dan B{f' untuk {graph_id}' if graph_id else ''}.")
+        return
+
+    with metrik.fase('analisis'):
+        ra, rb = ringkas_graf(data_a[w]), ringkas_graf(data_b[w])
+        hasil, mask = diff_graf(ra, rb)
+        cak = cakupan_node(ra, rb, mask['edge'][0])
+        urutan, kumulatif = greedy_sensor(ra, k)
+
+    print(f"\n# Graph={w}")
+    print(f"{'Jenis':<6} {'A':>8} {'B':>8} {'Hanya A':>9} {'Hanya B':>9} {'Keduanya':>9} {'Cakupan B':>10}")
+    print('-' * 64)
+    for j in JENIS:
+        h = hasil[j]
+        print(f"{j:<6} {h['a']:>8} {h['b']:>8} {h['hanya_a']:>9} {h['hanya_b']:>9} "
+              f"{h['keduanya']:>9} {h['cakupan']:>9.1%}")
+
+    teramati = hasil['edge']['keduanya']
+    m = len(ra['edge'])
+    print(f"\n# Node A teramati di B: {int(cak['ada_b'].sum())} dari {len(cak['node'])}, "
+          f"median cakupan edge per node = {np.median(cak['cakupan']):.1%}")
+    print(f"# Greedy sensor (model: sensor di v melihat semua edge yang menyentuh v), {m} edge berarah A:")
+    for target in (0.5, 0.8, 0.9, 0.99, 1.0):
+        idx = next((i for i, c in enumerate(kumulatif) if c >= target * m), None)
+        if idx is not None:
+            print(f"   {target:>5.0%} edge tertutup dengan {idx + 1} sensor")
+    idx_b = next((i for i, c in enumerate(kumulatif) if c >= teramati), None)
+    if idx_b is not None:
+        print(f"   Jumlah edge A yang teramati di B ({teramati}) sudah tercapai dengan {idx_b + 1} sensor greedy")
+
+    # --- SIMPAN KE CSV ---
+    clean_id = re.sub(r'[^\w\-_]', '', w) or "unknown_graph"
+    output_diff = f"diff_sensor_{clean_id}.csv"
+    output_node = f"cakupan_node_{clean_id}.csv"
+    output_greedy = f"greedy_sensor_{clean_id}.csv"
+    try:
+        with metrik.fase('tulis_csv'), open(output_diff, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(['Graph ID', 'Jenis', 'A', 'B', 'Hanya A', 'Hanya B', 'Keduanya', 'Cakupan B'])
+            for j in JENIS:
+                h = hasil[j]
+                writer.writerow([w, j, h['a'], h['b'], h['hanya_a'], h['hanya_b'], h['keduanya'],
+                                 f"{h['cakupan']:.6f}"])
+
+        with metrik.fase('tulis_csv'), open(output_node, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(['Node ID', 'Derajat A', 'Derajat B', 'Edge A Teramati di B',
+                             'Cakupan', 'Ada di B'])
+            urut = np.lexsort((cak['node'], -cak['deg_a']))
+            writer.writerows(zip(cak['node'][urut].tolist(), cak['deg_a'][urut].tolist(),
+                                 cak['deg_b'][urut].tolist(), cak['deg_lihat'][urut].tolist(),
+                                 [f"{x:.6f}" for x in cak['cakupan'][urut]],
+                                 cak['ada_b'][urut].astype(int).tolist()))
+
+        with metrik.fase('tulis_csv'), open(output_greedy, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(['K', 'Node Sensor', 'Edge Tertutup', 'Cakupan'])
+            for i, (node, c) in enumerate(zip(urutan, kumulatif), 1):
+                writer.writerow([i, node, c, f"{c / m:.6f}"])
+
+        print(f"\n[SUKSES] Ringkasan disimpan di: {output_diff}")
+        print(f"[SUKSES] Cakupan per node disimpan di: {output_node}")
+        print(f"[SUKSES] Kurva sensor greedy disimpan di: {output_greedy}\n")
+    except Exception as e:
+        print(f"\n[ERROR] Gagal menyimpan CSV: {e}")
+
+
+if __name__ == '__main__':
+    sys.argv = metrik.dari_argv(sys.argv)
+    if len(sys.argv) < 3:
+        print("Usage: python diff_sensor.py <file/folder A> <file/folder B> [graph_id] [k] "
+              "[--metrik[=file.json]] [--profile[=file.prof]]")
+        sys.exit(1)
+
+    path_a, path_b = sys.argv[1], sys.argv[2]
+    for p in (path_a, path_b):
+        if not os.path.exists(p):
+            print(f"[ERROR] Path '{p}' tidak ditemukan!")
+            sys.exit(1)
+
+    graph_id = sys.argv[3] if len(sys.argv) > 3 and sys.argv[3] != '-' else None
+    k = int(sys.argv[4]) if len(sys.argv) > 4 else None
+    main(path_a, path_b, graph_id, k)
@@ -2,9 +2,12 @@
 
 import sys
 import os
-import csv
+import numpy as np
 from collections import Counter
 
+from baris_edge import baris_file
+from ekspor_kolom import ekspor_tabel
+
 def get_node_degrees(filepath):
     """
     Membaca file dan mengembalikan Counter object berisi derajat setiap node.
@@ -27,26 +30,22 @@ def get_node_degrees(filepath):
     valid_lines = 0
 
     try:
-        with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-            for line in f:
-                if line.startswith('#'): continue
-                parts = line.split()
-                
-                if len(parts) < 4: continue
-                if not (parts[1].isdigit() and parts[2].isdigit()): continue
+        for parts in baris_file(filepath):
+            if len(parts) < 4: continue
+            if not (parts[1].isdigit() and parts[2].isdigit()): continue
 
-                if valid_lines == 0:
-                    graph_id = parts[0]
+            if valid_lines == 0:
+                graph_id = parts[0]
 
-                u, v = parts[1], parts[2]
-                port_info = parts[3]
+            u, v = parts[1], parts[2]
+            port_info = parts[3]
 
-                # Validasi edge dengan port
-                if 'p' in port_info:
-                    # Degree = In + Out (Undirected view for total connectivity)
-                    degrees[u] += 1
-                    degrees[v] += 1
-                    valid_lines += 1
+            # Validasi edge dengan port
+            if 'p' in port_info:
+                # Degree = In + Out (Undirected view for total connectivity)
+                degrees[u] += 1
+                degrees[v] += 1
+                valid_lines += 1
 
     except Exception as e:
         print(f"[ERROR] {filename}: {e}")
@@ -57,18 +56,20 @@ def get_node_degrees(filepath):
     return graph_id, degrees
 
 def save_distribution_csv(graph_id, sorted_nodes):
-    """Menyimpan seluruh distribusi ke CSV"""
+    """
+    Menyimpan seluruh distribusi ke CSV + kolom biner (kolom_distribusi_<id>/).
+    Mengembalikan (status, nama file) -- status 'ditulis' / 'dilewati' / 'id_tidak_valid'.
+    """
     if not graph_id: graph_id = "unknown"
-    filename = f"distribusi_{graph_id}.csv"
+    kolom = {
+        'Rank': np.arange(1, len(sorted_nodes) + 1, dtype=np.int64),
+        'Node ID': np.array([int(node) for node, _ in sorted_nodes], dtype=np.int64),
+        'Degree': np.array([deg for _, deg in sorted_nodes], dtype=np.int64),
+    }
     try:
-        with open(filename, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow(['Rank', 'Node ID', 'Degree'])
-            for rank, (node, deg) in enumerate(sorted_nodes, 1):
-                writer.writerow([rank, node, deg])
-        return filename
-    except:
-        return None
+        return ekspor_tabel('distribusi', graph_id, list(kolom), kolom)
+    except Exception:
+        return 'gagal', None
 
 def main(path):
     print(f"\n{'='*80}")
@@ -80,6 +81,7 @@ def main(path):
         return
 
     # Scan Folder
+    tabel_per_graf = {}
     for root, dirs, files in os.walk(path):
         for file in files:
             full_path = os.path.join(root, file)
@@ -139,13 +141,21 @@ def main(path):
                     limit += 1
                 print("\n")
 
-                # --- BAGIAN 3: SIMPAN CSV ---
-                saved_file = save_distribution_csv(g_id, sorted_nodes)
-                if saved_file:
-                    print(f"[INFO] Data lengkap {total_nodes} node disimpan ke: {saved_file}")
-                
+                # Tabel disimpan setelah semua file dibaca (satu graf bisa tersebar
+                # di banyak file; tabel file terakhir per graf yang diekspor)
+                tabel_per_graf[g_id] = sorted_nodes
                 print("="*80)
 
+    # --- BAGIAN 3: SIMPAN CSV, sekali per graf ---
+    for g_id, sorted_nodes in tabel_per_graf.items():
+        status, saved_file = save_distribution_csv(g_id, sorted_nodes)
+        if status == 'ditulis':
+            print(f"[INFO] Data lengkap {len(sorted_nodes)} node disimpan ke: {saved_file}")
+        elif status == 'dilewati':
+            print(f"[INFO] {saved_file} tidak berubah, penulisan dilewati.")
+        elif status == 'id_tidak_valid':
+            print(f"[SKIP] Graph ID {g_id!r} tidak valid, distribusi tidak diekspor.")
+
 if __name__ == '__main__':
     if len(sys.argv) < 2:
         print("Usage: python distribusi_derajat.py <folder_name>")
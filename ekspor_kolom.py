@@ -0,0 +1,155 @@
+#!/usr/bin/python
+
+# Lapisan ekspor massal untuk tabel per simpul (derajat, distribusi, ...).
+#
+# Setiap tabel adalah dict kolom -> array numpy yang sama panjang, ditulis sekaligus:
+#   - kolom_<nama>_<id>/<kolom>.npy  : array biner per kolom, bisa dibuka dengan
+#                                      np.load(..., mmap_mode='r') tanpa parsing
+#   - kolom_<nama>_<id>/meta.json    : daftar kolom, dtype, jumlah baris, hash isi
+#   - <nama>_<id>.parquet            : hanya jika pyarrow terpasang
+#   - <nama>_<id>.csv                : untuk Excel, ditulis sekali dengan writerows
+#                                      (buffer besar, bukan DictWriter per baris)
+# Jika hash isi tabel sama dengan meta.json dari run sebelumnya dan semua file
+# output masih ada, penulisan dilewati.
+#
+# Graph ID yang bukan ID valid (sampah dari file biner / .gz yang terbaca
+# sebagai teks, mis. 'ǔzsY') tidak dipakai sebagai nama file: tabelnya tidak diekspor.
+#
+# Contoh (membaca kembali):
+#
+# python ekspor_kolom.py kolom_stats_e1
+
+import sys
+import os
+import csv
+import re
+import json
+import hashlib
+import numpy as np
+
+from muat_edges import id_graf_valid
+import metrik
+
+# Parquet opsional
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+UKURAN_BUFFER = 1 << 20
+
+
+# --- FUNGSI BANTU ---
+def nama_aman(graph_id):
+    """Graph ID untuk nama file, atau None jika ID tidak valid (hanya ASCII huruf/angka/_/-)."""
+    return graph_id if id_graf_valid(graph_id) else None
+
+
+def file_kolom(folder, k):
+    """Nama file .npy untuk satu kolom (spasi dan karakter lain diganti '_')."""
+    return os.path.join(folder, re.sub(r'[^A-Za-z0-9_\-]', '_', k) + '.npy')
+
+
+def hash_tabel(header, kolom):
+    h = hashlib.blake2b(digest_size=16)
+    h.update('\x1f'.join(header).encode('utf-8'))
+    for k in header:
+        a = np.ascontiguousarray(kolom[k])
+        h.update(str(a.dtype).encode('ascii'))
+        h.update(a.tobytes())
+    return h.hexdigest()
+
+
+def _baca_meta(folder):
+    try:
+        with open(os.path.join(folder, 'meta.json'), encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+# --- FUNGSI EKSPOR ---
+def tulis_csv_cepat(output_csv, header, kolom):
+    """CSV dari kolom array: satu writerows dengan buffer besar."""
+    with open(output_csv, 'w', newline='', encoding='utf-8', buffering=UKURAN_BUFFER) as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        writer.writerows(zip(*(kolom[k].tolist() for k in header)))
+
+
+def tulis_npy(folder, header, kolom, hash_isi):
+    os.makedirs(folder, exist_ok=True)
+    for k in header:
+        np.save(file_kolom(folder, k), np.ascontiguousarray(kolom[k]))
+    meta = {
+        'kolom': list(header),
+        'dtype': {k: str(kolom[k].dtype) for k in header},
+        'baris': int(len(kolom[header[0]])) if header else 0,
+        'hash': hash_isi,
+    }
+    # meta.json ditulis terakhir: jika proses terhenti, hash lama tidak cocok lagi
+    with open(os.path.join(folder, 'meta.json'), 'w', encoding='utf-8') as f:
+        json.dump(meta, f, indent=2)
+
+
+def tulis_parquet(output_parquet, header, kolom):
+    tabel = pa.table({k: kolom[k] for k in header})
+    pq.write_table(tabel, output_parquet)
+
+
+def ekspor_tabel(nama, graph_id, header, kolom, csv_juga=True):
+    """
+    Mengekspor satu tabel per simpul. Mengembalikan (status, file_csv) dengan status
+    'ditulis', 'dilewati' (isi tidak berubah), atau 'id_tidak_valid'.
+    """
+    aman = nama_aman(graph_id)
+    if aman is None:
+        return 'id_tidak_valid', None
+
+    folder = f"kolom_{nama}_{aman}"
+    output_csv = f"{nama}_{aman}.csv"
+    output_parquet = f"{nama}_{aman}.parquet"
+
+    with metrik.fase('ekspor_kolom'):
+        hash_isi = hash_tabel(header, kolom)
+        meta = _baca_meta(folder)
+        lengkap = (not csv_juga or os.path.exists(output_csv)) and \
+                  (pa is None or os.path.exists(output_parquet))
+        if meta is not None and meta.get('hash') == hash_isi and lengkap:
+            return 'dilewati', output_csv
+
+        tulis_npy(folder, header, kolom, hash_isi)
+        if pa is not None:
+            tulis_parquet(output_parquet, header, kolom)
+        if csv_juga:
+            with metrik.fase('tulis_csv'):
+                tulis_csv_cepat(output_csv, header, kolom)
+    return 'ditulis', output_csv
+
+
+def baca_tabel(folder, mmap=True):
+    """Membaca tabel kolom (hasil ekspor_tabel). Mengembalikan (meta, dict kolom -> array)."""
+    meta = _baca_meta(folder)
+    if meta is None:
+        raise FileNotFoundError(f"meta.json tidak ada di '{folder}'")
+    mode = 'r' if mmap else None
+    kolom = {k: np.load(file_kolom(folder, k), mmap_mode=mode) for k in meta['kolom']}
+    return meta, kolom
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        print("Usage: python ekspor_kolom.py <folder kolom_*>")
+        sys.exit(1)
+
+    folder = sys.argv[1]
+    if not os.path.isdir(folder):
+        print(f"[ERROR] Folder '{folder}' tidak ditemukan!")
+        sys.exit(1)
+
+    meta, kolom = baca_tabel(folder)
+    print(f"\n# {folder}: {meta['baris']} baris, kolom {meta['kolom']}")
+    print('  '.join(f"{k:>14}" for k in meta['kolom']))
+    for i in range(min(10, meta['baris'])):
+        print('  '.join(f"{kolom[k][i]:>14}" for k in meta['kolom']))
@@ -0,0 +1,291 @@
+#!/usr/bin/python
+
+# Ekstraksi subgraf terinduksi untuk himpunan simpul sembarang, langsung
+# dari file edge (format asli), dalam SATU lintasan untuk banyak himpunan.
+#
+# dir_no_packets_etc/ adalah g21 yang dipotong ke simpul ground truth; skrip
+# ini membuat potongan yang sama untuk himpunan lain: satu grup gt, k-core,
+# top-degree, dst. Input himpunan:
+#   - file daftar simpul (node id dipisah koma / spasi / baris baru)
+#     -> satu file = satu himpunan (gabungan semua baris), atau
+#   - file grouping seperti groupings.gt.txt (1 baris = 1 grup, csv node id)
+#     dengan --per-grup -> setiap baris = satu himpunan.
+#
+# Keanggotaan disimpan sebagai bitmap integer: array uint64 berukuran
+# (jumlah_kata, max_node_id + 1), bit j = simpul anggota himpunan j.
+# Setiap file dibaca per blok 8 MB, kolom src/dst di-parse dengan regex (C),
+# lalu mask = bitmap[src] & bitmap[dst] dihitung vektor untuk semua himpunan
+# sekaligus. Baris dengan mask != 0 dipecah per bit (unpackbits) dan ditulis
+# apa adanya ke file output himpunan tsb.
+#
+# Output: <folder_output>/<nama_himpunan>/<path relatif file input> (tanpa .gz),
+# plus ringkasan ekstrak_subgraf.csv di folder kerja.
+# --tanpa-paket mengganti jumlah paket dengan 1 (seperti dir_no_packets_etc,
+# mis. 1p6-22 -> 1p6-1), format baris tetap sama.
+#
+# Contoh:
+#
+# python ekstrak_subgraf.py dir_g21_small_workload_with_gt/dir_includes_packets_and_other_nodes \
+#     subgraf_gt dir_g21_small_workload_with_gt/groupings.gt.txt --graph g21 --tanpa-paket
+# python ekstrak_subgraf.py dir_g21_small_workload_with_gt/dir_includes_packets_and_other_nodes \
+#     subgraf_grup dir_g21_small_workload_with_gt/groupings.gt.txt --per-grup --graph g21
+
+import sys
+import os
+import re
+import csv
+import gzip
+import numpy as np
+
+from muat_edges import daftar_file_edges
+import metrik
+import indeks_graf
+import dedup_file
+
+UKURAN_BLOK = 8 << 20
+BATAS_FLUSH = 1 << 20    # buffer output per himpunan sebelum ditulis ke disk
+
+# Seluruh baris (dengan newline), graph id, client, server
+_POLA_BARIS = re.compile(rb'^(([^\s#]\S*)[ \t]+(\d+)[ \t]+(\d+)[^\n]*\n?)', re.MULTILINE)
+_POLA_PAKET = re.compile(rb'(\d+p\d+)-\d+')
+_POLA_NODE = re.compile(r'[,\s]+')
+
+_per_grup = False
+_tanpa_paket = False
+
+
+# --- FUNGSI MEMBACA HIMPUNAN SIMPUL ---
+def baca_himpunan(set_file, per_grup=False):
+    """
+    List (nama, array node id unik) dari satu file himpunan. per_grup=True:
+    setiap baris non-komentar = satu himpunan (nomor grup sama seperti read_gt).
+    """
+    nama = os.path.basename(set_file).split('.')[0] or 'himpunan'
+    grup, buang = [], 0
+    with open(set_file, 'r', encoding='utf-8', errors='ignore') as f:
+        for line in f:
+            line = line.strip()
+            if line == '' or line.startswith('#'):
+                continue
+            token = [t for t in _POLA_NODE.split(line) if t]
+            ids = [int(t) for t in token if t.isdigit()]
+            buang += len(token) - len(ids)
+            grup.append(ids)
+    if buang:
+        print(f"   [!] {set_file}: {buang} token bukan node id dilewati.")
+
+    if per_grup:
+        return [(f"{nama}_grup{i}", np.unique(np.array(ids, dtype=np.int64)))
+                for i, ids in enumerate(grup, 1)]
+    semua = [n for ids in grup for n in ids]
+    return [(nama, np.unique(np.array(semua, dtype=np.int64)))]
+
+
+def bitmap_anggota(himpunan):
+    """Bitmap uint64 (jumlah_kata, max_id + 1): bit j%64 di kata j//64 = anggota himpunan j."""
+    max_id = max((int(ids[-1]) for _, ids in himpunan if len(ids)), default=-1)
+    bitmap = np.zeros(((len(himpunan) + 63) // 64, max_id + 1), dtype=np.uint64)
+    for j, (_, ids) in enumerate(himpunan):
+        bitmap[j // 64, ids] |= np.uint64(1) << np.uint64(j % 64)
+    return bitmap
+
+
+def pasangan_himpunan(bitmap, src, dst):
+    """
+    (indeks_baris, indeks_himpunan) untuk setiap baris yang kedua ujungnya
+    anggota himpunan tsb, terurut per himpunan lalu per baris.
+    """
+    n_node = bitmap.shape[1]
+    ok = (src < n_node) & (dst < n_node)
+    s, d = np.where(ok, src, 0), np.where(ok, dst, 0)
+    daftar_baris, daftar_set = [], []
+    for w in range(bitmap.shape[0]):
+        mask = bitmap[w, s] & bitmap[w, d]
+        mask[~ok] = 0
+        baris = np.flatnonzero(mask)
+        if len(baris) == 0:
+            continue
+        bit = np.unpackbits(mask[baris].view(np.uint8).reshape(-1, 8), axis=1, bitorder='little')
+        if sys.byteorder == 'big':
+            bit = bit.reshape(-1, 8, 8)[:, ::-1].reshape(-1, 64)
+        r, b = np.nonzero(bit)
+        daftar_baris.append(baris[r])
+        daftar_set.append(b + 64 * w)
+    if not daftar_baris:
+        kosong = np.zeros(0, dtype=np.int64)
+        return kosong, kosong
+    baris, set_idx = np.concatenate(daftar_baris), np.concatenate(daftar_set)
+    urut = np.lexsort((baris, set_idx))
+    return baris[urut], set_idx[urut]
+
+
+def _path_output(folder_output, nama, base, fname):
+    rel = os.path.relpath(fname, base) if base != fname else os.path.basename(fname)
+    if rel.endswith('.gz'):
+        rel = rel[:-3]
+    return os.path.join(folder_output, nama, rel)
+
+
+# --- FUNGSI UTAMA STREAMING ---
+def ekstrak(files, base, himpunan, folder_output, tanpa_paket=False, verbose=True):
+    """
+    Satu lintasan atas files, menulis subgraf terinduksi setiap himpunan.
+    Mengembalikan dict nama -> {'baris', 'file', 'node_terlihat'}.
+    """
+    bitmap = bitmap_anggota(himpunan)
+    prefix = indeks_graf.prefix_graf()
+    prefix = tuple(p.encode('utf-8') for p in prefix) if prefix else None
+    ringkas = {nama: {'baris': 0, 'file': 0, 'node_terlihat': 0} for nama, _ in himpunan}
+    terlihat = np.zeros(bitmap.shape[1], dtype=bool)
+
+    for fname in files:
+        if verbose:
+            print(f"   -> Membaca {fname}...")
+        buffer = {}       # indeks himpunan -> list bytes
+        ukuran = {}
+        sudah_ditulis = set()
+
+        def flush(j):
+            path = _path_output(folder_output, himpunan[j][0], base, fname)
+            data = b''.join(buffer.pop(j))
+            ukuran.pop(j)
+            if tanpa_paket:
+                data = _POLA_PAKET.sub(rb'\1-1', data)
+            with metrik.fase('tulis_subgraf'):
+                if j not in sudah_ditulis:
+                    os.makedirs(os.path.dirname(path), exist_ok=True)
+                with open(path, 'ab' if j in sudah_ditulis else 'wb') as f:
+                    f.write(data)
+            sudah_ditulis.add(j)
+
+        try:
+            fopen = gzip.open(fname, 'rb') if fname.endswith('.gz') else open(fname, 'rb')
+            with fopen:
+                while True:
+                    blok = fopen.read(UKURAN_BLOK)
+                    if not blok:
+                        break
+                    # Lengkapi baris terakhir yang terpotong blok
+                    blok += fopen.readline()
+                    with metrik.fase('parse'):
+                        baris = _POLA_BARIS.findall(blok)
+                        if prefix is not None:
+                            baris = [b for b in baris if b[0].startswith(prefix)]
+                        if not baris:
+                            continue
+                        src = np.array([b[2] for b in baris]).astype(np.int64)
+                        dst = np.array([b[3] for b in baris]).astype(np.int64)
+                    metrik.tambah('baris', len(baris))
+
+                    with metrik.fase('saring_bitmap'):
+                        idx, set_idx = pasangan_himpunan(bitmap, src, dst)
+                        if len(idx):
+                            node = np.concatenate((src[idx], dst[idx]))
+                            terlihat[node] = True
+                    batas = np.flatnonzero(np.diff(set_idx)) + 1
+                    for bagian in np.split(np.arange(len(idx)), batas):
+                        if len(bagian) == 0:
+                            continue
+                        j = int(set_idx[bagian[0]])
+                        potong = [baris[i][0] for i in idx[bagian]]
+                        if not potong[-1].endswith(b'\n'):
+                            potong[-1] += b'\n'
+                        buffer.setdefault(j, []).extend(potong)
+                        ukuran[j] = ukuran.get(j, 0) + sum(map(len, potong))
+                        ringkas[himpunan[j][0]]['baris'] += len(potong)
+                        if ukuran[j] >= BATAS_FLUSH:
+                            flush(j)
+        except OSError as e:
+            print(f"   [ERROR] Gagal membaca {fname}: {e}")
+            continue
+
+        for j in list(buffer):
+            flush(j)
+        for j in sudah_ditulis:
+            ringkas[himpunan[j][0]]['file'] += 1
+
+    for nama, ids in himpunan:
+        ringkas[nama]['node_terlihat'] = int(terlihat[ids].sum()) if len(ids) else 0
+    return ringkas
+
+
+# --- FLAG COMMAND LINE ---
+def dari_argv(argv):
+    """Membuang '--per-grup' dan '--tanpa-paket' dari argv dan mengaktifkannya."""
+    global _per_grup, _tanpa_paket
+    sisa = []
+    for arg in argv:
+        if arg == '--per-grup':
+            _per_grup = True
+        elif arg == '--tanpa-paket':
+            _tanpa_paket = True
+        else:
+            sisa.append(arg)
+    return sisa
+
+
+def main(path, folder_output, set_files):
+    print(f"\n{'='*100}")
+    print(f"{'EKSTRAKSI SUBGRAF TERINDUKSI':^100}")
+    print(f"{'='*100}")
+
+    himpunan = []
+    for set_file in set_files:
+        himpunan.extend(baca_himpunan(set_file, per_grup=_per_grup))
+    himpunan = [(nama, ids) for nama, ids in himpunan if len(ids)]
+    if not himpunan:
+        print("\n[!] Tidak ada himpunan simpul yang valid.\n")
+        return
+    nama_kembar = len({nama for nama, _ in himpunan}) != len(himpunan)
+    if nama_kembar:
+        himpunan = [(f"{nama}_{j}", ids) for j, (nama, ids) in enumerate(himpunan, 1)]
+    print(f"# {len(himpunan)} himpunan simpul, total {sum(len(ids) for _, ids in himpunan)} anggota")
+
+    print(f'\n# Memulai SCAN di folder: {path}')
+    files = daftar_file_edges(path)
+    if not files:
+        print("\n[!] Folder KOSONG atau path salah.\n")
+        return
+
+    ringkas = ekstrak(files, path, himpunan, folder_output, tanpa_paket=_tanpa_paket)
+
+    print(f"\n{'Himpunan':<30} {'Node':>7} {'Terlihat':>9} {'Baris':>10} {'File':>5}")
+    print('-' * 65)
+    for nama, ids in himpunan:
+        r = ringkas[nama]
+        print(f"{nama:<30} {len(ids):>7} {r['node_terlihat']:>9} {r['baris']:>10} {r['file']:>5}")
+
+    # --- SIMPAN KE CSV ---
+    output_csv = "ekstrak_subgraf.csv"
+    try:
+        with metrik.fase('tulis_csv'), open(output_csv, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(['Himpunan', 'Jumlah Node', 'Node Terlihat', 'Baris Edge', 'File', 'Folder Output'])
+            for nama, ids in himpunan:
+                r = ringkas[nama]
+                writer.writerow([nama, len(ids), r['node_terlihat'], r['baris'], r['file'],
+                                 os.path.join(folder_output, nama)])
+        print(f"\n[SUKSES] Subgraf ditulis di: {folder_output}")
+        print(f"[SUKSES] Ringkasan disimpan di: {output_csv}\n")
+    except Exception as e:
+        print(f"\n[ERROR] Gagal menyimpan CSV: {e}")
+
+
+if __name__ == '__main__':
+    sys.argv = dari_argv(dedup_file.dari_argv(indeks_graf.dari_argv(metrik.dari_argv(sys.argv))))
+    if len(sys.argv) < 4:
+        print("Usage: python ekstrak_subgraf.py <folder_name> <folder_output> <file_himpunan>... "
+              "[--per-grup] [--tanpa-paket] [--graph <id>] [--containment[=tandai|lewati]] "
+              "[--metrik[=file.json]] [--profile[=file.prof]]")
+        sys.exit(1)
+
+    path = sys.argv[1]
+    if not os.path.exists(path):
+        print(f"[ERROR] Folder '{path}' tidak ditemukan!")
+        sys.exit(1)
+    for set_file in sys.argv[3:]:
+        if not os.path.isfile(set_file):
+            print(f"[ERROR] File himpunan '{set_file}' tidak ditemukan!")
+            sys.exit(1)
+
+    main(path, sys.argv[2], sys.argv[3:])
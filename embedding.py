@@ -0,0 +1,318 @@
+#!/usr/bin/python
+
+# Embedding simpul berdimensi rendah per workload, untuk clustering simpul
+# berdasarkan peran dan untuk evaluasi terhadap ground truth.
+#
+# Graf: tak berarah berbobot jumlah baris edge (komunitas.graf_berbobot).
+#
+#   spektral : eigenvektor terpotong dari matriks ternormalisasi teregularisasi
+#              N = Dt^-1/2 A Dt^-1/2, Dt = D + tau, tau = REGULARISASI x derajat
+#              rata-rata (scipy.sparse.linalg.eigsh, tanpa matriks padat).
+#              Tanpa tau, setiap komponen kecil (e1: 74 komponen, banyak yang
+#              bipartit) menyumbang eigenvalue tepat +-1, sehingga eigenvektor
+#              teratas hanya menandai komponen dan eigsh lambat konvergen.
+#                --matriks=laplacian  : L = I - N, DIM eigenvektor terkecil
+#                                       (= terbesar dari N, vektor trivial dibuang),
+#                                       diskalakan Dt^-1/2
+#                --matriks=adjacency  : DIM eigenvektor |lambda| terbesar dari N,
+#                                       diskalakan sqrt(|lambda|)
+#   walk     : random walk berbobot (N_WALK walk per simpul, PANJANG_WALK langkah).
+#              Semua walker melangkah bersamaan: satu langkah = satu searchsorted
+#              atas kumulatif bobot CSR. Pasangan simpul dalam jendela JENDELA
+#              dijumlah menjadi matriks ko-okurensi sparse, lalu PPMI (shift
+#              log NEGATIF) difaktorkan dengan SVD terpotong (svds), setara
+#              DeepWalk / skip-gram tanpa melatih word2vec.
+#
+# Hasil disimpan sebagai array .npy yang dibuka dengan memmap
+# (np.lib.format.open_memmap), jadi bisa dibaca sebagian tanpa memuat semuanya:
+#   embedding_<graf>_<metode>.npy   float32 (n, DIM), baris = simpul
+#   embedding_<graf>_node_ids.npy   int64 (n), node id asli per baris
+#   X = np.load('embedding_e1_spektral.npy', mmap_mode='r')
+#
+# Jika file gt diberikan, embedding simpul gt di-cluster (k-means, k = jumlah
+# grup gt) dan dinilai dengan evaluasi_gt.evaluasi_grouping (ARI / NMI).
+#
+# Contoh:
+#
+# python embedding.py dir_g22_extra_graph_with_gt/dir_edges \
+#     dir_g22_extra_graph_with_gt/candidate_gt.minPrefix5.txt
+# python embedding.py dir_g21_small_workload_with_gt dir_g21_small_workload_with_gt/groupings.gt.txt \
+#     --metode=spektral --matriks=adjacency --dim=16
+
+import sys
+import os
+import csv
+import time
+import numpy as np
+
+from muat_edges import baca_folder_array
+from evaluasi_gt import baca_grouping, evaluasi_grouping
+from komunitas import graf_berbobot
+import metrik
+import indeks_graf
+import dedup_file
+import pipeline_baca
+
+METODE = ('spektral', 'walk')
+MATRIKS = ('laplacian', 'adjacency')
+DIM = 32
+N_WALK = 10
+PANJANG_WALK = 40
+JENDELA = 5
+NEGATIF = 1
+REGULARISASI = 1.0
+SEED = 0
+
+_metode = METODE
+_matriks = 'laplacian'
+_dim = DIM
+
+
+# --- FUNGSI BANTU ---
+def _derajat(indptr, bobot):
+    """Derajat berbobot per simpul."""
+    n = len(indptr) - 1
+    return np.bincount(np.repeat(np.arange(n), np.diff(indptr)), weights=bobot, minlength=n)
+
+
+def _ternormalisasi(indptr, indices, bobot, regularisasi=REGULARISASI):
+    """(N = Dt^-1/2 A Dt^-1/2 sebagai csr_matrix, Dt^-1/2), Dt = D + regularisasi x rata-rata D."""
+    from scipy.sparse import csr_matrix
+    n = len(indptr) - 1
+    deg = _derajat(indptr, bobot)
+    deg = deg + regularisasi * deg.mean()
+    inv = np.divide(1.0, np.sqrt(deg), out=np.zeros(n), where=deg > 0)
+    baris = np.repeat(np.arange(n), np.diff(indptr))
+    nilai = bobot * inv[baris] * inv[indices]
+    return csr_matrix((nilai, indices, indptr), shape=(n, n)), inv
+
+
+# --- EMBEDDING SPEKTRAL ---
+def spektral(indptr, indices, bobot, dim=DIM, matriks='laplacian'):
+    """Embedding spektral float32 (n, dim) dari matriks ternormalisasi."""
+    from scipy.sparse.linalg import eigsh
+    n = len(indptr) - 1
+    N, inv = _ternormalisasi(indptr, indices, bobot)
+    tambahan = 1 if matriks == 'laplacian' else 0
+    k = min(dim + tambahan, n - 1)
+    v0 = np.random.default_rng(SEED).random(n)
+    with metrik.fase('eigsh'):
+        if matriks == 'laplacian':
+            # Eigen terkecil L = I - N = eigen terbesar (aljabar) N
+            nilai, vektor = eigsh(N, k=k, which='LA', v0=v0)
+        else:
+            nilai, vektor = eigsh(N, k=k, which='LM', v0=v0)
+    urut = np.argsort(-(nilai if matriks == 'laplacian' else np.abs(nilai)))
+    nilai, vektor = nilai[urut], vektor[:, urut]
+    if matriks == 'laplacian':
+        x = vektor[:, 1:] * inv[:, None]
+    else:
+        x = vektor * np.sqrt(np.abs(nilai))[None, :]
+    return _lengkapi_dim(x, dim)
+
+
+def _lengkapi_dim(x, dim):
+    """Kolom nol tambahan bila graf terlalu kecil untuk dim kolom."""
+    if x.shape[1] < dim:
+        x = np.hstack((x, np.zeros((x.shape[0], dim - x.shape[1]))))
+    return x.astype(np.float32)
+
+
+# --- EMBEDDING RANDOM WALK ---
+def random_walk(indptr, indices, bobot, n_walk=N_WALK, panjang=PANJANG_WALK, seed=SEED):
+    """
+    Walk berbobot int32 (n * n_walk, panjang + 1), walker ke-j mulai dari simpul
+    j % n. Simpul tanpa tetangga tetap di tempat.
+    """
+    rng = np.random.default_rng(seed)
+    n = len(indptr) - 1
+    kum = np.cumsum(bobot, dtype=np.float64)
+    awal_kum = np.concatenate(([0.0], kum))[indptr[:-1]]
+    deg = _derajat(indptr, bobot)
+    walk = np.empty((n * n_walk, panjang + 1), dtype=np.int32)
+    walk[:, 0] = np.tile(np.arange(n, dtype=np.int32), n_walk)
+    for t in range(panjang):
+        cur = walk[:, t]
+        target = awal_kum[cur] + rng.random(len(cur)) * deg[cur]
+        pos = np.minimum(np.searchsorted(kum, target, side='right'), len(indices) - 1)
+        walk[:, t + 1] = np.where(deg[cur] > 0, indices[pos], cur)
+    return walk
+
+
+def ko_okurensi(walk, n, jendela=JENDELA):
+    """Matriks ko-okurensi simetris (csr) pasangan simpul berjarak <= jendela dalam walk."""
+    from scipy.sparse import coo_matrix
+    total = None
+    for j in range(1, min(jendela, walk.shape[1] - 1) + 1):
+        a = walk[:, :-j].ravel()
+        b = walk[:, j:].ravel()
+        c = coo_matrix((np.ones(len(a), dtype=np.float32), (a, b)), shape=(n, n)).tocsr()
+        total = c if total is None else total + c
+    return total + total.T
+
+
+def embedding_walk(indptr, indices, bobot, dim=DIM, seed=SEED):
+    """Embedding float32 (n, dim): SVD terpotong PPMI ko-okurensi random walk."""
+    from scipy.sparse.linalg import svds
+    n = len(indptr) - 1
+    with metrik.fase('random_walk'):
+        walk = random_walk(indptr, indices, bobot, seed=seed)
+    with metrik.fase('ko_okurensi'):
+        C = ko_okurensi(walk, n).tocoo()
+    del walk
+    with metrik.fase('ppmi'):
+        baris = np.asarray(C.sum(axis=1)).ravel()
+        total = baris.sum()
+        pmi = np.log(C.data * total / (baris[C.row] * baris[C.col])) - np.log(NEGATIF)
+        simpan = pmi > 0
+        from scipy.sparse import csr_matrix
+        M = csr_matrix((pmi[simpan], (C.row[simpan], C.col[simpan])), shape=(n, n))
+    k = min(dim, n - 1)
+    with metrik.fase('svds'):
+        u, s, _ = svds(M, k=k, v0=np.random.default_rng(seed).random(n))
+    urut = np.argsort(-s)
+    return _lengkapi_dim(u[:, urut] * np.sqrt(s[urut])[None, :], dim)
+
+
+# --- SIMPAN (MEMMAP) ---
+def simpan_memmap(nama_file, x):
+    """Tulis x ke file .npy lewat memmap; dibaca lagi dengan np.load(mmap_mode='r')."""
+    mm = np.lib.format.open_memmap(nama_file, mode='w+', dtype=x.dtype, shape=x.shape)
+    mm[:] = x
+    mm.flush()
+    del mm
+
+
+# --- EVALUASI GT ---
+def nilai_gt(x, node_ids, node_gt, seed=SEED):
+    """
+    K-means (k = jumlah grup gt) atas embedding simpul gt yang ada di graf.
+    Mengembalikan dict metrik evaluasi_gt (satu kandidat) atau None.
+    """
+    from scipy.cluster.vq import kmeans2
+    id_str = node_ids.astype(str)
+    ada = np.flatnonzero(np.isin(id_str, list(node_gt)))
+    k = len(set(node_gt[i] for i in id_str[ada]))
+    if k < 2 or len(ada) <= k:
+        return None
+    y = x[ada].astype(np.float64)
+    # Normalisasi baris: arah embedding (peran) lebih penting dari panjangnya
+    y /= np.maximum(np.linalg.norm(y, axis=1, keepdims=True), 1e-12)
+    _, label = kmeans2(y, k, minit='++', seed=seed)
+    grouping = dict(zip(id_str[ada].tolist(), label.tolist()))
+    return {kunci: nilai[0] for kunci, nilai in evaluasi_grouping(node_gt, [grouping])[0].items()}
+
+
+# --- FLAG COMMAND LINE ---
+def dari_argv(argv):
+    """Membuang '--metode=spektral,walk', '--matriks=...', '--dim=D' dari argv dan mengaturnya."""
+    global _metode, _matriks, _dim
+    sisa = []
+    for arg in argv:
+        nama, _, nilai = arg.partition('=')
+        if nama == '--metode':
+            pilihan = tuple(nilai.split(','))
+            if not nilai or any(m not in METODE for m in pilihan):
+                print(f"[ERROR] Nilai --metode '{nilai}' tidak valid (pilihan: {', '.join(METODE)})")
+                sys.exit(1)
+            _metode = pilihan
+        elif nama == '--matriks':
+            if nilai not in MATRIKS:
+                print(f"[ERROR] Nilai --matriks '{nilai}' tidak valid (pilihan: {', '.join(MATRIKS)})")
+                sys.exit(1)
+            _matriks = nilai
+        elif nama == '--dim':
+            if not nilai.isdigit() or int(nilai) < 1:
+                print(f"[ERROR] Nilai --dim '{nilai}' tidak valid (bilangan bulat >= 1)")
+                sys.exit(1)
+            _dim = int(nilai)
+        else:
+            sisa.append(arg)
+    return sisa
+
+
+# --- FUNGSI UTAMA ---
+def main(path, gt_files):
+    daftar_gt = [(os.path.basename(f), baca_grouping(f)) for f in gt_files]
+    wload_to_arrays, files = baca_folder_array(path)
+    print(f'\n# Done reading from {len(files)} file(s).')
+    if not wload_to_arrays:
+        print("\n[!] Tidak ada graf yang ditemukan.")
+        return
+
+    baris_csv = []
+    for w in sorted(wload_to_arrays):
+        with metrik.fase('graf_berbobot'):
+            node_ids, indptr, indices, bobot = graf_berbobot(wload_to_arrays[w])
+        n = len(node_ids)
+        print(f"\n# Graf {w}: {n} simpul, {len(indices) // 2} edge tak berarah, dim={_dim}")
+        if n < 3:
+            print("   [SKIP] Graf terlalu kecil untuk embedding.")
+            continue
+        output_ids = f"embedding_{w}_node_ids.npy"
+        np.save(output_ids, node_ids)
+
+        for metode in _metode:
+            mulai = time.perf_counter()
+            if metode == 'spektral':
+                x = spektral(indptr, indices, bobot, _dim, _matriks)
+                nama = f"spektral ({_matriks})"
+            else:
+                x = embedding_walk(indptr, indices, bobot, _dim)
+                nama = "walk (PPMI-SVD)"
+            detik = time.perf_counter() - mulai
+
+            output_npy = f"embedding_{w}_{metode}.npy"
+            try:
+                simpan_memmap(output_npy, x)
+                print(f"   -> {nama:<22} {detik:>7.2f}s  [OK] {output_npy} ({x.nbytes / 1024 ** 2:.1f} MB)")
+            except Exception as e:
+                print(f"   -> {nama:<22} {detik:>7.2f}s  [ERROR] Gagal menyimpan {output_npy}: {e}")
+
+            for nama_gt, node_gt in daftar_gt:
+                skor = nilai_gt(x, node_ids, node_gt)
+                if skor is None:
+                    print(f"      {nama_gt}: [SKIP] Simpul gt tidak cukup di graf ini.")
+                    continue
+                print(f"      {nama_gt}: k-means k={skor['n_cluster']} ARI={skor['ari']:.4f} "
+                      f"NMI={skor['nmi']:.4f} purity={skor['purity']:.4f}")
+                baris_csv.append([w, metode, _matriks if metode == 'spektral' else '', _dim,
+                                  f"{detik:.3f}", nama_gt, skor['n_cluster'], f"{skor['ari']:.6f}",
+                                  f"{skor['nmi']:.6f}", f"{skor['purity']:.6f}"])
+            if not daftar_gt:
+                baris_csv.append([w, metode, _matriks if metode == 'spektral' else '', _dim,
+                                  f"{detik:.3f}", '', '', '', '', ''])
+
+    # --- SIMPAN KE CSV ---
+    output_csv = "embedding.csv"
+    try:
+        with open(output_csv, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(['Graph ID', 'Metode', 'Matriks', 'Dim', 'Detik', 'File GT',
+                             'Cluster K-Means', 'ARI', 'NMI', 'Purity'])
+            writer.writerows(baris_csv)
+        print(f"\n[SUKSES] Ringkasan embedding disimpan di: {output_csv}\n")
+    except Exception as e:
+        print(f"\n[ERROR] Gagal menyimpan CSV: {e}")
+
+
+if __name__ == '__main__':
+    sys.argv = dari_argv(pipeline_baca.dari_argv(dedup_file.dari_argv(indeks_graf.dari_argv(
+        metrik.dari_argv(sys.argv)))))
+    if len(sys.argv) < 2:
+        print("Usage: python embedding.py <folder_name> [file_gt ...] [--metode=spektral,walk] "
+              "[--matriks=laplacian|adjacency] [--dim=D] [--graph <id>] [--prefetch=N] "
+              "[--metrik[=file.json]] [--profile[=file.prof]]")
+        sys.exit(1)
+
+    path = sys.argv[1]
+    if not os.path.exists(path):
+        print(f"[ERROR] Folder '{path}' tidak ditemukan!")
+        sys.exit(1)
+
+    for gt_file in sys.argv[2:]:
+        if not os.path.isfile(gt_file):
+            print(f"[ERROR] File '{gt_file}' tidak ditemukan!")
+            sys.exit(1)
+
+    main(path, sys.argv[2:])
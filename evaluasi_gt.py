@@ -0,0 +1,285 @@
+#!/usr/bin/python
+
+# Evaluasi kualitas clustering (grouping kandidat) terhadap ground truth (gt).
+#
+# Semua metrik dihitung dari tabel kontingensi yang dibangun dengan array
+# label integer (numpy), tanpa loop pasangan simpul di Python. Banyak kandidat
+# sekaligus diproses dalam satu batch: label tiap kandidat digeser dengan
+# offset sehingga satu kali np.unique menghasilkan tabel kontingensi (sparse)
+# untuk semua kandidat.
+#
+# Metrik: ARI, NMI, purity, pairwise precision/recall, dan best match per grup gt.
+
+# Contoh:
+#
+# python evaluasi_gt.py dir_g21_small_workload_with_gt/groupings.gt.txt \
+#     dir_g21_small_workload_with_gt/groupings.gt.viaPrefix5.txt
+#
+# python evaluasi_gt.py dir_g22_extra_graph_with_gt/candidate_gt.minPrefix5.txt dir_kandidat/
+
+import sys
+import os
+import csv
+import numpy as np
+
+from read_gt import read_gt
+
+
+# --- FUNGSI MEMBACA GROUPING KANDIDAT ---
+def baca_grouping(grouping_file):
+    """
+    Membaca file grouping (1 baris = 1 grup, csv node id) tanpa mencetak statistik.
+    Mengembalikan dict node_id -> nomor grup (mulai dari 1), sama seperti read_gt.
+    """
+    node_to_grup = {}
+    i = 0
+    with open(grouping_file, 'r', encoding='utf-8', errors='ignore') as f:
+        for line in f:
+            line = line.strip()
+            if line == '' or line.startswith('#'):
+                continue
+            i += 1
+            for nid in line.split(','):
+                node_to_grup[nid] = i
+    return node_to_grup
+
+
+def label_array(node_order, node_to_grup):
+    """
+    Mengubah dict node -> grup menjadi array label int64 sesuai urutan node_order.
+    Simpul yang tidak punya grup di kandidat diberi label -1 (nanti dijadikan singleton).
+    """
+    return np.fromiter((node_to_grup.get(n, -1) for n in node_order),
+                       dtype=np.int64, count=len(node_order))
+
+
+def _rapatkan_label(labels):
+    """
+    Label per baris (kandidat) dipetakan ke 0..k-1. Label -1 (tanpa grup)
+    dijadikan singleton: masing-masing simpul punya cluster sendiri.
+    """
+    labels = np.array(labels, dtype=np.int64, copy=True)
+    if labels.ndim == 1:
+        labels = labels[None, :]
+    n_kand, n = labels.shape
+
+    kosong = labels < 0
+    if kosong.any():
+        # Label singleton unik: di atas label maksimum tiap baris
+        maks = labels.max(axis=1, keepdims=True) + 1
+        urut = np.cumsum(kosong, axis=1)
+        labels = np.where(kosong, maks + urut, labels)
+
+    # Rapatkan per baris: geser dengan offset baris lalu satu np.unique global
+    offset = (labels.max(axis=1) + 1)
+    offset = np.concatenate(([0], np.cumsum(offset)[:-1]))
+    _, rapat = np.unique(labels + offset[:, None], return_inverse=True)
+    rapat = rapat.reshape(n_kand, n)
+    # Setelah unique global, kurangi nilai minimum per baris agar mulai dari 0
+    rapat = rapat - rapat.min(axis=1, keepdims=True)
+    return rapat
+
+
+def _comb2(x):
+    x = x.astype(np.float64)
+    return x * (x - 1.0) / 2.0
+
+
+# --- FUNGSI UTAMA EVALUASI (BATCH) ---
+def evaluasi_batch(gt_labels, kandidat_labels):
+    """
+    gt_labels      : array int (n,) label ground truth, semua >= 0.
+    kandidat_labels: array int (k, n) atau (n,) label kandidat, -1 = tanpa grup.
+
+    Mengembalikan (metrik, best_match):
+      metrik     : dict nama -> array (k,) berisi ari, nmi, purity, precision, recall, f1,
+                   n_cluster.
+      best_match : dict berisi array datar kandidat, grup_gt, cluster, overlap, jaccard
+                   (satu baris per pasangan kandidat x grup gt).
+    """
+    gt = _rapatkan_label(gt_labels)[0]
+    kand = _rapatkan_label(kandidat_labels)
+    n_kand, n = kand.shape
+    if gt.shape[0] != n:
+        raise ValueError('Panjang label gt dan kandidat berbeda.')
+
+    n_gt = int(gt.max()) + 1
+    n_cl = kand.max(axis=1) + 1                     # jumlah cluster per kandidat
+    cl_offset = np.concatenate(([0], np.cumsum(n_cl)[:-1]))
+
+    # Indeks cluster global (unik di seluruh batch) untuk setiap (kandidat, simpul)
+    cl_global = (kand + cl_offset[:, None]).ravel()
+    total_cl = int(n_cl.sum())
+
+    # Tabel kontingensi sparse: kunci = cluster_global * n_gt + grup_gt
+    kunci = cl_global * n_gt + np.tile(gt, n_kand)
+    sel, n_ij = np.unique(kunci, return_counts=True)
+    sel_cl = sel // n_gt
+    sel_gt = sel % n_gt
+    sel_kand = np.searchsorted(cl_offset, sel_cl, side='right') - 1
+
+    # Ukuran baris (gt) dan kolom (cluster kandidat)
+    a_i = np.bincount(gt, minlength=n_gt)                      # sama untuk semua kandidat
+    b_j = np.bincount(cl_global, minlength=total_cl)
+    b_kand = np.repeat(np.arange(n_kand), n_cl)
+
+    # --- Pasangan (pairwise) ---
+    sum_ij = np.bincount(sel_kand, weights=_comb2(n_ij), minlength=n_kand)
+    sum_a = _comb2(a_i).sum()
+    sum_b = np.bincount(b_kand, weights=_comb2(b_j), minlength=n_kand)
+    total_pasang = n * (n - 1) / 2.0
+
+    expected = sum_a * sum_b / total_pasang if total_pasang > 0 else np.zeros(n_kand)
+    max_index = 0.5 * (sum_a + sum_b)
+    penyebut = max_index - expected
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ari = np.where(penyebut != 0, (sum_ij - expected) / penyebut, 1.0)
+        precision = np.where(sum_b > 0, sum_ij / sum_b, 1.0)
+        recall = np.where(sum_a > 0, sum_ij / sum_a, 1.0) * np.ones(n_kand)
+        f1 = np.where(precision + recall > 0,
+                      2 * precision * recall / (precision + recall), 0.0)
+
+    # --- Informasi mutual (NMI, normalisasi rata-rata aritmetika) ---
+    p_ij = n_ij / n
+    mi_sel = p_ij * (np.log(n_ij * float(n)) - np.log(a_i[sel_gt] * b_j[sel_cl].astype(np.float64)))
+    mi = np.bincount(sel_kand, weights=mi_sel, minlength=n_kand)
+    p_a = a_i[a_i > 0] / n
+    h_gt = -(p_a * np.log(p_a)).sum()
+    p_b = b_j / n
+    h_kand = np.bincount(b_kand, weights=-(p_b * np.log(p_b)), minlength=n_kand)
+    rata_h = 0.5 * (h_gt + h_kand)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        nmi = np.where(rata_h > 0, mi / rata_h, 1.0)
+    nmi = np.clip(nmi, 0.0, 1.0)
+
+    # --- Purity: tiap cluster kandidat mengambil grup gt mayoritas ---
+    maks_per_cl = np.zeros(total_cl, dtype=np.int64)
+    np.maximum.at(maks_per_cl, sel_cl, n_ij)
+    purity = np.bincount(b_kand, weights=maks_per_cl, minlength=n_kand) / n
+
+    # --- Best match per grup gt (Jaccard tertinggi) ---
+    jaccard = n_ij / (a_i[sel_gt] + b_j[sel_cl] - n_ij)
+    # Urutkan: kandidat, grup gt, jaccard menurun -> ambil elemen pertama tiap blok
+    urut = np.lexsort((-jaccard, sel_gt, sel_kand))
+    blok = sel_kand[urut] * n_gt + sel_gt[urut]
+    pertama = np.concatenate(([True], blok[1:] != blok[:-1]))
+    pilih = urut[pertama]
+
+    metrik = {
+        'ari': ari,
+        'nmi': nmi,
+        'purity': purity,
+        'precision': precision,
+        'recall': recall,
+        'f1': f1,
+        'n_cluster': n_cl,
+    }
+    best_match = {
+        'kandidat': sel_kand[pilih],
+        'grup_gt': sel_gt[pilih],
+        'ukuran_gt': a_i[sel_gt[pilih]],
+        'cluster': sel_cl[pilih] - cl_offset[sel_kand[pilih]],
+        'ukuran_cluster': b_j[sel_cl[pilih]],
+        'overlap': n_ij[pilih],
+        'jaccard': jaccard[pilih],
+    }
+    return metrik, best_match
+
+
+def evaluasi_grouping(node_gt, daftar_kandidat):
+    """
+    node_gt         : dict node -> grup gt (hasil read_gt).
+    daftar_kandidat : list dict node -> grup (hasil baca_grouping atau clustering lain).
+    Evaluasi dilakukan pada simpul yang ada di gt.
+    """
+    node_order = sorted(node_gt)
+    gt_labels = label_array(node_order, node_gt)
+    kand = np.vstack([label_array(node_order, k) for k in daftar_kandidat])
+    return evaluasi_batch(gt_labels, kand)
+
+
+# --- FUNGSI SCAN FILE KANDIDAT ---
+def daftar_file_kandidat(paths):
+    files = []
+    for p in paths:
+        if os.path.isdir(p):
+            for root, dirs, fs in os.walk(p):
+                for f in sorted(fs):
+                    if f.startswith('.'): continue
+                    files.append(os.path.join(root, f))
+        else:
+            files.append(p)
+    return files
+
+
+def main(gt_file, kandidat_paths):
+    print(f"\n{'='*90}")
+    print(f"{'EVALUASI GROUPING KANDIDAT TERHADAP GROUND TRUTH':^90}")
+    print(f"{'='*90}")
+
+    node_gt, gt_nodes = read_gt(gt_file)
+
+    files = daftar_file_kandidat(kandidat_paths)
+    if not files:
+        print("[!] Tidak ada file kandidat ditemukan.")
+        return
+
+    kandidat = []
+    for fname in files:
+        try:
+            kandidat.append(baca_grouping(fname))
+        except Exception as e:
+            print(f"[ERROR] {fname}: {e}")
+            kandidat.append({})
+
+    metrik, best = evaluasi_grouping(node_gt, kandidat)
+
+    print(f"{'File Kandidat':<40} {'ARI':<8} {'NMI':<8} {'Purity':<8} {'Prec':<8} {'Recall':<8} {'#Cl':<6}")
+    print('-' * 90)
+    for k, fname in enumerate(files):
+        nama = os.path.basename(fname)
+        print(f"{nama[:39]:<40} {metrik['ari'][k]:<8.4f} {metrik['nmi'][k]:<8.4f} "
+              f"{metrik['purity'][k]:<8.4f} {metrik['precision'][k]:<8.4f} "
+              f"{metrik['recall'][k]:<8.4f} {metrik['n_cluster'][k]:<6}")
+
+    # --- SIMPAN KE CSV ---
+    output_csv = "evaluasi_gt.csv"
+    output_csv_grup = "evaluasi_gt_per_grup.csv"
+    try:
+        with open(output_csv, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(['File Kandidat', 'ARI', 'NMI', 'Purity', 'Pairwise Precision',
+                             'Pairwise Recall', 'Pairwise F1', 'Jumlah Cluster'])
+            for k, fname in enumerate(files):
+                writer.writerow([fname, f"{metrik['ari'][k]:.6f}", f"{metrik['nmi'][k]:.6f}",
+                                 f"{metrik['purity'][k]:.6f}", f"{metrik['precision'][k]:.6f}",
+                                 f"{metrik['recall'][k]:.6f}", f"{metrik['f1'][k]:.6f}",
+                                 metrik['n_cluster'][k]])
+
+        with open(output_csv_grup, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(['File Kandidat', 'Grup GT', 'Ukuran Grup GT', 'Cluster Terbaik',
+                             'Ukuran Cluster', 'Overlap', 'Jaccard'])
+            for r in range(len(best['kandidat'])):
+                writer.writerow([files[best['kandidat'][r]], best['grup_gt'][r] + 1,
+                                 best['ukuran_gt'][r], best['cluster'][r] + 1,
+                                 best['ukuran_cluster'][r], best['overlap'][r],
+                                 f"{best['jaccard'][r]:.6f}"])
+
+        print(f"\n[SUKSES] Ringkasan disimpan di: {output_csv}")
+        print(f"[SUKSES] Best match per grup gt disimpan di: {output_csv_grup}\n")
+    except Exception as e:
+        print(f"\n[ERROR] Gagal menyimpan CSV: {e}")
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 3:
+        print("Usage: python evaluasi_gt.py <gt_file> <file_atau_folder_kandidat> [...]")
+        sys.exit(1)
+
+    gt_file = sys.argv[1]
+    if not os.path.exists(gt_file):
+        print(f"[ERROR] File '{gt_file}' tidak ditemukan!")
+        sys.exit(1)
+
+    main(gt_file, sys.argv[2:])
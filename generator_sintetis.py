@@ -0,0 +1,249 @@
+#!/usr/bin/python
+
+# Generator edge file sintetis dengan format README yang sama persis:
+#
+#   <graph id> <client> <server> <csv port>     contoh: e1  1  2  1p6-182,1p17-3
+#
+# Ukuran dan bentuk graf dikalibrasi ke statistik README (PROFIL di bawah):
+#   - jumlah simpul dan edge berarah = profil x skala
+#   - derajat heavy-tailed: client dan server dipilih dengan bobot Zipf
+#     (setiap simpul dijamin muncul minimal di satu edge)
+#   - jumlah token port per edge ~ geometrik dengan rata-rata
+#     (port-differentiated edges / directed edges) dari README
+#   - popularitas port juga Zipf (port teratas mendominasi seperti 2p6 di g2)
+#   - setiap edge muncul di beberapa jam (file), jumlah paket heavy-tailed
+# Satu file per jam: <graph id>_sintetis_h000.txt, h001, ...
+#
+# Contoh:
+#
+# python generator_sintetis.py e1 0.01 bench_data/e1_001
+# python generator_sintetis.py g2 0.001 bench_data/g2 12
+
+import sys
+import os
+import time
+import numpy as np
+
+# Statistik README: simpul, edge berarah, edge berarah + port, port unik,
+# plus parameter bentuk (eksponen Zipf, rata-rata kemunculan edge, jumlah jam)
+PROFIL = {
+    'g2': {
+        'nodes': 157489, 'directed': 2158346, 'port_directed': 12377439, 'ports': 103907,
+        'alpha_client': 0.6, 'alpha_server': 0.9, 'alpha_port': 1.2,
+        'kemunculan': 3.0, 'jam': 48, 'udp': 0.1,
+    },
+    'g4': {
+        'nodes': 278739, 'directed': 302108, 'port_directed': 302595, 'ports': 384,
+        'alpha_client': 0.3, 'alpha_server': 1.3, 'alpha_port': 2.5,
+        'kemunculan': 3.0, 'jam': 48, 'udp': 0.02,
+    },
+    'e1': {
+        'nodes': 33241, 'directed': 702361, 'port_directed': 785879, 'ports': 2488,
+        'alpha_client': 0.7, 'alpha_server': 1.0, 'alpha_port': 1.1,
+        'kemunculan': 7.4, 'jam': 99, 'udp': 0.1,
+    },
+}
+
+UKURAN_TULIS = 65536  # baris per tulis ke file
+
+
+# --- FUNGSI BANTU ---
+def bobot_zipf(n, alpha):
+    """Probabilitas Zipf untuk peringkat 1..n (alpha = 0 -> seragam)."""
+    w = np.arange(1, n + 1, dtype=np.float64) ** -alpha
+    return w / w.sum()
+
+
+def pilih_zipf(rng, n, alpha, ukuran):
+    """Sampel indeks 0..n-1 dengan bobot Zipf; peringkat diacak agar hub tidak selalu id kecil."""
+    peringkat = rng.choice(n, size=ukuran, p=bobot_zipf(n, alpha))
+    return rng.permutation(n)[peringkat]
+
+
+# --- FUNGSI GENERATOR ---
+def buat_edge(profil, skala, rng):
+    """
+    Edge berarah unik (tanpa self-arc). Mengembalikan (src, dst) int64, id simpul 1..n.
+    """
+    n = max(2, int(round(profil['nodes'] * skala)))
+    m = max(1, int(round(profil['directed'] * skala)))
+
+    # Edge awal: setiap simpul dijamin muncul sekali (sebagai client atau server)
+    k = min(n, m)
+    awal = rng.permutation(n)[:k]
+    sebagai_client = rng.random(k) < 0.5
+    lawan_client = pilih_zipf(rng, n, profil['alpha_client'], k)
+    lawan_server = pilih_zipf(rng, n, profil['alpha_server'], k)
+    src0 = np.where(sebagai_client, awal, lawan_client)
+    dst0 = np.where(sebagai_client, lawan_server, awal)
+
+    src = src0.astype(np.int64) + 1
+    dst = dst0.astype(np.int64) + 1
+
+    # Sisanya: kedua ujung heavy-tailed. Duplikat dibuang, jadi sampel diulang
+    # sampai jumlah edge unik cukup (graf kecil + hub besar = banyak duplikat)
+    for _ in range(50):
+        ok = src != dst
+        src, dst = src[ok], dst[ok]
+        # Urutan kemunculan pertama dipertahankan (edge awal didahulukan)
+        _, pertama = np.unique((src << 32) | dst, return_index=True)
+        pertama = np.sort(pertama)
+        src, dst = src[pertama], dst[pertama]
+        if len(src) >= m:
+            break
+        sisa = int((m - len(src)) * 1.5) + 16
+        src = np.concatenate((src, pilih_zipf(rng, n, profil['alpha_client'], sisa) + 1))
+        dst = np.concatenate((dst, pilih_zipf(rng, n, profil['alpha_server'], sisa) + 1))
+    return src[:m], dst[:m]
+
+
+def buat_port(profil, skala, n_edge, rng):
+    """
+    Token port per edge. Mengembalikan (port_off, port, proto): token edge i ada di
+    port[port_off[i]:port_off[i+1]], port unik per edge.
+    """
+    # Port unik jenuh lebih cepat dari edge: penuh sudah pada skala 0.1
+    n_port = max(8, int(round(profil['ports'] * min(1.0, skala * 10))))
+    rata = profil['port_directed'] / profil['directed']
+    jumlah = rng.geometric(1.0 / rata, size=n_edge).astype(np.int64)
+    jumlah = np.minimum(jumlah, n_port)
+
+    port_off = np.zeros(n_edge + 1, dtype=np.int64)
+    np.cumsum(jumlah, out=port_off[1:])
+    total = int(port_off[-1])
+
+    # Port teratas paling sering (peringkat Zipf dipetakan sekali ke id port)
+    bobot = bobot_zipf(n_port, profil['alpha_port'])
+    peta = rng.permutation(n_port)
+    kunci = peta[rng.choice(n_port, size=total, p=bobot)].astype(np.int64)
+
+    # Port dalam satu edge harus berbeda (sampel tanpa pengembalian per edge):
+    # token kembar diundi ulang dari Zipf yang sama; sisa kembar (edge dengan
+    # hampir semua port) digeser ke port berikutnya sampai tidak bertabrakan
+    edge = np.repeat(np.arange(n_edge, dtype=np.int64), jumlah)
+    putaran = 0
+    while True:
+        kembar = _kembar_per_edge(edge, kunci, n_port)
+        if not len(kembar):
+            break
+        if putaran < 10:
+            kunci[kembar] = peta[rng.choice(n_port, size=len(kembar), p=bobot)]
+        else:
+            kunci[kembar] = (kunci[kembar] + 1) % n_port
+        putaran += 1
+
+    # Protokol UDP (17) untuk sebagian port
+    udp = (np.arange(n_port) % int(round(1 / max(profil['udp'], 1e-6)))) == 1
+    return port_off, kunci + 1, np.where(udp[kunci], 17, 6)
+
+
+def _kembar_per_edge(edge, kunci, n_port):
+    """Indeks token yang port-nya sudah dipakai token sebelumnya di edge yang sama."""
+    k = edge * n_port + kunci
+    urut = np.argsort(k, kind='stable')
+    k = k[urut]
+    return urut[1:][k[1:] == k[:-1]]
+
+
+def kemunculan_jam(profil, n_edge, rng):
+    """Jam-jam (file) tempat setiap edge terlihat. Mengembalikan (edge_idx, jam) per baris."""
+    jam = profil['jam']
+    n_muncul = np.minimum(rng.geometric(1.0 / profil['kemunculan'], size=n_edge), jam)
+    edge_idx = np.repeat(np.arange(n_edge, dtype=np.int64), n_muncul)
+    # Jam awal acak, lalu berurutan (edge cenderung bertahan beberapa jam)
+    mulai = rng.integers(0, jam, size=n_edge)
+    geser = np.arange(len(edge_idx), dtype=np.int64) - np.repeat(np.cumsum(n_muncul) - n_muncul, n_muncul)
+    return edge_idx, (mulai[edge_idx] + geser) % jam
+
+
+def tulis_file(folder, graph_id, src, dst, port_off, port, proto, edge_idx, jam_baris, n_jam, rng):
+    """Menulis satu file per jam. Mengembalikan (daftar file, jumlah baris, jumlah byte)."""
+    os.makedirs(folder, exist_ok=True)
+    urut = np.lexsort((rng.random(len(jam_baris)), jam_baris))
+    edge_idx, jam_baris = edge_idx[urut], jam_baris[urut]
+    batas = np.searchsorted(jam_baris, np.arange(n_jam + 1))
+
+    # Paket per token, heavy-tailed (lognormal), minimal 1
+    paket = np.maximum(1, rng.lognormal(2.5, 1.8, size=len(port)).astype(np.int64))
+    token = [f"{p}p{q}-" for p, q in zip(port.tolist(), proto.tolist())]
+
+    files, n_baris, n_byte = [], 0, 0
+    src_l, dst_l, off_l, paket_l = src.tolist(), dst.tolist(), port_off.tolist(), paket.tolist()
+    for h in range(n_jam):
+        nama = os.path.join(folder, f"{graph_id}_sintetis_h{h:03d}.txt")
+        with open(nama, 'w', encoding='utf-8') as f:
+            buf = []
+            for e in edge_idx[batas[h]:batas[h + 1]].tolist():
+                a, b = off_l[e], off_l[e + 1]
+                # Jumlah paket divariasikan per jam (rotasi sederhana)
+                blob = ','.join(f"{token[t]}{paket_l[(t + h) % len(paket_l)]}" for t in range(a, b))
+                buf.append(f"{graph_id}\t{src_l[e]}\t{dst_l[e]}\t{blob}\n")
+                if len(buf) >= UKURAN_TULIS:
+                    f.write(''.join(buf))
+                    buf = []
+            f.write(''.join(buf))
+        n_baris += int(batas[h + 1] - batas[h])
+        n_byte += os.path.getsize(nama)
+        files.append(nama)
+    return files, n_baris, n_byte
+
+
+def generate(nama_profil, skala, folder, n_jam=None, graph_id=None, seed=42, verbose=True):
+    """
+    Membuat edge file sintetis di folder. Mengembalikan dict ringkasan:
+    nodes, directed, port_directed, files, lines, bytes, detik.
+    """
+    profil = dict(PROFIL[nama_profil])
+    if n_jam is not None:
+        profil['jam'] = n_jam
+    graph_id = graph_id or nama_profil
+    rng = np.random.default_rng(seed)
+    mulai = time.time()
+
+    src, dst = buat_edge(profil, skala, rng)
+    port_off, port, proto = buat_port(profil, skala, len(src), rng)
+    edge_idx, jam_baris = kemunculan_jam(profil, len(src), rng)
+    files, n_baris, n_byte = tulis_file(folder, graph_id, src, dst, port_off, port, proto,
+                                        edge_idx, jam_baris, profil['jam'], rng)
+
+    hasil = {
+        'profil': nama_profil,
+        'skala': skala,
+        'nodes': len(np.union1d(src, dst)),
+        'directed': len(src),
+        'port_directed': int(port_off[-1]),
+        'files': len(files),
+        'lines': n_baris,
+        'bytes': n_byte,
+        'detik': time.time() - mulai,
+    }
+    if verbose:
+        print(f"[OK] {hasil['files']} file, {n_baris} baris, {n_byte / 1024**2:.1f} MB "
+              f"di '{folder}' ({hasil['detik']:.2f} detik)")
+    return hasil
+
+
+def main(nama_profil, skala, folder, n_jam=None):
+    profil = PROFIL[nama_profil]
+    print(f"\n# Generator sintetis profil {nama_profil}, skala {skala:g}")
+    hasil = generate(nama_profil, skala, folder, n_jam)
+
+    print(f"\n{'':<22} {'Target':>12} {'Hasil':>12}")
+    print('-' * 48)
+    for k in ('nodes', 'directed', 'port_directed'):
+        print(f"{k:<22} {int(round(profil[k] * skala)):>12} {hasil[k]:>12}")
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 4:
+        print("Usage: python generator_sintetis.py <profil: g2|g4|e1> <skala> <folder_output> [jumlah_jam]")
+        sys.exit(1)
+
+    nama_profil = sys.argv[1]
+    if nama_profil not in PROFIL:
+        print(f"[ERROR] Profil '{nama_profil}' tidak dikenal (pilihan: {', '.join(PROFIL)})")
+        sys.exit(1)
+
+    skala = float(sys.argv[2])
+    n_jam = int(sys.argv[4]) if len(sys.argv) > 4 else None
+    main(nama_profil, skala, sys.argv[3], n_jam)
@@ -0,0 +1,106 @@
+#!/usr/bin/python
+
+# Satu perintah untuk skrip-skrip analisis per file:
+#
+#   python graf.py <subcommand>[,<subcommand>...] <folder_name> [gt_file] [--graph <id>] [--metrik] [--profile]
+#
+#   total         -> hitung_total.py         (statistik_graf.csv)
+#   derajat       -> hitung_derajat.py       (stats_<id>.csv)
+#   rata          -> hitung_rata_derajat.py  (rata_rata_derajat.csv)
+#   jenis         -> cek_jenis_graf.py       (jenis_graf.csv)
+#   distribusi    -> distribusi_derajat.py   (distribusi_<id>.csv)
+#   representasi  -> analisa_representasi.py (analisis_representasi.csv)
+#   visual        -> visualisasi_graf.py     (visualisasi_<file>.png)
+#   gt            -> read_gt.py              (statistik grouping ground truth)
+#
+# Modul skrip baru di-import saat subcommand-nya dijalankan, jadi subcommand
+# non-plot tidak pernah memuat matplotlib / networkx dan start dalam puluhan ms.
+# Jika beberapa subcommand dirangkai (dipisah koma), setiap file edge hanya
+# dibaca dan di-split sekali (cache di baris_edge.py), lalu dipakai bersama.
+# Dengan --graph <id> hanya baris graf tsb yang diproses dan file yang tidak
+# berisi graf tsb dilewati lewat indeks (indeks_graf.py).
+#
+# Contoh:
+#
+# python graf.py total dir_g21_small_workload_with_gt/dir_no_packets_etc
+# python graf.py total,derajat,rata,jenis dir_g21_small_workload_with_gt/dir_no_packets_etc
+# python graf.py total,derajat data_graf --graph g15
+# python graf.py gt dir_g21_small_workload_with_gt/groupings.gt.txt
+# python graf.py rata,gt dir_g21_small_workload_with_gt/dir_no_packets_etc dir_g21_small_workload_with_gt/groupings.gt.txt
+
+import sys
+import os
+import time
+import importlib
+
+import metrik
+import indeks_graf
+
+# subcommand -> (modul, keterangan)
+SUBCOMMAND = {
+    'total': ('hitung_total', 'total simpul, derajat, dan edge per file'),
+    'derajat': ('hitung_derajat', 'derajat masuk/keluar setiap simpul'),
+    'rata': ('hitung_rata_derajat', 'derajat rata-rata per file'),
+    'jenis': ('cek_jenis_graf', 'self-loop / multigraph per file'),
+    'distribusi': ('distribusi_derajat', 'top & bottom 50 derajat per file'),
+    'representasi': ('analisa_representasi', 'estimasi memori matrix vs list'),
+    'visual': ('visualisasi_graf', 'gambar sampel graf (butuh matplotlib + networkx)'),
+    'gt': ('read_gt', 'statistik file grouping ground truth'),
+}
+
+
+def cetak_usage():
+    print("Usage: python graf.py <subcommand>[,<subcommand>...] <folder_name> [gt_file] [--graph <id>] "
+          "[--metrik[=file.json]] [--profile[=file.prof]]")
+    print("\nSubcommand:")
+    for nama, (modul, ket) in SUBCOMMAND.items():
+        print(f"  {nama:<14} {ket}  ({modul}.py)")
+
+
+def jalankan(nama, path, gt_file):
+    modul = importlib.import_module(SUBCOMMAND[nama][0])
+    if nama == 'gt':
+        modul.read_gt(gt_file)
+    else:
+        modul.main(path)
+
+
+def main(daftar, path, gt_file=None):
+    if len(daftar) > 1:
+        # Baris edge dibaca sekali, dipakai semua subcommand berikutnya
+        from baris_edge import aktifkan_cache
+        aktifkan_cache()
+
+    for nama in daftar:
+        mulai = time.time()
+        with metrik.fase(f"subcommand:{nama}"):
+            jalankan(nama, path, gt_file)
+        print(f"[INFO] Subcommand '{nama}' selesai dalam {time.time() - mulai:.2f} detik.")
+
+
+if __name__ == '__main__':
+    sys.argv = indeks_graf.dari_argv(metrik.dari_argv(sys.argv))
+    if len(sys.argv) < 3:
+        cetak_usage()
+        sys.exit(1)
+
+    daftar = [s for s in sys.argv[1].split(',') if s]
+    salah = [s for s in daftar if s not in SUBCOMMAND]
+    if salah:
+        print(f"[ERROR] Subcommand tidak dikenal: {', '.join(salah)}\n")
+        cetak_usage()
+        sys.exit(1)
+
+    path = sys.argv[2]
+    # 'gt' sendirian: argumen kedua adalah file gt; jika dirangkai, file gt di argumen ketiga
+    gt_file = sys.argv[3] if len(sys.argv) > 3 else (path if daftar == ['gt'] else None)
+    if 'gt' in daftar and gt_file is None:
+        print("[ERROR] Subcommand 'gt' butuh file ground truth (argumen ketiga).")
+        sys.exit(1)
+
+    for p in (path, gt_file):
+        if p is not None and not os.path.exists(p):
+            print(f"[ERROR] Path '{p}' tidak ditemukan!")
+            sys.exit(1)
+
+    main(daftar, path, gt_file)
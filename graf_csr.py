@@ -0,0 +1,378 @@
+#!/usr/bin/python
+
+# Graf beku (frozen) dalam format CSR, dengan daftar port per edge sebagai
+# kolom ragged (offset), dibangun dari array muat_edges.py.
+#
+# Satu baris g1 bisa membawa puluhan token port, dan g2 punya ~6 edge
+# port-differentiated per edge berarah. read_graphs.py memecahnya menjadi
+# entri set per port dan key dict per triple; di sini setiap edge berarah
+# unik e menunjuk potongan array datar:
+#
+#   node_ids              : int64 (n)     node id asli, terurut (indeks = id internal)
+#   indptr                : int64 (n+1)   out-edge simpul u = edge indptr[u] .. indptr[u+1]-1
+#   dst                   : int32 (m)     tujuan tiap edge (id internal), terurut per u
+#   port_off              : int64 (m+1)   port edge e = port_off[e] .. port_off[e+1]-1
+#   port, proto           : int32 (p)     port dan protokol, terurut per edge
+#   paket                 : int64 (p)     total paket (semua file) untuk (edge, port)
+#   n_file                : int32 (p)     jumlah file tempat (edge, port) terlihat (longevity)
+#   in_indptr, in_src,    :               CSR terbalik (in-edge), in_edge = indeks edge
+#   in_edge                               di array di atas, untuk lookup port in-edge
+#   id_terurut,           :               node id asli terurut + id internalnya, untuk
+#   id_internal                           lookup node id asli -> id internal
+#
+# Urutan simpul (opsional, saat graf dibekukan): id internal awalnya mengikuti
+# urutan node id asli, yang tidak ada hubungannya dengan struktur graf, jadi
+# tetangga hub tersebar di memori. bangun_csr(arr, urutan=...) memberi nomor
+# ulang simpul:
+#   'derajat' : derajat tak berarah menurun (hub berdekatan di awal array)
+#   'bfs'     : urutan BFS per komponen (komponen terbesar dulu, akar = simpul
+#               berderajat tertinggi), tetangga mendapat nomor berdekatan
+#   'rcm'     : reverse Cuthill-McKee (scipy), meminimalkan bandwidth matriks
+# node_ids[i] tetap node id asli simpul internal i, jadi output tetap memakai
+# id asli. Lihat benchmark_urutan.py untuk pengaruhnya ke BFS / segitiga / PageRank.
+#
+# Lookup port satu edge dan scan port seluruh graf adalah pembacaan memori
+# berurutan; jumlah edge port-differentiated = port_off[-1] - port_off[0],
+# per edge = selisih dua offset.
+#
+# Contoh:
+#
+# python graf_csr.py dir_g21_small_workload_with_gt/dir_no_packets_etc
+# python graf_csr.py data_graf --graph g1
+# python graf_csr.py data_graf --graph g2 --urutan=bfs
+
+import sys
+import os
+import csv
+import numpy as np
+
+from muat_edges import baca_folder_array, intern_node, port_per_baris, kunci_port, nama_port
+import metrik
+import indeks_graf
+import dedup_file
+import pipeline_baca
+
+KOLOM_CSR = ('node_ids', 'indptr', 'dst', 'port_off', 'port', 'proto', 'paket', 'n_file',
+             'in_indptr', 'in_src', 'in_edge', 'id_terurut', 'id_internal')
+URUTAN = ('asli', 'derajat', 'bfs', 'rcm')
+
+_urutan = 'asli'
+
+
+# --- FUNGSI BANTU ---
+def atur_urutan(metode):
+    """Urutan simpul default untuk bangun_csr (salah satu URUTAN)."""
+    global _urutan
+    if metode not in URUTAN:
+        raise ValueError(f"urutan '{metode}' tidak dikenal (pilihan: {', '.join(URUTAN)})")
+    _urutan = metode
+
+
+def urutan_aktif():
+    return _urutan
+
+
+def _awal_grup(*kolom):
+    """Posisi awal setiap grup baris berurutan yang sama di semua kolom."""
+    n = len(kolom[0])
+    beda = np.zeros(n, dtype=bool)
+    if n:
+        beda[0] = True
+    for k in kolom:
+        beda[1:] |= k[1:] != k[:-1]
+    return np.flatnonzero(beda)
+
+
+def _offset(grup, n):
+    """Offset (n+1) dari array nomor grup yang sudah terurut."""
+    off = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(grup, minlength=n), out=off[1:])
+    return off
+
+
+def ambil_baris(indptr, indices, baris):
+    """
+    Gabungan isi baris CSR (indices[indptr[r]:indptr[r+1]] untuk r di baris),
+    tanpa loop Python. Mengembalikan (nilai, posisi baris asal di array baris).
+    """
+    a = indptr[baris]
+    panjang = indptr[np.asarray(baris) + 1] - a
+    total = int(panjang.sum())
+    asal = np.repeat(np.arange(len(a)), panjang)
+    idx = np.arange(total) - np.repeat(np.cumsum(panjang) - panjang, panjang) + np.repeat(a, panjang)
+    return indices[idx], asal
+
+
+def _lengkapi(csr):
+    """Menambah CSR terbalik dan tabel lookup node id ke csr (setelah out-CSR jadi)."""
+    n = len(csr['node_ids'])
+    in_urut = np.argsort(csr['dst'], kind='stable')
+    csr['in_indptr'] = _offset(csr['dst'][in_urut], n)
+    csr['in_src'] = edge_asal(csr)[in_urut]
+    csr['in_edge'] = in_urut.astype(np.int64)
+    urut = np.argsort(csr['node_ids'], kind='stable')
+    csr['id_terurut'] = csr['node_ids'][urut]
+    csr['id_internal'] = urut.astype(np.int32)
+    return csr
+
+
+# --- MEMBANGUN CSR ---
+def bangun_csr(arr, urutan=None):
+    """
+    Graf CSR (dict array, lihat KOLOM_CSR) dari dict array satu workload muat_edges.
+    urutan: salah satu URUTAN (default: --urutan), penomoran ulang simpul setelah
+    graf dibangun.
+    """
+    urutan = _urutan if urutan is None else urutan
+    with metrik.fase('bangun_csr'):
+        node_ids, s_idx, d_idx = intern_node(arr)
+        n = len(node_ids)
+
+        # Edge berarah unik terurut (src, dst) -> CSR out-edge
+        ekey, e_inv = np.unique((s_idx.astype(np.int64) << 32) | d_idx, return_inverse=True)
+        e_src = (ekey >> 32).astype(np.int32)
+        e_dst = (ekey & 0xFFFFFFFF).astype(np.int32)
+        m = len(ekey)
+
+        # Token port -> (edge, port) unik, terurut per edge lalu per kunci port
+        t_edge = e_inv[port_per_baris(arr)]
+        t_port = kunci_port(arr['port'], arr['proto'])
+        t_file = np.repeat(arr['file_idx'], np.diff(arr['port_off']))
+        urut = np.lexsort((t_file, t_port, t_edge))
+        t_edge, t_port, t_file = t_edge[urut], t_port[urut], t_file[urut]
+        awal = _awal_grup(t_edge, t_port)
+        # Longevity: jumlah file berbeda per (edge, port)
+        awal_file = _awal_grup(t_edge, t_port, t_file)
+        grup_file = np.searchsorted(awal, awal_file, side='right') - 1
+
+        g_port = t_port[awal]
+        csr = {
+            'node_ids': node_ids,
+            'indptr': _offset(e_src, n),
+            'dst': e_dst,
+            'port_off': _offset(t_edge[awal], m),
+            'port': (g_port >> 8).astype(np.int32),
+            'proto': (g_port & 0xFF).astype(np.int32),
+            'paket': np.add.reduceat(arr['paket'][urut], awal) if len(awal) else np.zeros(0, dtype=np.int64),
+            'n_file': np.bincount(grup_file, minlength=len(awal)).astype(np.int32),
+        }
+
+        _lengkapi(csr)
+    if urutan != 'asli':
+        csr = relabel(csr, permutasi(csr, urutan))
+    return csr
+
+
+# --- PENOMORAN ULANG SIMPUL ---
+def tak_berarah(csr):
+    """Adjacency tak berarah (indptr, indices int32), tanpa self-loop dan tanpa duplikat."""
+    n = len(csr['node_ids'])
+    src = edge_asal(csr).astype(np.int64)
+    dst = csr['dst'].astype(np.int64)
+    bukan_loop = src != dst
+    a = np.concatenate((src[bukan_loop], dst[bukan_loop]))
+    b = np.concatenate((dst[bukan_loop], src[bukan_loop]))
+    kunci = np.unique((a << 32) | b)
+    return _offset(kunci >> 32, n), (kunci & 0xFFFFFFFF).astype(np.int32)
+
+
+def _urutan_bfs(indptr, indices, deg):
+    """
+    Urutan BFS semua komponen sekaligus (level-synchronous, frontier array):
+    satu akar per komponen (derajat tertinggi), komponen besar lebih dulu.
+    """
+    from scipy.sparse import csr_matrix
+    from scipy.sparse.csgraph import connected_components
+
+    n = len(deg)
+    adj = csr_matrix((np.ones(len(indices), dtype=np.int8), indices, indptr), shape=(n, n))
+    n_komp, label = connected_components(adj, directed=False)
+    ukuran = np.bincount(label, minlength=n_komp)
+    # Peringkat komponen: ukuran menurun
+    peringkat = np.empty(n_komp, dtype=np.int64)
+    peringkat[np.argsort(-ukuran, kind='stable')] = np.arange(n_komp)
+    # Akar: simpul berderajat tertinggi di setiap komponen
+    calon = np.lexsort((-deg, label))
+    akar = calon[np.flatnonzero(np.concatenate(([True], label[calon][1:] != label[calon][:-1])))]
+
+    seq = np.full(n, -1, dtype=np.int64)
+    level = np.zeros(n, dtype=np.int64)
+    frontier = akar[np.argsort(peringkat[label[akar]], kind='stable')]
+    seq[frontier] = np.arange(len(frontier))
+    berikut, lv = len(frontier), 0
+    while len(frontier):
+        lv += 1
+        tetangga, _ = ambil_baris(indptr, indices, frontier)
+        tetangga = tetangga[seq[tetangga] < 0]
+        # Kemunculan pertama, urutan penemuan (sesuai urutan induk di frontier)
+        _, pertama = np.unique(tetangga, return_index=True)
+        frontier = tetangga[np.sort(pertama)]
+        seq[frontier] = berikut + np.arange(len(frontier))
+        level[frontier] = lv
+        berikut += len(frontier)
+    return np.lexsort((seq, level, peringkat[label]))
+
+
+def permutasi(csr, metode):
+    """Array baru_ke_lama (id internal baru -> id internal lama) untuk metode URUTAN."""
+    indptr, indices = tak_berarah(csr)
+    deg = np.diff(indptr)
+    n = len(deg)
+    with metrik.fase(f'urutan_{metode}'):
+        if metode == 'asli':
+            return np.arange(n)
+        if metode == 'derajat':
+            return np.argsort(-deg, kind='stable')
+        if metode == 'bfs':
+            return _urutan_bfs(indptr, indices, deg)
+        if metode == 'rcm':
+            from scipy.sparse import csr_matrix
+            from scipy.sparse.csgraph import reverse_cuthill_mckee
+            adj = csr_matrix((np.ones(len(indices), dtype=np.int8), indices, indptr), shape=(n, n))
+            return reverse_cuthill_mckee(adj, symmetric_mode=True).astype(np.int64)
+    raise ValueError(f"urutan '{metode}' tidak dikenal (pilihan: {', '.join(URUTAN)})")
+
+
+def relabel(csr, baru_ke_lama):
+    """CSR baru dengan simpul lama baru_ke_lama[i] menjadi simpul i (port ikut dipindah)."""
+    with metrik.fase('relabel'):
+        n = len(csr['node_ids'])
+        lama_ke_baru = np.empty(n, dtype=np.int64)
+        lama_ke_baru[baru_ke_lama] = np.arange(n)
+        s = lama_ke_baru[edge_asal(csr)]
+        d = lama_ke_baru[csr['dst']]
+        urut = np.lexsort((d, s))
+
+        # Potongan port setiap edge dipindah sesuai urutan edge baru
+        off = csr['port_off']
+        idx, _ = ambil_baris(off, np.arange(off[-1]), urut)
+        baru = {
+            'node_ids': csr['node_ids'][baru_ke_lama],
+            'indptr': _offset(s[urut], n),
+            'dst': d[urut].astype(np.int32),
+            'port_off': np.concatenate(([0], np.cumsum(np.diff(off)[urut]))).astype(np.int64),
+        }
+        for k in ('port', 'proto', 'paket', 'n_file'):
+            baru[k] = csr[k][idx]
+        return _lengkapi(baru)
+
+
+# --- LOOKUP ---
+def indeks_node(csr, node_id):
+    """Id internal dari node id asli (skalar atau array), -1 jika tidak ada."""
+    ids = csr['id_terurut']
+    node_id = np.asarray(node_id, dtype=np.int64)
+    j = np.minimum(np.searchsorted(ids, node_id), max(len(ids) - 1, 0))
+    hasil = np.where(ids[j] == node_id, csr['id_internal'][j], -1) if len(ids) else np.full(node_id.shape, -1)
+    return int(hasil) if hasil.ndim == 0 else hasil
+
+
+def cari_edge(csr, u, v):
+    """Indeks edge u -> v (id internal), atau -1. Pencarian biner di baris u."""
+    a, b = csr['indptr'][u], csr['indptr'][u + 1]
+    i = a + int(np.searchsorted(csr['dst'][a:b], v))
+    return i if i < b and csr['dst'][i] == v else -1
+
+
+def port_edge(csr, e):
+    """(port, proto, paket, n_file) edge e sebagai view (tanpa salinan)."""
+    a, b = csr['port_off'][e], csr['port_off'][e + 1]
+    return csr['port'][a:b], csr['proto'][a:b], csr['paket'][a:b], csr['n_file'][a:b]
+
+
+def jumlah_port_edge(csr):
+    """Jumlah port per edge berarah (selisih offset)."""
+    return np.diff(csr['port_off'])
+
+
+def edge_port_berbeda(csr):
+    """Jumlah edge port-differentiated (edge berarah x port)."""
+    return int(csr['port_off'][-1] - csr['port_off'][0])
+
+
+def edge_asal(csr):
+    """Simpul asal tiap edge (id internal), sejajar dengan csr['dst']."""
+    return np.repeat(np.arange(len(csr['node_ids']), dtype=np.int32), np.diff(csr['indptr']))
+
+
+def byte_csr(csr):
+    return sum(csr[k].nbytes for k in KOLOM_CSR)
+
+
+# --- FLAG COMMAND LINE ---
+def dari_argv(argv):
+    """Membuang '--urutan=<metode>' dari argv dan mengaturnya."""
+    sisa = []
+    for arg in argv:
+        if arg.startswith('--urutan='):
+            nilai = arg.partition('=')[2]
+            if nilai not in URUTAN:
+                print(f"[ERROR] Nilai --urutan '{nilai}' tidak valid (pilihan: {', '.join(URUTAN)})")
+                sys.exit(1)
+            atur_urutan(nilai)
+        else:
+            sisa.append(arg)
+    return sisa
+
+
+# --- FUNGSI UTAMA ---
+def main(path):
+    wload_to_arrays, files = baca_folder_array(path)
+    print(f'\n# Done reading from {len(files)} file(s).')
+    if not wload_to_arrays:
+        print("\n[!] Tidak ada graf yang ditemukan.")
+        return
+
+    hasil = {w: bangun_csr(arr) for w, arr in wload_to_arrays.items()}
+    workloads = sorted(hasil, key=lambda w: len(hasil[w]['node_ids']), reverse=True)
+
+    print(f"\n{'Graph':<8} {'Nodes':>8} {'Directed':>10} {'Port-Diff':>10} {'Port/Edge':>10} "
+          f"{'Max':>6} {'Tokens':>10} {'CSR MB':>8}  Port terbanyak (edge)")
+    print('-' * 110)
+    baris = []
+    for w in workloads:
+        csr = hasil[w]
+        n_port = jumlah_port_edge(csr)
+        m = len(csr['dst'])
+        e_max = int(np.argmax(n_port)) if m else -1
+        if e_max >= 0:
+            u = csr['node_ids'][edge_asal(csr)[e_max]]
+            v = csr['node_ids'][csr['dst'][e_max]]
+            port, proto, _, _ = port_edge(csr, e_max)
+            contoh = f"{u}->{v}: " + ','.join(nama_port((int(p) << 8) | int(q)) for p, q in zip(port[:4], proto[:4]))
+            contoh += ',...' if len(port) > 4 else ''
+        else:
+            contoh = '-'
+        rata = n_port.mean() if m else 0.0
+        mb = byte_csr(csr) / 1024 ** 2
+        print(f"{w:<8} {len(csr['node_ids']):>8} {m:>10} {edge_port_berbeda(csr):>10} {rata:>10.2f} "
+              f"{int(n_port.max()) if m else 0:>6} {len(wload_to_arrays[w]['port']):>10} {mb:>8.2f}  {contoh}")
+        baris.append([w, len(csr['node_ids']), m, edge_port_berbeda(csr), f"{rata:.4f}",
+                      int(n_port.max()) if m else 0, len(wload_to_arrays[w]['port']), f"{mb:.3f}"])
+
+    # --- SIMPAN KE CSV ---
+    output_csv = "graf_csr.csv"
+    try:
+        with metrik.fase('tulis_csv'), open(output_csv, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(['Graph ID', 'Nodes', 'Directed Edges', 'Port-Differentiated Edges',
+                             'Rata Port per Edge', 'Max Port per Edge', 'Token Port (baris)', 'CSR MB'])
+            writer.writerows(baris)
+        print(f"\n[SUKSES] Ringkasan CSR disimpan di: {output_csv}\n")
+    except Exception as e:
+        print(f"\n[ERROR] Gagal menyimpan CSV: {e}")
+
+
+if __name__ == '__main__':
+    sys.argv = dari_argv(pipeline_baca.dari_argv(dedup_file.dari_argv(indeks_graf.dari_argv(metrik.dari_argv(sys.argv)))))
+    if len(sys.argv) < 2:
+        print("Usage: python graf_csr.py <folder_name> [--graph <id>] [--containment[=tandai|lewati]] "
+              "[--prefetch=N] [--urutan=asli|derajat|bfs|rcm] [--metrik[=file.json]] [--profile[=file.prof]]")
+        sys.exit(1)
+
+    path = sys.argv[1]
+    if not os.path.exists(path):
+        print(f"[ERROR] Folder '{path}' tidak ditemukan!")
+        sys.exit(1)
+
+    main(path)
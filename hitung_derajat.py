@@ -3,9 +3,12 @@
 import sys
 import os
 import re
-import csv
+import numpy as np
 from collections import defaultdict, Counter
 
+from baris_edge import baris_file
+from ekspor_kolom import ekspor_tabel
+
 # --- FUNGSI MEMBACA FILE (Sama seperti sebelumnya) ---
 def read_graph_data(edges_file):
     # Dictionary untuk menyimpan derajat
@@ -22,7 +25,7 @@ def read_graph_data(edges_file):
     print(f"   -> Memproses: {filename_only} ...", end=" ")
 
     try:
-        fopen = open(edges_file, mode='r', encoding='utf-8', errors='ignore')
+        baris = baris_file(edges_file)
     except Exception as e:
         print(f"[ERROR] {e}")
         return None, None, None, None
@@ -30,42 +33,38 @@ def read_graph_data(edges_file):
     valid_lines = 0
     graph_id = "unknown"
 
-    with fopen: 
-        for line in fopen:
-            if line.startswith('#'): continue
-            parts = line.split()
-            
-            if len(parts) < 3: continue
+    for parts in baris:
+        if len(parts) < 3: continue
 
-            # Validasi format angka
-            if not (parts[1].isdigit() and parts[2].isdigit()):
-                continue
+        # Validasi format angka
+        if not (parts[1].isdigit() and parts[2].isdigit()):
+            continue
 
-            # Ambil ID Graf dari baris pertama yang valid
-            if valid_lines == 0:
-                graph_id = parts[0]
-                # Bersihkan ID dari karakter aneh
-                graph_id = re.sub(r'[^\w\-_]', '', graph_id)
+        # Ambil ID Graf dari baris pertama yang valid
+        if valid_lines == 0:
+            graph_id = parts[0]
+            # Bersihkan ID dari karakter aneh
+            graph_id = re.sub(r'[^\w\-_]', '', graph_id)
 
-            v1 = parts[1] # Source Node
-            v2 = parts[2] # Target Node
-            
-            # Cek Port (Wajib ada 'p')
-            has_port = False
-            if len(parts) > 3:
-                ports = parts[3].split(',')
-                for p in ports:
-                    if 'p' in p:
-                        has_port = True
-                        break
-            
-            if has_port:
-                # Update Statistik
-                nodes.add(v1)
-                nodes.add(v2)
-                out_degree[v1] += 1
-                in_degree[v2] += 1
-                valid_lines += 1
+        v1 = parts[1] # Source Node
+        v2 = parts[2] # Target Node
+        
+        # Cek Port (Wajib ada 'p')
+        has_port = False
+        if len(parts) > 3:
+            ports = parts[3].split(',')
+            for p in ports:
+                if 'p' in p:
+                    has_port = True
+                    break
+        
+        if has_port:
+            # Update Statistik
+            nodes.add(v1)
+            nodes.add(v2)
+            out_degree[v1] += 1
+            in_degree[v2] += 1
+            valid_lines += 1
     
     if valid_lines > 0:
         print(f"[OK] ID: {graph_id} | {valid_lines} edges.")
@@ -93,6 +92,10 @@ def main(path):
     print(f"{'Graph ID':<15} {'Jml Simpul':<15} {'Jml Edge':<15} {'Max Degree':<15} {'Avg Degree':<15}")
     print('-'*80)
 
+    # Satu graf bisa tersebar di banyak file (e1: 93 file per jam). Tabel dikumpulkan
+    # per Graph ID dan diekspor sekali setelah loop, seperti sebelumnya tabel file
+    # terakhir yang tersisa, tapi tanpa menulis ulang output untuk setiap file.
+    tabel_per_graf = {}
     for fname in all_files:
         g_id, nodes, in_deg, out_deg = read_graph_data(fname)
         
@@ -112,32 +115,29 @@ def main(path):
             # Print Baris Tabel
             print(f"{g_id:<15} {num_nodes:<15} {total_edges:<15} {max_deg:<15} {avg_deg:<15.2f}")
             
-            # --- SIMPAN DETAIL KE CSV (Opsional) ---
-            # Ini akan membuat file excel berisi derajat setiap node
-            output_csv = f"stats_{g_id}.csv"
-            try:
-                with open(output_csv, 'w', newline='', encoding='utf-8') as csvfile:
-                    fieldnames = ['Node_ID', 'In_Degree', 'Out_Degree', 'Total_Degree']
-                    writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                    writer.writeheader()
-                    
-                    # Urutkan berdasarkan degree tertinggi
-                    sorted_nodes = sorted(nodes, key=lambda n: total_degree[n], reverse=True)
-                    
-                    for n in sorted_nodes:
-                        writer.writerow({
-                            'Node_ID': n,
-                            'In_Degree': in_deg[n],
-                            'Out_Degree': out_deg[n],
-                            'Total_Degree': total_degree[n]
-                        })
-                # Uncomment baris bawah jika ingin notifikasi file dibuat
-                # print(f"   (Detail disimpan ke {output_csv})")
-            except Exception as e:
-                print(f"   [Gagal simpan CSV]: {e}")
+            # Urutkan berdasarkan degree tertinggi (seri: node id terkecil dulu)
+            sorted_nodes = sorted(nodes, key=lambda n: (-total_degree[n], int(n)))
+            tabel_per_graf[g_id] = {
+                'Node_ID': np.array([int(n) for n in sorted_nodes], dtype=np.int64),
+                'In_Degree': np.array([in_deg[n] for n in sorted_nodes], dtype=np.int64),
+                'Out_Degree': np.array([out_deg[n] for n in sorted_nodes], dtype=np.int64),
+                'Total_Degree': np.array([total_degree[n] for n in sorted_nodes], dtype=np.int64),
+            }
+
+    # --- SIMPAN DETAIL (kolom biner + CSV), sekali per graf ---
+    # stats_<id>.csv untuk Excel, kolom_stats_<id>/*.npy untuk dibaca ulang cepat
+    status_ekspor = Counter()
+    for g_id, kolom in tabel_per_graf.items():
+        try:
+            status, output_csv = ekspor_tabel('stats', g_id, list(kolom), kolom)
+            status_ekspor[status] += 1
+        except Exception as e:
+            print(f"   [Gagal simpan CSV] {g_id}: {e}")
 
     print('='*80)
-    print("Selesai. File 'stats_*.csv' berisi detail setiap node telah dibuat.")
+    print(f"Selesai. Ekspor stats_*.csv + kolom_stats_*/: {status_ekspor['ditulis']} ditulis, "
+          f"{status_ekspor['dilewati']} tidak berubah (dilewati), "
+          f"{status_ekspor['id_tidak_valid']} Graph ID tidak valid (tidak diekspor).")
 
 if __name__ == '__main__':
     if len(sys.argv) < 2:
@@ -4,6 +4,9 @@ import sys
 import os
 import csv
 
+from baris_edge import baris_file
+import metrik
+
 def calculate_avg_degree(filepath):
     """
     Membaca file, menghitung node dan edge, lalu mencari rata-rata derajat.
@@ -30,30 +33,25 @@ def calculate_avg_degree(filepath):
     # -----------------------------
 
     try:
-        with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-            for line in f:
-                if line.startswith('#'): continue
-                
-                parts = line.split()
-                
-                # Format: ID Node1 Node2 PortInfo
-                if len(parts) < 4: continue
-                
-                # Validasi angka (ID Node harus angka)
-                if not (parts[1].isdigit() and parts[2].isdigit()):
-                    continue
-
-                if edge_count == 0:
-                    graph_id = parts[0]
-
-                u, v = parts[1], parts[2]
-                port_info = parts[3]
-
-                # Hitung hanya jika ada informasi port (koneksi valid dengan 'p')
-                if 'p' in port_info:
-                    unique_nodes.add(u)
-                    unique_nodes.add(v)
-                    edge_count += 1
+        for parts in baris_file(filepath):
+            # Format: ID Node1 Node2 PortInfo
+            if len(parts) < 4: continue
+            
+            # Validasi angka (ID Node harus angka)
+            if not (parts[1].isdigit() and parts[2].isdigit()):
+                continue
+
+            if edge_count == 0:
+                graph_id = parts[0]
+
+            u, v = parts[1], parts[2]
+            port_info = parts[3]
+
+            # Hitung hanya jika ada informasi port (koneksi valid dengan 'p')
+            if 'p' in port_info:
+                unique_nodes.add(u)
+                unique_nodes.add(v)
+                edge_count += 1
 
     except Exception as e:
         # Jika error baca file, abaikan saja
@@ -120,7 +118,7 @@ def main(path):
     # 2. SIMPAN KE CSV
     output_csv = "rata_rata_derajat.csv"
     try:
-        with open(output_csv, mode='w', newline='', encoding='utf-8') as f:
+        with metrik.fase('tulis_csv'), open(output_csv, mode='w', newline='', encoding='utf-8') as f:
             writer = csv.writer(f)
             # Header Excel
             writer.writerow(['Graph ID', 'Nama File', 'Jumlah Node', 'Jumlah Edge', 'Rata-rata Derajat'])
@@ -4,6 +4,9 @@ import sys
 import os
 import csv  # Library untuk membuat file CSV/Excel
 
+from baris_edge import baris_file
+import metrik
+
 def process_graph_file(filepath):
     """
     Membaca satu file dan menghitung set node unik serta total derajat.
@@ -30,33 +33,28 @@ def process_graph_file(filepath):
     # --------------------------------
 
     try:
-        with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-            for line in f:
-                if line.startswith('#'): continue
-                
-                parts = line.split()
-                
-                # Syarat: Minimal 4 kolom (ID, Node1, Node2, PortInfo)
-                if len(parts) < 4: continue
-                
-                # Pastikan Node ID berupa angka
-                if not (parts[1].isdigit() and parts[2].isdigit()):
-                    continue
+        for parts in baris_file(filepath):
+            # Syarat: Minimal 4 kolom (ID, Node1, Node2, PortInfo)
+            if len(parts) < 4: continue
+            
+            # Pastikan Node ID berupa angka
+            if not (parts[1].isdigit() and parts[2].isdigit()):
+                continue
 
-                if valid_edges == 0:
-                    graph_id = parts[0]
+            if valid_edges == 0:
+                graph_id = parts[0]
 
-                u = parts[1]
-                v = parts[2]
-                port_info = parts[3]
+            u = parts[1]
+            v = parts[2]
+            port_info = parts[3]
 
-                # Cek apakah ini edge valid (harus mengandung port 'p')
-                if 'p' in port_info:
-                    unique_nodes.add(u)
-                    unique_nodes.add(v)
-                    # Total Derajat = In + Out (setiap edge menambah 2 ke total sistem)
-                    total_degree_sum += 2
-                    valid_edges += 1
+            # Cek apakah ini edge valid (harus mengandung port 'p')
+            if 'p' in port_info:
+                unique_nodes.add(u)
+                unique_nodes.add(v)
+                # Total Derajat = In + Out (setiap edge menambah 2 ke total sistem)
+                total_degree_sum += 2
+                valid_edges += 1
 
     except Exception as e:
         print(f"[ERROR] Gagal membaca {filename}: {e}")
@@ -106,7 +104,7 @@ def main(path):
     output_filename = "statistik_graf.csv"
     
     try:
-        with open(output_filename, mode='w', newline='', encoding='utf-8') as csv_file:
+        with metrik.fase('tulis_csv'), open(output_filename, mode='w', newline='', encoding='utf-8') as csv_file:
             # Tentukan Header Kolom
             fieldnames = ['Graph ID', 'Nama File', 'Total Simpul (Nodes)', 'Total Derajat', 'Total Edge']
             writer = csv.DictWriter(csv_file, fieldnames=fieldnames)
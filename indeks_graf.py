@@ -0,0 +1,236 @@
+#!/usr/bin/python
+
+# Filter satu workload (--graph g15) dan indeks graph id per file.
+#
+# Filter: baris milik graf lain ditolak dengan cek prefix ('g15\t' / 'g15 ')
+# SEBELUM di-split, jadi tidak ada tokenisasi untuk baris yang akan dibuang.
+#
+# Indeks: setiap folder data punya file sidecar '.indeks_graf.json'
+# (diawali titik, jadi dilewati oleh semua pembaca) berisi, per file:
+#   ukuran, mtime_ns, dan jumlah baris per graph id.
+# Entri dianggap basi jika ukuran/mtime file berubah, lalu dibangun ulang.
+# Saat filter aktif, file yang menurut indeks tidak berisi graf tsb
+# dilewati tanpa dibuka sama sekali. File yang belum terindeks dipindai
+# sekali (hanya kolom pertama, per blok); indeks yang berubah ditulis sekali
+# per folder di akhir pemindaian (saring_file) atau saat proses selesai
+# (atexit, untuk pembaca per file lewat baris_edge), bukan setiap file.
+#
+# Skrip yang memakai indeks_graf.dari_argv() menerima flag:
+#   --graph <id>  atau  --graph=<id>
+#
+# Contoh:
+#
+# python indeks_graf.py dir_g22_extra_graph_with_gt/dir_edges       # bangun/tampilkan indeks
+# python read_graphs.py data_graf --graph g15
+# python graf.py total,derajat data_graf --graph g15
+
+import sys
+import os
+import re
+import gzip
+import json
+import atexit
+from collections import Counter
+
+import metrik
+
+NAMA_INDEKS = '.indeks_graf.json'
+UKURAN_BLOK = 8 << 20
+
+# Kolom pertama setiap baris non-komentar
+_POLA_ID = re.compile(rb'^([^\s#]\S*)', re.MULTILINE)
+
+_graf = None         # graph id yang dipilih (None = semua graf)
+_prefix = None       # tuple prefix baris untuk str.startswith
+_indeks = {}         # folder -> dict isi .indeks_graf.json
+_kotor = set()       # folder yang indeksnya berubah tapi belum disimpan
+
+
+# --- FILTER GRAF ---
+def pilih_graf(graph_id):
+    """Aktifkan filter satu graf untuk semua pembaca (None = matikan)."""
+    global _graf, _prefix
+    _graf = graph_id or None
+    _prefix = (f"{graph_id}\t", f"{graph_id} ") if _graf else None
+
+
+def graf_aktif():
+    return _graf
+
+
+def prefix_graf():
+    """Tuple prefix untuk line.startswith(), atau None jika filter tidak aktif."""
+    return _prefix
+
+
+# --- INDEKS PER FILE ---
+def _file_indeks(folder):
+    return os.path.join(folder, NAMA_INDEKS)
+
+
+def _muat_indeks(folder):
+    isi = _indeks.get(folder)
+    if isi is None:
+        try:
+            with open(_file_indeks(folder), encoding='utf-8') as f:
+                isi = json.load(f)
+        except (OSError, ValueError):
+            isi = {}
+        _indeks[folder] = isi
+    return isi
+
+
+def _simpan_indeks(folder):
+    _kotor.discard(folder)
+    try:
+        with open(_file_indeks(folder), 'w', encoding='utf-8') as f:
+            json.dump(_indeks[folder], f, indent=1, sort_keys=True)
+    except OSError as e:
+        print(f"[!] Indeks graf tidak bisa disimpan di '{folder}': {e}")
+
+
+def pindai_file(filepath):
+    """Jumlah baris per graph id (kolom pertama) satu file; .gz didekompresi."""
+    hitung = Counter()
+    fopen = gzip.open(filepath, 'rb') if filepath.endswith('.gz') else open(filepath, 'rb')
+    with fopen, metrik.fase('indeks_graf'):
+        while True:
+            blok = fopen.read(UKURAN_BLOK)
+            if not blok:
+                break
+            # Lengkapi baris terakhir yang terpotong blok
+            blok += fopen.readline()
+            hitung.update(_POLA_ID.findall(blok))
+    return {k.decode('utf-8', 'ignore'): n for k, n in hitung.items()}
+
+
+def graf_di_file(filepath, simpan=True):
+    """
+    Dict graph id -> jumlah baris untuk satu file, dari indeks sidecar bila
+    masih cocok dengan ukuran/mtime file; jika tidak, file dipindai dan indeks diperbarui.
+    """
+    folder, nama = os.path.split(os.path.abspath(filepath))
+    st = os.stat(filepath)
+    isi = _muat_indeks(folder)
+    entri = isi.get(nama)
+    if entri is not None and entri['ukuran'] == st.st_size and entri['mtime_ns'] == st.st_mtime_ns:
+        return entri['graf']
+
+    graf = pindai_file(filepath)
+    isi[nama] = {'ukuran': st.st_size, 'mtime_ns': st.st_mtime_ns, 'graf': graf}
+    metrik.tambah('file_diindeks')
+    if simpan:
+        _simpan_indeks(folder)
+    else:
+        _kotor.add(folder)
+    return graf
+
+
+def simpan_indeks_kotor():
+    """Simpan sekali indeks setiap folder yang berubah lewat graf_di_file(simpan=False)."""
+    for folder in sorted(_kotor):
+        _simpan_indeks(folder)
+
+
+# Pembaca per file tidak punya titik 'akhir scan': sisa indeks disimpan saat keluar
+atexit.register(simpan_indeks_kotor)
+
+
+def perlu_dibaca(filepath, simpan=True):
+    """
+    False jika filter graf aktif dan indeks menyatakan file tidak berisi graf tsb.
+    simpan=False: indeks yang diperbarui belum ditulis (lihat simpan_indeks_kotor).
+    """
+    if _graf is None or os.path.basename(filepath).startswith('.'):
+        return True
+    try:
+        ada = _graf in graf_di_file(filepath, simpan)
+    except OSError:
+        # Biarkan pembaca yang melaporkan error buka file
+        return True
+    if not ada:
+        metrik.tambah('file_dilewati_indeks')
+    return ada
+
+
+def saring_file(files):
+    """Daftar file yang perlu dibaca untuk graf aktif (semua file jika filter mati)."""
+    if _graf is None:
+        return list(files)
+    # Indeks ditulis sekali per folder setelah semua file, bukan setiap file
+    hasil = [f for f in files if perlu_dibaca(f, simpan=False)]
+    simpan_indeks_kotor()
+    print(f"# Filter graf '{_graf}': {len(hasil)} dari {len(files)} file berisi graf ini "
+          f"({len(files) - len(hasil)} dilewati lewat indeks).")
+    return hasil
+
+
+# --- FLAG COMMAND LINE ---
+def dari_argv(argv):
+    """
+    Membuang '--graph <id>' / '--graph=<id>' dari argv dan mengaktifkan filternya.
+    Mengembalikan argv tanpa flag.
+    """
+    sisa, graph_id, i = [], None, 0
+    while i < len(argv):
+        arg = argv[i]
+        if arg == '--graph' and i + 1 < len(argv):
+            graph_id = argv[i + 1]
+            i += 2
+            continue
+        if arg.startswith('--graph='):
+            graph_id = arg[len('--graph='):]
+        else:
+            sisa.append(arg)
+        i += 1
+    if graph_id:
+        pilih_graf(graph_id)
+    return sisa
+
+
+# --- FUNGSI UTAMA ---
+def main(path):
+    """Membangun (atau memperbarui) indeks semua file edge di folder lalu menampilkannya."""
+    from muat_edges import FILTER_METADATA
+
+    if os.path.isfile(path):
+        files = [path]
+    else:
+        files = []
+        for root, dirs, fs in os.walk(path):
+            dirs.sort()
+            for file in sorted(fs):
+                if not file.startswith(FILTER_METADATA):
+                    files.append(os.path.join(root, file))
+
+    print(f'\n# Indeks graph id untuk {len(files)} file di: {path}')
+    total = Counter()
+    folder_baru = set()
+    for fname in files:
+        graf = graf_di_file(fname, simpan=False)
+        folder_baru.add(os.path.dirname(os.path.abspath(fname)))
+        total.update(graf)
+        daftar = ', '.join(f"{g}={n}" for g, n in sorted(graf.items(), key=lambda x: -x[1])[:5])
+        lebih = f" (+{len(graf) - 5} lainnya)" if len(graf) > 5 else ''
+        print(f"   -> {os.path.basename(fname)}: {daftar}{lebih}")
+
+    for folder in sorted(folder_baru):
+        _simpan_indeks(folder)
+
+    print(f"\n[SUKSES] Indeks disimpan ({NAMA_INDEKS}) di {len(folder_baru)} folder.")
+    print(f"{'Graph ID':<20} {'Baris':>12}")
+    for g, n in total.most_common(20):
+        print(f"{g:<20} {n:>12}")
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        print("Usage: python indeks_graf.py <folder_name>")
+        sys.exit(1)
+
+    path = sys.argv[1]
+    if not os.path.exists(path):
+        print(f"[ERROR] Folder '{path}' tidak ditemukan!")
+        sys.exit(1)
+
+    main(path)
@@ -0,0 +1,222 @@
+#!/usr/bin/python
+
+# Kemiripan simpul berdasarkan profil port (port yang dilayani / dipakai).
+#
+# Setiap simpul digambarkan oleh vektor TF-IDF sparse atas port:
+#   - kolom "server": port yang dilayani simpul (simpul sebagai server/provider)
+#   - kolom "client": port yang dipakai simpul (simpul sebagai client/consumer)
+# dengan bobot tf = log(1 + jumlah paket) dan idf = log(N / df). Tetangga top-k
+# (cosine) dihitung per blok baris (X @ X[blok].T, sparse x dense) sehingga
+# memori tetap terbatas (blok x N), lalu pasangan tetangga timbal balik di atas threshold
+# digabung menjadi grouping kandidat (komponen terhubung).
+
+# Contoh:
+#
+# python kemiripan_port.py dir_g22_extra_graph_with_gt/dir_edges e1 10 0.8
+
+import sys
+import os
+import re
+import csv
+import time
+import numpy as np
+
+try:
+    import scipy.sparse as sp
+    from scipy.sparse.csgraph import connected_components
+except ImportError as e:
+    print(f"\n[ERROR FATAL] Library belum lengkap: {e}")
+    print("Silakan jalankan perintah ini di terminal:")
+    print("pip install numpy scipy")
+    sys.exit(1)
+
+from muat_edges import baca_folder_array, intern_node, port_per_baris, kunci_port
+import indeks_graf
+
+# Batas memori untuk satu blok hasil perkalian (float32, blok x max(N, jumlah fitur))
+MEMORI_BLOK = 64 * 1024 * 1024
+
+
+# --- FUNGSI MEMBANGUN MATRIKS FITUR ---
+def matriks_port(arr):
+    """
+    Matriks simpul x port dari array edge (hasil muat_edges).
+    Mengembalikan (node_ids, port_keys, M_server, M_client) dengan nilai = total paket.
+    """
+    node_ids, src_idx, dst_idx = intern_node(arr)
+    baris = port_per_baris(arr)
+    port_keys, port_idx = np.unique(kunci_port(arr['port'], arr['proto']), return_inverse=True)
+    paket = arr['paket'].astype(np.float64)
+    # Baris tanpa info paket (file dir_no_packets_etc) tetap dihitung sebagai 1
+    paket = np.maximum(paket, 1.0)
+
+    shape = (len(node_ids), len(port_keys))
+    m_server = sp.coo_matrix((paket, (dst_idx[baris], port_idx)), shape=shape).tocsr()
+    m_client = sp.coo_matrix((paket, (src_idx[baris], port_idx)), shape=shape).tocsr()
+    m_server.sum_duplicates()
+    m_client.sum_duplicates()
+    return node_ids, port_keys, m_server, m_client
+
+
+def tfidf(m):
+    """TF-IDF per kolom: tf = log1p(nilai), idf = log(N / df) (+1 agar tidak nol)."""
+    m = m.tocsr(copy=True)
+    m.data = np.log1p(m.data)
+    n = m.shape[0]
+    df = np.bincount(m.indices, minlength=m.shape[1])
+    idf = np.log((n + 1.0) / (df + 1.0)) + 1.0
+    m.data *= idf[m.indices]
+    return m
+
+
+def normalisasi_baris(m):
+    norma = np.sqrt(np.asarray(m.multiply(m).sum(axis=1)).ravel())
+    norma[norma == 0] = 1.0
+    return sp.diags(1.0 / norma) @ m
+
+
+def fitur_port(arr):
+    """Fitur gabungan [server | client] yang sudah dinormalisasi L2 (float32, CSR)."""
+    node_ids, port_keys, m_server, m_client = matriks_port(arr)
+    x = sp.hstack([tfidf(m_server), tfidf(m_client)], format='csr')
+    x = normalisasi_baris(x).astype(np.float32).tocsr()
+    return node_ids, port_keys, x
+
+
+# --- TOP-K TETANGGA (BLOK) ---
+def topk_tetangga(x, k=10, ukuran_blok=None, verbose=True):
+    """
+    Top-k tetangga cosine setiap baris x (baris sudah dinormalisasi).
+    Mengembalikan (indeks (n, k) int32, skor (n, k) float32); -1 jika tidak ada tetangga.
+    """
+    n = x.shape[0]
+    k = max(1, min(k, n - 1)) if n > 1 else 1
+    if ukuran_blok is None:
+        ukuran_blok = max(1, min(n, MEMORI_BLOK // max(1, max(n, x.shape[1]) * 4)))
+
+    indeks = np.full((n, k), -1, dtype=np.int32)
+    skor = np.zeros((n, k), dtype=np.float32)
+
+    mulai = time.time()
+    for awal in range(0, n, ukuran_blok):
+        akhir = min(n, awal + ukuran_blok)
+        # Sparse x dense jauh lebih cepat daripada sparse x sparse untuk hasil yang padat
+        blok = x[awal:akhir].toarray().T
+        sim = np.ascontiguousarray((x @ blok).T)
+        # Diri sendiri bukan tetangga
+        sim[np.arange(akhir - awal), np.arange(awal, akhir)] = -1.0
+
+        if k < n:
+            kand = np.argpartition(sim, n - k, axis=1)[:, n - k:]
+        else:
+            kand = np.tile(np.arange(n), (akhir - awal, 1))
+        s = np.take_along_axis(sim, kand, axis=1)
+        urut = np.argsort(-s, axis=1)
+        kand = np.take_along_axis(kand, urut, axis=1)
+        s = np.take_along_axis(s, urut, axis=1)
+
+        ada = s > 0
+        indeks[awal:akhir] = np.where(ada, kand, -1)
+        skor[awal:akhir] = np.where(ada, s, 0.0)
+
+        if verbose:
+            lama = time.time() - mulai
+            print(f"   -> Top-{k}: {akhir}/{n} simpul ({akhir / max(lama, 1e-9):.0f} simpul/detik)", end="\r")
+    if verbose:
+        print()
+    return indeks, skor
+
+
+def grouping_tetangga(indeks, skor, threshold=0.8, mutual=True):
+    """
+    Grouping kandidat: komponen terhubung dari pasangan tetangga dengan skor >= threshold
+    (hanya pasangan timbal balik jika mutual=True). Mengembalikan array label (n,).
+    """
+    n, k = indeks.shape
+    baris = np.repeat(np.arange(n), k)
+    kolom = indeks.ravel()
+    pilih = (kolom >= 0) & (skor.ravel() >= threshold)
+    adj = sp.coo_matrix((np.ones(pilih.sum(), dtype=np.int8), (baris[pilih], kolom[pilih])),
+                        shape=(n, n)).tocsr()
+    if mutual:
+        adj = adj.multiply(adj.T)
+    _, label = connected_components(adj, directed=False)
+    return label
+
+
+def simpan_grouping(node_ids, label, output_file, min_ukuran=1):
+    """Menulis grouping dalam format groupings.gt.txt (grup kecil lebih dulu)."""
+    urut = np.argsort(label, kind='stable')
+    label_urut = label[urut]
+    batas = np.flatnonzero(np.diff(label_urut)) + 1
+    grup = [g for g in np.split(urut, batas) if len(g) >= min_ukuran]
+    grup.sort(key=len)
+    with open(output_file, 'w', encoding='utf-8') as f:
+        for g in grup:
+            f.write(','.join(str(node_ids[i]) for i in g) + '\n')
+    return len(grup)
+
+
+def main(path, graph_id=None, k=10, threshold=0.8):
+    print(f"\n{'='*80}")
+    print(f"{'KEMIRIPAN SIMPUL BERDASARKAN PROFIL PORT':^80}")
+    print(f"{'='*80}")
+
+    if graph_id is not None:
+        # Hanya graf ini yang dibaca (baris lain ditolak sebelum split, file lain dilewati)
+        indeks_graf.pilih_graf(graph_id)
+    wload_to_arrays, files = baca_folder_array(path)
+    if not wload_to_arrays:
+        print("\n[!] Tidak ada graf yang ditemukan.")
+        return
+
+    if graph_id is None:
+        graph_id = max(wload_to_arrays, key=lambda w: len(wload_to_arrays[w]['src']))
+    if graph_id not in wload_to_arrays:
+        print(f"[ERROR] Graph ID '{graph_id}' tidak ada di data.")
+        return
+
+    node_ids, port_keys, x = fitur_port(wload_to_arrays[graph_id])
+    print(f"\n# Graph={graph_id}  simpul={x.shape[0]}  port={len(port_keys)}  nnz={x.nnz}")
+
+    mulai = time.time()
+    indeks, skor = topk_tetangga(x, k=k)
+    lama = time.time() - mulai
+    print(f"# Top-{k} tetangga selesai dalam {lama:.2f} detik "
+          f"({x.shape[0] / max(lama, 1e-9):.0f} simpul/detik)")
+
+    label = grouping_tetangga(indeks, skor, threshold=threshold)
+
+    clean_id = re.sub(r'[^\w\-_]', '', graph_id) or "unknown_graph"
+    output_csv = f"tetangga_port_{clean_id}.csv"
+    output_grouping = f"grouping_port_{clean_id}.txt"
+    try:
+        with open(output_csv, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(['Node ID', 'Rank', 'Tetangga', 'Cosine'])
+            for i in range(len(node_ids)):
+                for r in range(indeks.shape[1]):
+                    j = indeks[i, r]
+                    if j < 0: break
+                    writer.writerow([node_ids[i], r + 1, node_ids[j], f"{skor[i, r]:.6f}"])
+        n_grup = simpan_grouping(node_ids, label, output_grouping)
+        print(f"[SUKSES] Tetangga disimpan di: {output_csv}")
+        print(f"[SUKSES] Grouping kandidat ({n_grup} grup) disimpan di: {output_grouping}\n")
+    except Exception as e:
+        print(f"\n[ERROR] Gagal menyimpan hasil: {e}")
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        print("Usage: python kemiripan_port.py <folder_name> [graph_id] [k] [threshold]")
+        sys.exit(1)
+
+    path = sys.argv[1]
+    if not os.path.exists(path):
+        print(f"[ERROR] Folder '{path}' tidak ditemukan!")
+        sys.exit(1)
+
+    graph_id = sys.argv[2] if len(sys.argv) > 2 else None
+    k = int(sys.argv[3]) if len(sys.argv) > 3 else 10
+    threshold = float(sys.argv[4]) if len(sys.argv) > 4 else 0.8
+    main(path, graph_id, k, threshold)
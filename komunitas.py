@@ -0,0 +1,365 @@
+#!/usr/bin/python
+
+# Deteksi komunitas (grouping simpul berdasarkan fungsi) di atas array CSR
+# integer, dinilai otomatis terhadap ground truth (evaluasi_gt.py).
+#
+# Graf: tak berarah, bobot edge u-v = jumlah baris edge (u, v) dan (v, u) di
+# semua file (edge yang sering muncul lebih kuat), tanpa self-loop.
+# Semua langkah per iterasi adalah operasi array atas seluruh edge (np.unique /
+# bincount / lexsort), tanpa loop Python per simpul:
+#
+#   lp       : label propagation semi-sinkron. Setiap iterasi setiap simpul
+#              memilih label dengan bobot tetangga terbesar (seri: label sendiri
+#              dipertahankan, sisanya acak), tapi hanya separuh simpul (acak)
+#              yang diperbarui agar tidak berosilasi.
+#   louvain  : optimisasi modularitas gaya Louvain. Fase pindah lokal dihitung
+#              paralel: gain modularitas setiap (simpul, komunitas tetangga)
+#              sekaligus, sebagian simpul acak (PELUANG_PINDAH) dengan gain
+#              positif pindah (singleton ke singleton hanya ke label lebih
+#              kecil, agar tidak saling bertukar); modularitas terbaik
+#              disimpan. Seperti Leiden, komunitas yang tidak terhubung
+#              dipecah per komponen (modularitas tidak pernah turun), lalu
+#              komunitas digabung menjadi simpul super dan fase diulang
+#              sampai tidak ada perubahan.
+#
+# Setiap metode dijalankan dengan beberapa seed (--seed=N), bisa di beberapa
+# proses paralel (--proses=P). Hasil seed dinilai terhadap setiap file gt
+# (ARI / NMI, lihat evaluasi_gt.evaluasi_grouping), dan grouping seed dengan
+# modularitas terbaik disimpan dalam format file gt (1 baris = 1 grup) sehingga
+# bisa dipakai lagi oleh evaluasi_gt.py.
+#
+# Contoh:
+#
+# python komunitas.py dir_g21_small_workload_with_gt dir_g21_small_workload_with_gt/groupings.gt.txt
+# python komunitas.py dir_g22_extra_graph_with_gt/dir_edges \
+#     dir_g22_extra_graph_with_gt/candidate_gt.minPrefix5.txt --seed=8 --proses=4
+
+import sys
+import os
+import csv
+import time
+import numpy as np
+from multiprocessing import Pool
+
+from muat_edges import baca_folder_array, intern_node
+from evaluasi_gt import baca_grouping, evaluasi_grouping
+import metrik
+import indeks_graf
+import dedup_file
+import pipeline_baca
+
+METODE = ('lp', 'louvain')
+MAKS_ITER = 50
+ITER_TANPA_PERBAIKAN = 5
+PELUANG_LP = 0.5
+PELUANG_PINDAH = 0.8
+
+_metode = METODE
+_n_seed = 1
+_n_proses = 1
+
+
+# --- GRAF BERBOBOT ---
+def graf_berbobot(arr):
+    """
+    Graf tak berarah berbobot dari dict array muat_edges. Mengembalikan
+    (node_ids, indptr, indices, bobot) CSR simetris, bobot = jumlah baris edge.
+    """
+    node_ids, s, d = intern_node(arr)
+    n = len(node_ids)
+    bukan_loop = s != d
+    a = np.minimum(s, d)[bukan_loop].astype(np.int64)
+    b = np.maximum(s, d)[bukan_loop].astype(np.int64)
+    kunci, jumlah = np.unique((a << 32) | b, return_counts=True)
+    a, b = kunci >> 32, kunci & 0xFFFFFFFF
+    src = np.concatenate((a, b))
+    dst = np.concatenate((b, a))
+    bobot = np.concatenate((jumlah, jumlah))
+    urut = np.lexsort((dst, src))
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(src, minlength=n), out=indptr[1:])
+    return node_ids, indptr, dst[urut].astype(np.int32), bobot[urut].astype(np.int64)
+
+
+def _arc(indptr, indices, bobot):
+    """Daftar arc (src, dst, bobot) dari CSR."""
+    src = np.repeat(np.arange(len(indptr) - 1, dtype=np.int64), np.diff(indptr))
+    return src, indices.astype(np.int64), bobot.astype(np.float64)
+
+
+def _rapatkan(label):
+    """Label dipetakan ke 0..k-1."""
+    return np.unique(label, return_inverse=True)[1].astype(np.int64)
+
+
+def modularitas(src, dst, w, label, resolusi=1.0):
+    """Modularitas Newman dari daftar arc simetris (setiap edge muncul dua arah)."""
+    m2 = w.sum()
+    if m2 == 0:
+        return 0.0
+    tot = np.bincount(label[src], weights=w, minlength=label.max() + 1)
+    dalam = w[label[src] == label[dst]].sum()
+    return float(dalam / m2 - resolusi * np.square(tot / m2).sum())
+
+
+def _bobot_ke_label(src, dst, w, label, n):
+    """
+    Bobot setiap simpul ke setiap label tetangga: (simpul, label, bobot),
+    terurut per simpul. Self-loop diabaikan.
+    """
+    bukan_loop = src != dst
+    kunci = src[bukan_loop] * n + label[dst[bukan_loop]]
+    urut = np.argsort(kunci)
+    kunci = kunci[urut]
+    awal = _awal(kunci)
+    bobot = np.add.reduceat(w[bukan_loop][urut], awal) if len(awal) else np.zeros(0)
+    kunci = kunci[awal]
+    return kunci // n, kunci % n, bobot
+
+
+def _awal(x):
+    """Posisi awal setiap grup nilai sama berurutan di x."""
+    beda = np.ones(len(x), dtype=bool)
+    beda[1:] = x[1:] != x[:-1]
+    return np.flatnonzero(beda)
+
+
+def _terbaik_per_simpul(i, skor, rng):
+    """
+    Indeks baris dengan skor terbesar per simpul i (i terurut, seri dipecah
+    acak). Dua max-reduce per segmen, tanpa sort.
+    """
+    awal = _awal(i)
+    panjang = np.diff(np.append(awal, len(i)))
+    calon = skor >= np.repeat(np.maximum.reduceat(skor, awal), panjang)
+    acak = np.where(calon, rng.random(len(skor)), -1.0)
+    pilih = np.flatnonzero(acak == np.repeat(np.maximum.reduceat(acak, awal), panjang))
+    return pilih[_awal(i[pilih])]
+
+
+# --- LABEL PROPAGATION ---
+def label_propagation(indptr, indices, bobot, seed=0, maks_iter=MAKS_ITER):
+    """Label komunitas (0..k-1) per simpul dengan label propagation semi-sinkron."""
+    rng = np.random.default_rng(seed)
+    src, dst, w = _arc(indptr, indices, bobot)
+    n = len(indptr) - 1
+    label = np.arange(n, dtype=np.int64)
+    for _ in range(maks_iter):
+        i, c, kic = _bobot_ke_label(src, dst, w, label, n)
+        # Bobot bilangan bulat: +0.5 hanya memenangkan seri untuk label sendiri
+        skor = kic + 0.5 * (c == label[i])
+        pilih = _terbaik_per_simpul(i, skor, rng)
+        bi, bc = i[pilih], c[pilih]
+        ganti = (bc != label[bi])
+        if not ganti.any():
+            break
+        ganti &= rng.random(len(bi)) < PELUANG_LP
+        label[bi[ganti]] = bc[ganti]
+    return _rapatkan(label)
+
+
+# --- LOUVAIN ---
+def _pindah_lokal(src, dst, w, n, rng, resolusi):
+    """Fase pindah lokal paralel. Mengembalikan label (rapat) dengan modularitas terbaik."""
+    k = np.bincount(src, weights=w, minlength=n)
+    m2 = w.sum()
+    label = np.arange(n, dtype=np.int64)
+    terbaik, q_terbaik = label.copy(), modularitas(src, dst, w, label, resolusi)
+    tanpa_perbaikan = 0
+    for _ in range(MAKS_ITER):
+        tot = np.bincount(label, weights=k, minlength=n)
+        ukuran = np.bincount(label, minlength=n)
+        i, c, kic = _bobot_ke_label(src, dst, w, label, n)
+        sendiri = c == label[i]
+        # Gain (dikali m) memindahkan i yang sudah dilepas dari komunitasnya ke c
+        gain = kic - resolusi * (tot[c] - np.where(sendiri, k[i], 0.0)) * k[i] / m2
+        tetap = -resolusi * (tot[label] - k) * k / m2
+        tetap[i[sendiri]] = gain[sendiri]
+        pilih = _terbaik_per_simpul(i, gain, rng)
+        bi, bc = i[pilih], c[pilih]
+        pindah = (bc != label[bi]) & (gain[pilih] > tetap[bi] + 1e-9)
+        # Dua singleton yang saling memilih akan bertukar terus: hanya ke label lebih kecil
+        pindah &= ~((ukuran[label[bi]] == 1) & (ukuran[bc] == 1) & (bc > label[bi]))
+        if not pindah.any():
+            break
+        pindah &= rng.random(len(bi)) < PELUANG_PINDAH
+        label[bi[pindah]] = bc[pindah]
+        q = modularitas(src, dst, w, label, resolusi)
+        if q > q_terbaik + 1e-9:
+            terbaik, q_terbaik, tanpa_perbaikan = label.copy(), q, 0
+        else:
+            tanpa_perbaikan += 1
+            if tanpa_perbaikan >= ITER_TANPA_PERBAIKAN:
+                break
+    return _rapatkan(terbaik)
+
+
+def _pecah_tak_terhubung(src, dst, label, n):
+    """Komunitas yang tidak terhubung dipecah per komponen terhubung."""
+    from scipy.sparse import coo_matrix
+    from scipy.sparse.csgraph import connected_components
+
+    dalam = label[src] == label[dst]
+    adj = coo_matrix((np.ones(int(dalam.sum()), dtype=np.int8), (src[dalam], dst[dalam])), shape=(n, n))
+    return connected_components(adj.tocsr(), directed=False)[1].astype(np.int64)
+
+
+def louvain(indptr, indices, bobot, seed=0, resolusi=1.0):
+    """Label komunitas (0..k-1) per simpul dengan optimisasi modularitas bertingkat."""
+    rng = np.random.default_rng(seed)
+    src, dst, w = _arc(indptr, indices, bobot)
+    n = len(indptr) - 1
+    komunitas = np.arange(n, dtype=np.int64)
+    while True:
+        label = _pindah_lokal(src, dst, w, n, rng, resolusi)
+        label = _pecah_tak_terhubung(src, dst, label, n)
+        k = int(label.max()) + 1 if n else 0
+        if k == n:
+            break
+        komunitas = label[komunitas]
+        # Agregasi: komunitas menjadi simpul super (edge internal jadi self-loop)
+        kunci, inv = np.unique(label[src] * k + label[dst], return_inverse=True)
+        src, dst, w = kunci // k, kunci % k, np.bincount(inv.ravel(), weights=w)
+        n = k
+    return _rapatkan(komunitas)
+
+
+# --- JALANKAN BANYAK SEED ---
+_graf = None
+
+
+def _init_worker(indptr, indices, bobot):
+    global _graf
+    _graf = (indptr, indices, bobot)
+
+
+def _jalankan(tugas):
+    metode, seed = tugas
+    mulai = time.perf_counter()
+    fungsi = label_propagation if metode == 'lp' else louvain
+    label = fungsi(*_graf, seed=seed)
+    return metode, seed, label, time.perf_counter() - mulai
+
+
+def jalankan_semua(indptr, indices, bobot, metode=METODE, n_seed=1, n_proses=1):
+    """List (metode, seed, label, detik) untuk setiap metode x seed."""
+    tugas = [(m, s) for m in metode for s in range(n_seed)]
+    with metrik.fase('komunitas'):
+        if n_proses > 1 and len(tugas) > 1:
+            with Pool(min(n_proses, len(tugas)), initializer=_init_worker,
+                      initargs=(indptr, indices, bobot)) as pool:
+                return pool.map(_jalankan, tugas)
+        _init_worker(indptr, indices, bobot)
+        return [_jalankan(t) for t in tugas]
+
+
+# --- FLAG COMMAND LINE ---
+def dari_argv(argv):
+    """Membuang '--metode=lp,louvain', '--seed=N', '--proses=P' dari argv dan mengaturnya."""
+    global _metode, _n_seed, _n_proses
+    sisa = []
+    for arg in argv:
+        nama, _, nilai = arg.partition('=')
+        if nama == '--metode':
+            pilihan = tuple(nilai.split(','))
+            if not nilai or any(m not in METODE for m in pilihan):
+                print(f"[ERROR] Nilai --metode '{nilai}' tidak valid (pilihan: {', '.join(METODE)})")
+                sys.exit(1)
+            _metode = pilihan
+        elif nama in ('--seed', '--proses'):
+            if not nilai.isdigit() or int(nilai) < 1:
+                print(f"[ERROR] Nilai {nama} '{nilai}' tidak valid (bilangan bulat >= 1)")
+                sys.exit(1)
+            if nama == '--seed':
+                _n_seed = int(nilai)
+            else:
+                _n_proses = int(nilai)
+        else:
+            sisa.append(arg)
+    return sisa
+
+
+# --- FUNGSI UTAMA ---
+def main(path, gt_files):
+    daftar_gt = [(os.path.basename(f), baca_grouping(f)) for f in gt_files]
+    wload_to_arrays, files = baca_folder_array(path)
+    print(f'\n# Done reading from {len(files)} file(s).')
+    if not wload_to_arrays:
+        print("\n[!] Tidak ada graf yang ditemukan.")
+        return
+
+    kolom_gt = ''.join(f" {'ARI ' + nama[:10]:>15} {'NMI':>6}" for nama, _ in daftar_gt)
+    baris_csv = []
+    for w in sorted(wload_to_arrays):
+        with metrik.fase('graf_berbobot'):
+            node_ids, indptr, indices, bobot = graf_berbobot(wload_to_arrays[w])
+        print(f"\n# Graf {w}: {len(node_ids)} simpul, {len(indices) // 2} edge tak berarah, "
+              f"{len(_metode)} metode x {_n_seed} seed, {_n_proses} proses")
+        hasil = jalankan_semua(indptr, indices, bobot, _metode, _n_seed, _n_proses)
+
+        src, dst, wt = _arc(indptr, indices, bobot)
+        q = [modularitas(src, dst, wt, label) for _, _, label, _ in hasil]
+        id_str = node_ids.astype(str)
+        grouping = [dict(zip(id_str, label.tolist())) for _, _, label, _ in hasil]
+        skor = [evaluasi_grouping(node_gt, grouping)[0] for _, node_gt in daftar_gt]
+
+        print(f"{'Metode':<8} {'Seed':>5} {'Komunitas':>10} {'Modularitas':>12} {'Detik':>7}{kolom_gt}")
+        print('-' * (46 + 23 * len(daftar_gt)))
+        for r, (metode, seed, label, detik) in enumerate(hasil):
+            teks_gt = ''.join(f" {s['ari'][r]:>15.4f} {s['nmi'][r]:>6.3f}" for s in skor)
+            print(f"{metode:<8} {seed:>5} {int(label.max()) + 1:>10} {q[r]:>12.4f} {detik:>7.2f}{teks_gt}")
+            baris = [w, metode, seed, int(label.max()) + 1, f"{q[r]:.6f}", f"{detik:.3f}"]
+            for (nama, _), s in zip(daftar_gt, skor):
+                baris += [nama, f"{s['ari'][r]:.6f}", f"{s['nmi'][r]:.6f}", f"{s['purity'][r]:.6f}"]
+            baris_csv.append(baris)
+
+        # Grouping seed terbaik (modularitas) per metode, format file gt
+        for metode in _metode:
+            r = max((r for r in range(len(hasil)) if hasil[r][0] == metode), key=lambda r: q[r])
+            label = hasil[r][2]
+            urut = np.argsort(label, kind='stable')
+            batas = np.flatnonzero(np.diff(label[urut])) + 1
+            grup = sorted(np.split(id_str[urut], batas), key=len, reverse=True)
+            output_grup = f"komunitas_{w}_{metode}.txt"
+            try:
+                with open(output_grup, 'w', encoding='utf-8') as f:
+                    f.write(f"# {metode} seed={hasil[r][1]} modularitas={q[r]:.6f}\n")
+                    f.writelines(','.join(g) + '\n' for g in grup)
+                print(f"[OK] Grouping {metode} (seed {hasil[r][1]}) disimpan di: {output_grup}")
+            except Exception as e:
+                print(f"[ERROR] Gagal menyimpan {output_grup}: {e}")
+
+    # --- SIMPAN KE CSV ---
+    output_csv = "komunitas.csv"
+    try:
+        with open(output_csv, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            header = ['Graph ID', 'Metode', 'Seed', 'Jumlah Komunitas', 'Modularitas', 'Detik']
+            for _ in daftar_gt:
+                header += ['File GT', 'ARI', 'NMI', 'Purity']
+            writer.writerow(header)
+            writer.writerows(baris_csv)
+        print(f"\n[SUKSES] Ringkasan komunitas disimpan di: {output_csv}\n")
+    except Exception as e:
+        print(f"\n[ERROR] Gagal menyimpan CSV: {e}")
+
+
+if __name__ == '__main__':
+    sys.argv = dari_argv(pipeline_baca.dari_argv(dedup_file.dari_argv(indeks_graf.dari_argv(
+        metrik.dari_argv(sys.argv)))))
+    if len(sys.argv) < 2:
+        print("Usage: python komunitas.py <folder_name> [file_gt ...] [--metode=lp,louvain] [--seed=N] "
+              "[--proses=P] [--graph <id>] [--prefetch=N] [--metrik[=file.json]] [--profile[=file.prof]]")
+        sys.exit(1)
+
+    path = sys.argv[1]
+    if not os.path.exists(path):
+        print(f"[ERROR] Folder '{path}' tidak ditemukan!")
+        sys.exit(1)
+
+    for gt_file in sys.argv[2:]:
+        if not os.path.isfile(gt_file):
+            print(f"[ERROR] File '{gt_file}' tidak ditemukan!")
+            sys.exit(1)
+
+    main(path, sys.argv[2:])
@@ -0,0 +1,174 @@
+#!/usr/bin/python
+
+# Instrumentasi ringan untuk pembaca dan laporan:
+#   - timer per fase (wall + CPU), lewat:  with metrik.fase('baca_parse'): ...
+#   - penghitung (baris, byte, file, ...) lewat metrik.tambah()
+#   - baris yang ditolak per alasan lewat metrik.tolak()
+#   - peak RSS proses (Unix; 0 di platform tanpa modul resource)
+# Penghitung di loop per baris tetap variabel lokal biasa; modul ini hanya
+# menerima totalnya per file, jadi overhead-nya di bawah beberapa persen.
+#
+# Skrip yang memakai metrik.dari_argv() menerima flag tambahan:
+#   --metrik[=file.json]    simpan metrik ke JSON (default metrik_<skrip>.json)
+#   --profile[=file.prof]   jalankan di bawah cProfile, simpan stats dan cetak top fungsi
+#
+# Catatan: metrik dicatat per proses (worker multiprocessing tidak ikut dijumlah).
+#
+# Contoh:
+#
+# python read_graphs.py dir_g21_small_workload_with_gt/dir_no_packets_etc --metrik
+# python graf.py total,derajat dir_g22_extra_graph_with_gt/dir_edges --profile
+
+import os
+import sys
+import time
+import json
+import atexit
+from collections import Counter
+from contextlib import contextmanager
+
+# resource hanya ada di Unix; di Windows peak RSS dilaporkan 0
+try:
+    import resource
+except ImportError:
+    resource = None
+
+_fase = {}          # nama -> [wall, cpu, jumlah panggilan]
+_hitung = Counter()  # baris, byte, file, ...
+_tolak = Counter()   # alasan -> jumlah baris
+_mulai = time.perf_counter()
+_mulai_cpu = time.process_time()
+
+
+# --- FUNGSI PENCATAT ---
+@contextmanager
+def fase(nama):
+    """Menambah waktu wall dan CPU blok ini ke fase 'nama' (boleh dipanggil berulang)."""
+    w, c = time.perf_counter(), time.process_time()
+    try:
+        yield
+    finally:
+        f = _fase.get(nama)
+        if f is None:
+            f = _fase[nama] = [0.0, 0.0, 0]
+        f[0] += time.perf_counter() - w
+        f[1] += time.process_time() - c
+        f[2] += 1
+
+
+def tambah(nama, n=1):
+    _hitung[nama] += n
+
+
+def tolak(alasan):
+    """alasan: dict/Counter alasan -> jumlah baris yang ditolak."""
+    for k, n in alasan.items():
+        if n:
+            _tolak[k] += n
+
+
+def peak_rss_mb():
+    """Peak RSS proses ini dan anak-anaknya (mis. Pool multiprocessing), dalam MB (0 tanpa resource)."""
+    if resource is None:
+        return 0.0
+    diri = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    anak = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    # Linux: KB, macOS: byte
+    satuan = 1024 ** 2 if sys.platform == 'darwin' else 1024
+    return max(diri, anak) / satuan
+
+
+def reset():
+    global _mulai, _mulai_cpu
+    _fase.clear()
+    _hitung.clear()
+    _tolak.clear()
+    _mulai, _mulai_cpu = time.perf_counter(), time.process_time()
+
+
+# --- RINGKASAN ---
+def ringkasan():
+    wall = time.perf_counter() - _mulai
+    return {
+        'skrip': os.path.basename(sys.argv[0]),
+        'argv': sys.argv[1:],
+        'waktu': time.strftime('%Y-%m-%d %H:%M:%S'),
+        'wall_detik': round(wall, 4),
+        'cpu_detik': round(time.process_time() - _mulai_cpu, 4),
+        'peak_rss_mb': round(peak_rss_mb(), 1),
+        'fase': {k: {'wall_detik': round(w, 4), 'cpu_detik': round(c, 4), 'panggilan': n}
+                 for k, (w, c, n) in _fase.items()},
+        'hitung': dict(_hitung),
+        'baris_ditolak': dict(_tolak.most_common()),
+        'baris_per_detik': round(_hitung['baris'] / wall) if wall > 0 else 0,
+        'mb_per_detik': round(_hitung['byte'] / 1024 ** 2 / wall, 3) if wall > 0 else 0,
+    }
+
+
+def cetak_ringkasan(r):
+    print(f"\n# METRIK: wall={r['wall_detik']:.2f}s cpu={r['cpu_detik']:.2f}s "
+          f"peak RSS={r['peak_rss_mb']:.1f} MB, {r['hitung'].get('baris', 0)} baris "
+          f"({r['baris_per_detik']} baris/detik)")
+    for nama, f in sorted(r['fase'].items(), key=lambda x: -x[1]['wall_detik']):
+        print(f"#   {nama:<24} wall={f['wall_detik']:>9.3f}s cpu={f['cpu_detik']:>9.3f}s  x{f['panggilan']}")
+    if r['baris_ditolak']:
+        print(f"#   baris ditolak: {r['baris_ditolak']}")
+
+
+def simpan(output_json):
+    r = ringkasan()
+    cetak_ringkasan(r)
+    try:
+        with open(output_json, 'w', encoding='utf-8') as f:
+            json.dump(r, f, indent=2)
+        print(f"[INFO] Metrik disimpan ke: {output_json}")
+    except Exception as e:
+        print(f"[ERROR] Gagal menyimpan metrik: {e}")
+
+
+# --- FLAG COMMAND LINE ---
+def _nilai_flag(arg, nama, default):
+    if arg == nama:
+        return default
+    if arg.startswith(nama + '='):
+        return arg[len(nama) + 1:]
+    return None
+
+
+def dari_argv(argv):
+    """
+    Membuang flag --metrik / --profile dari argv dan mengaktifkannya.
+    Mengembalikan argv tanpa flag (untuk dicek 'Usage' seperti biasa).
+    """
+    skrip = os.path.splitext(os.path.basename(argv[0]))[0]
+    sisa, output_json, output_prof = [], None, None
+    for arg in argv:
+        j = _nilai_flag(arg, '--metrik', f"metrik_{skrip}.json")
+        p = _nilai_flag(arg, '--profile', f"profile_{skrip}.prof")
+        if j is not None:
+            output_json = j
+        elif p is not None:
+            output_prof = p
+        else:
+            sisa.append(arg)
+
+    if output_prof is not None:
+        import cProfile
+        profiler = cProfile.Profile()
+        output_json = output_json or f"metrik_{skrip}.json"
+
+        def _selesai_profile():
+            profiler.disable()
+            import pstats
+            profiler.dump_stats(output_prof)
+            print(f"\n# PROFILE (top 20 cumulative), lengkap di: {output_prof}")
+            pstats.Stats(profiler).sort_stats('cumulative').print_stats(20)
+
+        # atexit LIFO: profile dihentikan dulu, baru metrik disimpan
+        atexit.register(simpan, output_json)
+        atexit.register(_selesai_profile)
+        profiler.enable()
+    elif output_json is not None:
+        atexit.register(simpan, output_json)
+
+    return sisa
@@ -0,0 +1,328 @@
+#!/usr/bin/python
+
+# Deteksi simpul dengan tetangga hampir sama (near-duplicate neighbourhood)
+# memakai MinHash + LSH banding, untuk menemukan simpul dengan peran yang sama
+# (misal "launcher1" dan "launcher2" di README).
+#
+# Himpunan tetangga sebuah simpul = out-neighbour (server yang dihubungi) dan
+# in-neighbour (client yang menghubungi), arah dibedakan. Signature MinHash
+# dibangun secara streaming per file (tidak perlu menyimpan himpunan tetangga),
+# file dibagi ke beberapa proses lalu signature digabung dengan minimum.
+# LSH: signature dipotong menjadi b band x r baris; simpul dengan band yang sama
+# menjadi kandidat, lalu diverifikasi dengan estimasi Jaccard (fraksi hash sama).
+
+# Contoh:
+#
+# python minhash_lsh.py dir_g22_extra_graph_with_gt/dir_edges e1 0.8 128 4
+
+import sys
+import os
+import re
+import csv
+import time
+import numpy as np
+from multiprocessing import Pool
+
+try:
+    import scipy.sparse as sp
+    from scipy.sparse.csgraph import connected_components
+except ImportError as e:
+    print(f"\n[ERROR FATAL] Library belum lengkap: {e}")
+    print("Silakan jalankan perintah ini di terminal:")
+    print("pip install numpy scipy")
+    sys.exit(1)
+
+from muat_edges import daftar_file_edges, baca_file_array, kunci_edge, pecah_kunci_edge
+import indeks_graf
+
+MAKS_UINT64 = np.iinfo(np.uint64).max
+UKURAN_POTONGAN = 65536
+
+
+# --- FUNGSI HASH ---
+def _mix64(x):
+    """Finalizer splitmix64 (vektor uint64, overflow dibiarkan wrap-around)."""
+    x = x ^ (x >> np.uint64(30))
+    x = x * np.uint64(0xBF58476D1CE4E5B9)
+    x = x ^ (x >> np.uint64(27))
+    x = x * np.uint64(0x94D049BB133111EB)
+    return x ^ (x >> np.uint64(31))
+
+
+def seed_permutasi(num_perm, seed=1):
+    rng = np.random.default_rng(seed)
+    return rng.integers(0, MAKS_UINT64, size=num_perm, dtype=np.uint64, endpoint=True)
+
+
+def koefisien_hash(num_perm, seed=1):
+    """Koefisien (a, b) untuk h_i(x) = a_i * x + b_i (mod 2^64), a_i ganjil."""
+    rng = np.random.default_rng(seed)
+    a = rng.integers(0, MAKS_UINT64, size=num_perm, dtype=np.uint64, endpoint=True) | np.uint64(1)
+    b = rng.integers(0, MAKS_UINT64, size=num_perm, dtype=np.uint64, endpoint=True)
+    return a, b
+
+
+def hash_token(tokens, koef):
+    """
+    Nilai hash (num_perm, n_token) untuk setiap 'permutasi' dan setiap token.
+    Token diacak sekali dengan splitmix64, lalu tiap permutasi cukup satu kali
+    kali-tambah (seperti (a*x + b) mod p pada MinHash klasik).
+    """
+    a, b = koef
+    with np.errstate(over='ignore'):
+        x = _mix64(tokens.astype(np.uint64))
+        return a[:, None] * x[None, :] + b[:, None]
+
+
+# --- SIGNATURE (STREAMING) ---
+def _min_per_node(node, h, terurut=False):
+    """
+    Minimum kolom h (num_perm, m) per node (node boleh berulang).
+    Mengembalikan (node_unik, sig (num_perm, n_unik)). Layout permutasi x simpul
+    membuat reduceat berjalan di memori yang berurutan.
+    """
+    if not terurut:
+        urut = np.argsort(node, kind='stable')
+        node = node[urut]
+        h = h[:, urut]
+    awal = np.flatnonzero(np.concatenate(([True], node[1:] != node[:-1])))
+    return node[awal], np.minimum.reduceat(h, awal, axis=1)
+
+
+def gabung_signature(a, b):
+    """Menggabungkan dua state (node_ids, sig) dengan minimum per node."""
+    if a is None:
+        return b
+    if b is None:
+        return a
+    node = np.concatenate((a[0], b[0]))
+    sig = np.concatenate((a[1], b[1]), axis=1)
+    return _min_per_node(node, sig)
+
+
+def _state_baru(num_perm):
+    """State signature satu worker: kolom per simpul, diperbarui di tempat."""
+    return {'ids': np.zeros(0, dtype=np.int64), 'kolom': np.zeros(0, dtype=np.int64),
+            'sig': np.full((num_perm, 1024), MAKS_UINT64, dtype=np.uint64), 'n': 0}
+
+
+def _update_state(state, node_unik, part):
+    """Minimum signature parsial (node_unik terurut, part (num_perm, m)) ke state."""
+    ids = state['ids']
+    pos = np.searchsorted(ids, node_unik)
+    ada = pos < len(ids)
+    ada[ada] = ids[pos[ada]] == node_unik[ada]
+
+    baru = node_unik[~ada]
+    if len(baru):
+        n = state['n']
+        if n + len(baru) > state['sig'].shape[1]:
+            kapasitas = max(2 * state['sig'].shape[1], n + len(baru))
+            sig = np.full((state['sig'].shape[0], kapasitas), MAKS_UINT64, dtype=np.uint64)
+            sig[:, :n] = state['sig'][:, :n]
+            state['sig'] = sig
+        kolom_baru = np.arange(n, n + len(baru))
+        sisip = np.searchsorted(ids, baru)
+        state['ids'] = np.insert(ids, sisip, baru)
+        state['kolom'] = np.insert(state['kolom'], sisip, kolom_baru)
+        state['n'] = n + len(baru)
+
+    kolom = state['kolom'][np.searchsorted(state['ids'], node_unik)]
+    state['sig'][:, kolom] = np.minimum(state['sig'][:, kolom], part)
+
+
+def _state_final(state):
+    """(node_ids terurut, sig (num_perm, n)) dari state worker."""
+    return state['ids'], state['sig'][:, state['kolom']]
+
+
+def signature_file(edges_file, file_idx, koef, graph_id=None, states=None):
+    """
+    Memperbarui signature dari satu file. states: dict wload -> state worker
+    (dibuat jika belum ada). Mengembalikan states.
+    """
+    if states is None:
+        states = {}
+    for w, arr in baca_file_array(edges_file, file_idx, verbose=False).items():
+        if graph_id is not None and w != graph_id:
+            continue
+        # Edge unik di file ini (duplikat tidak mengubah minimum)
+        src, dst = pecah_kunci_edge(np.unique(kunci_edge(arr['src'], arr['dst'])))
+        # Token tetangga: 2v = out-neighbour v, 2u+1 = in-neighbour u
+        node = np.concatenate((src, dst))
+        token = np.concatenate((2 * dst, 2 * src + 1))
+        # Diurutkan per simpul sebelum di-hash agar tidak perlu mengacak matriks hash
+        urut = np.argsort(node, kind='stable')
+        node, token = node[urut], token[urut]
+        state = states.get(w)
+        if state is None:
+            state = states[w] = _state_baru(len(koef[0]))
+        # Diproses per potongan agar matriks hash (num_perm x n_token) tidak terlalu besar
+        for awal in range(0, len(token), UKURAN_POTONGAN):
+            akhir = awal + UKURAN_POTONGAN
+            node_unik, part = _min_per_node(node[awal:akhir], hash_token(token[awal:akhir], koef),
+                                            terurut=True)
+            _update_state(state, node_unik, part)
+    return states
+
+
+def _worker_signature(args):
+    files, koef, graph_id = args
+    states = {}
+    for file_idx, fname in files:
+        signature_file(fname, file_idx, koef, graph_id, states)
+    return {w: _state_final(st) for w, st in states.items()}
+
+
+def bangun_signature(path, num_perm=128, n_proses=1, graph_id=None, seed=1, verbose=True):
+    """
+    Signature MinHash semua simpul. Mengembalikan dict wload -> (node_ids, sig (n, num_perm)).
+    File dibagi ke n_proses worker; hasil parsial digabung dengan minimum.
+    """
+    files = list(enumerate(daftar_file_edges(path)))
+    koef = koefisien_hash(num_perm, seed)
+    if verbose:
+        print(f'# Membangun signature MinHash ({num_perm} hash) dari {len(files)} file, '
+              f'{n_proses} proses ...')
+
+    if n_proses <= 1 or len(files) <= 1:
+        parsial = [_worker_signature((files, koef, graph_id))]
+    else:
+        bagian = [(files[i::n_proses], koef, graph_id) for i in range(n_proses)]
+        with Pool(n_proses) as pool:
+            parsial = pool.map(_worker_signature, bagian)
+
+    state = {}
+    for p in parsial:
+        for w, part in p.items():
+            state[w] = gabung_signature(state.get(w), part)
+    # Untuk LSH dipakai layout simpul x permutasi
+    return {w: (node_ids, np.ascontiguousarray(sig.T)) for w, (node_ids, sig) in state.items()}
+
+
+# --- LSH BANDING ---
+def pilih_band(num_perm, threshold):
+    """
+    Memilih (b, r) dengan b * r <= num_perm sehingga titik belok kurva LSH
+    (1/b)^(1/r) paling dekat dengan threshold.
+    """
+    terbaik = None
+    for r in range(1, num_perm + 1):
+        b = num_perm // r
+        titik = (1.0 / b) ** (1.0 / r)
+        selisih = abs(titik - threshold)
+        if terbaik is None or selisih < terbaik[0]:
+            terbaik = (selisih, b, r)
+    return terbaik[1], terbaik[2]
+
+
+def kandidat_lsh(sig, b, r, threshold=0.8):
+    """
+    Pasangan kandidat dari LSH, diverifikasi dengan estimasi Jaccard >= threshold.
+    Dalam tiap bucket setiap anggota dipasangkan dengan anggota pertama (pemimpin)
+    sehingga jumlah pasangan linear terhadap ukuran bucket.
+    Mengembalikan (a, b, estimasi_jaccard) sebagai array.
+    """
+    n = sig.shape[0]
+    pengali = seed_permutasi(r, seed=12345) | np.uint64(1)
+    semua_a, semua_b = [], []
+    for band in range(b):
+        potong = sig[:, band * r:(band + 1) * r]
+        with np.errstate(over='ignore'):
+            kunci = _mix64((potong * pengali[None, :]).sum(axis=1, dtype=np.uint64))
+        urut = np.argsort(kunci, kind='stable')
+        k = kunci[urut]
+        awal_bucket = np.concatenate(([True], k[1:] != k[:-1]))
+        id_bucket = np.cumsum(awal_bucket) - 1
+        pemimpin = urut[np.flatnonzero(awal_bucket)][id_bucket]
+        anggota = ~awal_bucket
+        semua_a.append(pemimpin[anggota])
+        semua_b.append(urut[anggota])
+
+    if not semua_a:
+        kosong = np.zeros(0, dtype=np.int64)
+        return kosong, kosong, np.zeros(0)
+    pa = np.concatenate(semua_a)
+    pb = np.concatenate(semua_b)
+    pasang = np.unique(np.stack((np.minimum(pa, pb), np.maximum(pa, pb)), axis=1), axis=0)
+    pa, pb = pasang[:, 0], pasang[:, 1]
+
+    # Verifikasi per potongan agar memori tetap kecil
+    est = np.empty(len(pa))
+    for awal in range(0, len(pa), 100000):
+        akhir = awal + 100000
+        est[awal:akhir] = (sig[pa[awal:akhir]] == sig[pb[awal:akhir]]).mean(axis=1)
+    pilih = est >= threshold
+    return pa[pilih], pb[pilih], est[pilih]
+
+
+def cluster_pasangan(n, pa, pb):
+    adj = sp.coo_matrix((np.ones(len(pa), dtype=np.int8), (pa, pb)), shape=(n, n))
+    _, label = connected_components(adj, directed=False)
+    return label
+
+
+def main(path, graph_id=None, threshold=0.8, num_perm=128, n_proses=1):
+    print(f"\n{'='*80}")
+    print(f"{'MINHASH-LSH: SIMPUL DENGAN TETANGGA HAMPIR SAMA':^80}")
+    print(f"{'='*80}")
+
+    if graph_id is not None:
+        # File yang tidak berisi graf ini dilewati lewat indeks (worker mewarisi filter)
+        indeks_graf.pilih_graf(graph_id)
+    mulai = time.time()
+    state = bangun_signature(path, num_perm=num_perm, n_proses=n_proses, graph_id=graph_id)
+    print(f"# Signature selesai dalam {time.time() - mulai:.2f} detik")
+    if not state:
+        print("\n[!] Tidak ada graf yang ditemukan.")
+        return
+
+    b, r = pilih_band(num_perm, threshold)
+    print(f"# LSH: {b} band x {r} baris (threshold {threshold})")
+
+    for w in sorted(state, key=lambda k: len(state[k][0]), reverse=True):
+        node_ids, sig = state[w]
+        pa, pb, est = kandidat_lsh(sig, b, r, threshold)
+        label = cluster_pasangan(len(node_ids), pa, pb)
+        ukuran = np.bincount(label)
+        print(f"\nGraph={w}  simpul={len(node_ids)}  pasangan={len(pa)}  "
+              f"cluster 2+={int((ukuran >= 2).sum())}  terbesar={int(ukuran.max())}")
+
+        clean_id = re.sub(r'[^\w\-_]', '', w) or "unknown_graph"
+        output_csv = f"pasangan_minhash_{clean_id}.csv"
+        output_grouping = f"grouping_minhash_{clean_id}.txt"
+        try:
+            with open(output_csv, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f)
+                writer.writerow(['Node A', 'Node B', 'Estimasi Jaccard'])
+                for i in range(len(pa)):
+                    writer.writerow([node_ids[pa[i]], node_ids[pb[i]], f"{est[i]:.4f}"])
+
+            # Grouping (format groupings.gt.txt, grup kecil lebih dulu), hanya cluster 2+
+            urut = np.argsort(label, kind='stable')
+            batas = np.flatnonzero(np.diff(label[urut])) + 1
+            grup = sorted((g for g in np.split(urut, batas) if len(g) >= 2), key=len)
+            with open(output_grouping, 'w', encoding='utf-8') as f:
+                for g in grup:
+                    f.write(','.join(str(node_ids[i]) for i in g) + '\n')
+            print(f"[SUKSES] Pasangan disimpan di: {output_csv}")
+            print(f"[SUKSES] Cluster disimpan di: {output_grouping}")
+        except Exception as e:
+            print(f"[ERROR] Gagal menyimpan hasil: {e}")
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        print("Usage: python minhash_lsh.py <folder_name> [graph_id] [threshold] [num_perm] [n_proses]")
+        sys.exit(1)
+
+    path = sys.argv[1]
+    if not os.path.exists(path):
+        print(f"[ERROR] Folder '{path}' tidak ditemukan!")
+        sys.exit(1)
+
+    graph_id = sys.argv[2] if len(sys.argv) > 2 and sys.argv[2] != '-' else None
+    threshold = float(sys.argv[3]) if len(sys.argv) > 3 else 0.8
+    num_perm = int(sys.argv[4]) if len(sys.argv) > 4 else 128
+    n_proses = int(sys.argv[5]) if len(sys.argv) > 5 else os.cpu_count() or 1
+    main(path, graph_id, threshold, num_perm, n_proses)
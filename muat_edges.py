@@ -0,0 +1,345 @@
+#!/usr/bin/python
+
+# Pembaca edge file ke array numpy (kolom), dipakai oleh modul analisis lain.
+#
+# Format baris sama dengan read_graphs.py:  <graph id> <client> <server> <csv port>
+# contoh: g1  1  2  1p6-22,1p17-4
+#
+# Berbeda dengan read_graphs.py (dict of Counter), di sini setiap baris valid
+# disimpan sebagai elemen array:
+#   src, dst      : int64, node id asli (client -> server)
+#   file_idx      : int32, indeks file asal (urutan daftar_file_edges)
+#   port_off      : int64 (n_baris + 1), offset ke array port (gaya ragged column)
+#   port, proto   : int32, port dan protokol tiap token port
+#   paket         : int64, jumlah paket tiap token port
+# Token port di-parse sekaligus per file (join + translate + konversi numpy),
+# bukan satu per satu di Python.
+
+import sys
+import os
+import re
+import gzip
+import numpy as np
+from collections import Counter
+
+import metrik
+import indeks_graf
+import dedup_file
+import pipeline_baca
+
+# File metadata yang bukan edge (sama seperti filter di skrip lain)
+FILTER_METADATA = ('grouping', 'prefix', 'candidate', 'id_gt', '.', 'README')
+
+POLA_ID_GRAF = re.compile(r'^[A-Za-z0-9_\-]+$')
+POLA_BLOB = re.compile(r'^\d+p\d+-\d+(?:,\d+p\d+-\d+)*$')
+POLA_TOKEN = re.compile(r'^(\d+)p(\d+)(?:-(\d+))?$')
+
+_TRANSLASI_BLOB = str.maketrans({'p': ',', '-': ','})
+
+KOLOM_BARIS = ('src', 'dst', 'file_idx')
+KOLOM_PORT = ('port', 'proto', 'paket')
+
+# Batas node id agar (src, dst) muat dalam satu kunci int64
+BATAS_NODE = 1 << 31
+
+
+# --- FUNGSI BANTU ---
+def kunci_port(port, proto):
+    """Port dan protokol digabung jadi satu kunci int64 (protokol IP <= 255)."""
+    return (np.asarray(port, dtype=np.int64) << 8) | np.asarray(proto, dtype=np.int64)
+
+
+def kunci_edge(src, dst):
+    """
+    Edge berarah (src, dst) dipadatkan jadi satu kunci int64 (src di 32 bit atas),
+    sehingga himpunan edge bisa diurutkan / dibandingkan sebagai array 1 dimensi.
+    Node id di dataset adalah integer hasil de-identifikasi (< 2^31).
+    """
+    src = np.asarray(src, dtype=np.int64)
+    dst = np.asarray(dst, dtype=np.int64)
+    if len(src) and (max(src.max(), dst.max()) >= BATAS_NODE or min(src.min(), dst.min()) < 0):
+        raise ValueError('Node id di luar rentang kunci edge (0 .. 2^31-1).')
+    return (src << 32) | dst
+
+
+def pecah_kunci_edge(kunci):
+    """Kebalikan kunci_edge: mengembalikan (src, dst)."""
+    kunci = np.asarray(kunci, dtype=np.int64)
+    return kunci >> 32, kunci & 0xFFFFFFFF
+
+
+def nama_port(kunci):
+    """Kebalikan kunci_port, dalam format README: '1p6'."""
+    kunci = int(kunci)
+    return f"{kunci >> 8}p{kunci & 0xFF}"
+
+
+def tanda_irisan(a, b):
+    """
+    Dua array int64 terurut unik -> (mask_a, mask_b): elemen yang ada di kedua array.
+    Merge linear: argsort stabil (timsort) atas dua run terurut, elemen kembar
+    bersebelahan dengan elemen dari a selalu lebih dulu.
+    """
+    gabung = np.concatenate((a, b))
+    urut = np.argsort(gabung, kind='stable')
+    sama = np.flatnonzero(gabung[urut[1:]] == gabung[urut[:-1]])
+    mask_a = np.zeros(len(a), dtype=bool)
+    mask_b = np.zeros(len(b), dtype=bool)
+    mask_a[urut[sama]] = True
+    mask_b[urut[sama + 1] - len(a)] = True
+    return mask_a, mask_b
+
+
+def id_graf_valid(wload_id):
+    # Hapus ID Graf yang aneh-aneh (sama seperti read_graphs.py)
+    return len(wload_id) <= 15 and POLA_ID_GRAF.match(wload_id) is not None
+
+
+def buka_file(edges_file):
+    if edges_file.endswith('.gz'):
+        return gzip.open(edges_file, mode='rt', encoding='utf-8', errors='ignore')
+    return open(edges_file, mode='r', encoding='utf-8', errors='ignore')
+
+
+def daftar_file_edges(path, dedup=True):
+    """
+    Semua file edge di bawah path (rekursif, urut). File metadata dilewati.
+    Jika 'x.txt' dan 'x.txt.gz' sama-sama ada, hanya 'x.txt' yang dibaca
+    (isi sama, tidak perlu dekompresi dan tidak dihitung dua kali).
+    File yang isinya sama persis dengan file lain juga dilewati (dedup_file.py),
+    kecuali dedup=False (pembaca yang butuh setiap file di posisinya, mis. deret waktu).
+    """
+    if os.path.isfile(path):
+        return [path]
+
+    all_files = []
+    for root, dirs, files in os.walk(path):
+        dirs.sort()
+        for file in sorted(files):
+            if file.startswith(FILTER_METADATA):
+                continue
+            all_files.append(os.path.join(root, file))
+
+    ada = set(all_files)
+    all_files = [f for f in all_files if not (f.endswith('.gz') and f[:-3] in ada)]
+    # Filter --graph: file yang tidak berisi graf tsb (menurut indeks) tidak dibuka
+    all_files = indeks_graf.saring_file(all_files)
+    if not dedup:
+        return all_files
+    # Duplikat persis (mis. data_graf/ dan salinannya di luar) / file terkandung
+    return dedup_file.saring_file(all_files)
+
+
+def _blob_kanonik(blob):
+    """
+    Jalur lambat untuk blob port yang tidak standar: token tanpa 'p' dibuang,
+    paket yang tidak ada dianggap 0. Mengembalikan blob 'port p proto - paket' atau ''.
+    """
+    tokens = []
+    for token in blob.split(','):
+        m = POLA_TOKEN.match(token)
+        if not m:
+            continue
+        tokens.append(f"{m.group(1)}p{m.group(2)}-{m.group(3) or 0}")
+    return ','.join(tokens)
+
+
+def _blob_ke_array(blobs):
+    """List blob port (format standar) -> array (n_token, 3) int64: port, proto, paket."""
+    if not blobs:
+        return np.zeros((0, 3), dtype=np.int64)
+    teks = ','.join(blobs).translate(_TRANSLASI_BLOB)
+    return np.array(teks.split(','), dtype=np.int64).reshape(-1, 3)
+
+
+def _array_kosong():
+    return {
+        'src': np.zeros(0, dtype=np.int64),
+        'dst': np.zeros(0, dtype=np.int64),
+        'file_idx': np.zeros(0, dtype=np.int32),
+        'port_off': np.zeros(1, dtype=np.int64),
+        'port': np.zeros(0, dtype=np.int32),
+        'proto': np.zeros(0, dtype=np.int32),
+        'paket': np.zeros(0, dtype=np.int64),
+    }
+
+
+def _ke_array(src, dst, blobs, file_idx):
+    n_port = np.fromiter((b.count(',') + 1 for b in blobs), dtype=np.int64, count=len(blobs))
+    port_off = np.zeros(len(blobs) + 1, dtype=np.int64)
+    np.cumsum(n_port, out=port_off[1:])
+    tok = _blob_ke_array(blobs)
+    return {
+        'src': np.array(src, dtype=np.int64),
+        'dst': np.array(dst, dtype=np.int64),
+        'file_idx': np.full(len(blobs), file_idx, dtype=np.int32),
+        'port_off': port_off,
+        'port': tok[:, 0].astype(np.int32),
+        'proto': tok[:, 1].astype(np.int32),
+        'paket': tok[:, 2].copy(),
+    }
+
+
+# --- FUNGSI MEMBACA FILE ---
+def baca_file_array(edges_file, file_idx=0, verbose=True, isi=None):
+    """
+    Membaca satu file edge. Mengembalikan dict wload_id -> dict array (lihat atas).
+    Baris tanpa token port yang valid dilewati (sama seperti read_graphs.py).
+    isi: bytes file yang sudah dibaca di depan (pipeline_baca.py), atau
+    exception jika pembacaannya gagal; None = buka file di sini.
+    """
+    filename_only = os.path.basename(edges_file)
+    if filename_only.startswith(FILTER_METADATA):
+        metrik.tambah('file_dilewati')
+        return {}
+
+    if verbose:
+        print(f"   -> Cek file: {filename_only} ...", end=" ")
+
+    per_wload = {}   # wload -> (list src, list dst, list blob)
+    id_cache = {}
+    n_baris = 0
+    tolak = Counter()
+    prefix = indeks_graf.prefix_graf()
+    try:
+        if isinstance(isi, Exception):
+            raise isi
+        fopen = buka_file(edges_file) if isi is None else pipeline_baca.buka_isi(isi)
+        with fopen, metrik.fase('baca_parse'):
+            for line in fopen:
+                n_baris += 1
+                # Filter --graph: baris graf lain dibuang sebelum di-split
+                if prefix is not None and not line.startswith(prefix):
+                    tolak['graf_lain'] += 1
+                    continue
+                if line.startswith('#'):
+                    tolak['komentar'] += 1
+                    continue
+                parts = line.split()
+                if len(parts) < 4:
+                    tolak['kolom_kurang'] += 1
+                    continue
+                if not (parts[1].isdigit() and parts[2].isdigit()):
+                    tolak['node_bukan_angka'] += 1
+                    continue
+
+                wload_id = parts[0]
+                kolom = per_wload.get(wload_id)
+                if kolom is None:
+                    valid = id_cache.get(wload_id)
+                    if valid is None:
+                        valid = id_cache[wload_id] = id_graf_valid(wload_id)
+                    if not valid:
+                        tolak['id_graf_tidak_valid'] += 1
+                        continue
+                    kolom = per_wload[wload_id] = ([], [], [])
+
+                blob = parts[3]
+                if not POLA_BLOB.match(blob):
+                    blob = _blob_kanonik(blob)
+                    if not blob:
+                        tolak['tanpa_port'] += 1
+                        continue
+
+                kolom[0].append(parts[1])
+                kolom[1].append(parts[2])
+                kolom[2].append(blob)
+    except Exception as e:
+        if verbose:
+            print(f"[ERROR] {e}")
+        return {}
+
+    with metrik.fase('konversi_array'):
+        hasil = {w: _ke_array(s, d, b, file_idx) for w, (s, d, b) in per_wload.items()}
+
+    metrik.tambah('file')
+    metrik.tambah('baris', n_baris)
+    metrik.tambah('baris_valid', sum(len(a['src']) for a in hasil.values()))
+    metrik.tambah('byte', os.path.getsize(edges_file))
+    metrik.tolak(tolak)
+
+    if verbose:
+        total = sum(len(a['src']) for a in hasil.values())
+        if total > 0:
+            print(f"[OK] {total} edges.")
+        else:
+            print("[SKIP] Bukan data graf.")
+    return hasil
+
+
+def gabung_array(daftar):
+    """Menggabungkan beberapa dict array (satu workload) menjadi satu."""
+    daftar = [a for a in daftar if len(a['src']) > 0]
+    if not daftar:
+        return _array_kosong()
+    if len(daftar) == 1:
+        return daftar[0]
+
+    hasil = {k: np.concatenate([a[k] for a in daftar]) for k in KOLOM_BARIS + KOLOM_PORT}
+    # Offset port digeser sesuai jumlah token port file sebelumnya
+    geser = np.cumsum([0] + [a['port_off'][-1] for a in daftar[:-1]])
+    hasil['port_off'] = np.concatenate(
+        [np.zeros(1, dtype=np.int64)] + [a['port_off'][1:] + g for a, g in zip(daftar, geser)])
+    return hasil
+
+
+# --- FUNGSI SCAN FOLDER ---
+def baca_folder_array(path, verbose=True):
+    """
+    Membaca semua file edge di folder. Mengembalikan (wload_to_arrays, files)
+    dengan files = daftar file sesuai file_idx.
+    """
+    if verbose:
+        print(f'\n# Memulai SCAN di folder: {path}')
+    files = daftar_file_edges(path)
+    if verbose:
+        print(f'# Menemukan total {len(files)} file. Memproses...')
+
+    potongan = {}
+    if pipeline_baca.prefetch_aktif():
+        # File berikutnya dibaca/didekompresi di thread latar selagi file ini di-parse
+        sumber = pipeline_baca.prefetch(files, lewati=lambda f: os.path.basename(f).startswith(FILTER_METADATA))
+    else:
+        sumber = ((fname, None) for fname in files)
+    for i, (fname, isi) in enumerate(sumber):
+        for w, arr in baca_file_array(fname, i, verbose=verbose, isi=isi).items():
+            potongan.setdefault(w, []).append(arr)
+
+    with metrik.fase('gabung_array'):
+        wload_to_arrays = {w: gabung_array(p) for w, p in potongan.items()}
+    return wload_to_arrays, files
+
+
+def port_per_baris(arr):
+    """Indeks baris (edge) untuk setiap token port, sejajar dengan arr['port']."""
+    n_port = np.diff(arr['port_off'])
+    return np.repeat(np.arange(len(n_port), dtype=np.int64), n_port)
+
+
+def intern_node(arr):
+    """
+    Memetakan node id asli ke 0..n-1. Mengembalikan (node_ids, src_idx, dst_idx)
+    dengan node_ids terurut sehingga node_ids[src_idx] == arr['src'].
+    """
+    n = len(arr['src'])
+    node_ids, inv = np.unique(np.concatenate((arr['src'], arr['dst'])), return_inverse=True)
+    return node_ids, inv[:n], inv[n:]
+
+
+if __name__ == '__main__':
+    sys.argv = pipeline_baca.dari_argv(dedup_file.dari_argv(indeks_graf.dari_argv(metrik.dari_argv(sys.argv))))
+    if len(sys.argv) < 2:
+        print("Usage: python muat_edges.py <folder_name> [--graph <id>] [--containment[=tandai|lewati]] [--prefetch=N] [--metrik[=file.json]] [--profile[=file.prof]]")
+        sys.exit(1)
+
+    path = sys.argv[1]
+    if not os.path.exists(path):
+        print(f"[ERROR] Folder '{path}' tidak ditemukan!")
+        sys.exit(1)
+
+    wload_to_arrays, files = baca_folder_array(path)
+    print(f'\n# Done reading from {len(files)} file(s).\n')
+    print('Graph, lines, port tokens, packets')
+    for w in sorted(wload_to_arrays, key=lambda k: len(wload_to_arrays[k]['src']), reverse=True):
+        arr = wload_to_arrays[w]
+        print(w, len(arr['src']), len(arr['port']), int(arr['paket'].sum()))
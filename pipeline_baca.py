@@ -0,0 +1,253 @@
+#!/usr/bin/python
+
+# Pipeline baca dengan prefetch terbatas: I/O + dekompresi tumpang tindih
+# dengan parsing.
+#
+# Tanpa pipeline setiap pembaca bergantian: menunggu open/read (dan
+# dekompresi .gz), lalu mem-parse; CPU menganggur saat I/O dan sebaliknya.
+# Di sini satu thread latar belakang membaca isi file berikutnya (byte mentah,
+# .gz sudah didekompresi) ke antrean terbatas selagi file sekarang di-parse.
+# read()/zlib melepas GIL, jadi thread pembaca benar-benar berjalan paralel
+# dengan loop parse.
+#
+# Backpressure: antrean dibatasi jumlah file (n_prefetch) DAN total byte
+# (batas_byte); thread pembaca menunggu bila batas tercapai, jadi memori
+# tetap datar berapa pun jumlah file. File yang lebih besar dari batas_byte
+# tetap dibaca, tapi hanya saat antrean kosong.
+#
+# Konsumen menerima (nama_file, isi) berurutan; isi dibungkus buka_isi()
+# menjadi file teks (BytesIO tidak menyalin buffer), error baca diteruskan
+# sebagai exception dan dilaporkan oleh pembaca seperti error open biasa.
+#
+# Skrip yang memakai pipeline_baca.dari_argv() menerima flag:
+#   --prefetch=N   jumlah file yang dibaca di depan (default 2, 0 = mati)
+#
+# Contoh:
+#
+# python pipeline_baca.py dir_g22_extra_graph_with_gt/dir_edges     # benchmark dingin vs pipeline
+# python statistik_port.py dir_g22_extra_graph_with_gt/dir_edges --prefetch=4 --metrik
+
+import sys
+import os
+import io
+import gzip
+import time
+import queue
+import threading
+
+import metrik
+
+N_PREFETCH = 2
+BATAS_BYTE = 256 << 20
+
+_n_prefetch = N_PREFETCH
+_SELESAI = object()
+
+
+# --- FUNGSI BANTU ---
+def atur_prefetch(n):
+    """Jumlah file yang dibaca di depan (0 = pipeline mati)."""
+    global _n_prefetch
+    _n_prefetch = max(0, int(n))
+
+
+def prefetch_aktif():
+    return _n_prefetch > 0
+
+
+def baca_isi(filepath, dekompresi=True):
+    """Isi mentah satu file sebagai bytes (.gz didekompresi, kecuali dekompresi=False)."""
+    if dekompresi and filepath.endswith('.gz'):
+        with gzip.open(filepath, 'rb') as f:
+            return f.read()
+    with open(filepath, 'rb') as f:
+        return f.read()
+
+
+def buka_isi(isi):
+    """Isi bytes sebagai file teks, sama seperti muat_edges.buka_file."""
+    return io.TextIOWrapper(io.BytesIO(isi), encoding='utf-8', errors='ignore')
+
+
+# --- PIPELINE ---
+def prefetch(files, n_prefetch=None, batas_byte=BATAS_BYTE, lewati=None, dekompresi=True):
+    """
+    Generator (nama_file, isi) sesuai urutan files. isi = bytes, None jika
+    lewati(nama_file) True (file tidak dibaca), atau exception jika baca gagal.
+    dekompresi=False: .gz diteruskan apa adanya (pembaca yang membuka .gz sebagai teks).
+    """
+    n_prefetch = _n_prefetch if n_prefetch is None else n_prefetch
+    files = list(files)
+    if n_prefetch <= 0:
+        for fname in files:
+            if lewati is not None and lewati(fname):
+                yield fname, None
+                continue
+            try:
+                isi = baca_isi(fname, dekompresi)
+            except Exception as e:
+                # .gz terpotong/rusak: EOFError / zlib.error, bukan OSError
+                isi = e
+            yield fname, isi
+        return
+
+    antrean = queue.Queue(maxsize=n_prefetch)
+    kondisi = threading.Condition()
+    status = {'byte': 0, 'berhenti': False}
+
+    def taruh(item):
+        """put() yang berhenti bila konsumen sudah berhenti (antrean bisa penuh selamanya)."""
+        while not status['berhenti']:
+            try:
+                antrean.put(item, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def pembaca():
+        # Apa pun yang terjadi, konsumen selalu menerima _SELESAI (beserta
+        # error thread bila ada), kalau tidak antrean.get() menunggu selamanya
+        galat = None
+        try:
+            _baca_semua()
+        except BaseException as e:
+            galat = e
+        finally:
+            taruh((_SELESAI, galat, 0))
+
+    def _baca_semua():
+        for fname in files:
+            if lewati is not None and lewati(fname):
+                isi, ukuran = None, 0
+            else:
+                try:
+                    ukuran = os.path.getsize(fname)
+                except OSError:
+                    ukuran = 0
+                # Backpressure byte: tunggu sampai ada ruang (atau antrean kosong)
+                with kondisi:
+                    kondisi.wait_for(lambda: status['berhenti'] or status['byte'] == 0
+                                     or status['byte'] + ukuran <= batas_byte)
+                    if status['berhenti']:
+                        return
+                    status['byte'] += ukuran
+                try:
+                    isi = baca_isi(fname, dekompresi)
+                except Exception as e:
+                    # .gz terpotong/rusak: EOFError / zlib.error, bukan OSError
+                    isi = e
+                # .gz: yang ditahan di memori adalah ukuran setelah dekompresi
+                if isinstance(isi, bytes) and len(isi) != ukuran:
+                    with kondisi:
+                        status['byte'] += len(isi) - ukuran
+                    ukuran = len(isi)
+            if not taruh((fname, isi, ukuran)):
+                return
+
+    t = threading.Thread(target=pembaca, name='prefetch_baca', daemon=True)
+    t.start()
+    try:
+        while True:
+            with metrik.fase('tunggu_prefetch'):
+                fname, isi, ukuran = antrean.get()
+            if fname is _SELESAI:
+                if isi is not None:
+                    raise isi
+                break
+            try:
+                yield fname, isi
+            finally:
+                with kondisi:
+                    status['byte'] -= ukuran
+                    kondisi.notify_all()
+    finally:
+        # Konsumen berhenti di tengah: hentikan thread pembaca
+        with kondisi:
+            status['berhenti'] = True
+            kondisi.notify_all()
+        t.join()
+
+
+# --- FLAG COMMAND LINE ---
+def dari_argv(argv):
+    """Membuang '--prefetch=N' dari argv dan mengaturnya."""
+    sisa = []
+    for arg in argv:
+        if arg.startswith('--prefetch='):
+            nilai = arg.partition('=')[2]
+            if not nilai.isdigit():
+                print(f"[ERROR] Nilai --prefetch '{nilai}' tidak valid (bilangan bulat >= 0)")
+                sys.exit(1)
+            atur_prefetch(int(nilai))
+        else:
+            sisa.append(arg)
+    return sisa
+
+
+# --- BENCHMARK ---
+def _kosongkan_cache():
+    """Buang page cache (butuh root di Linux); False jika tidak bisa."""
+    try:
+        os.sync()
+        with open('/proc/sys/vm/drop_caches', 'w') as f:
+            f.write('3\n')
+        return True
+    except OSError:
+        return False
+
+
+def main(path):
+    from muat_edges import baca_folder_array, daftar_file_edges
+
+    files = daftar_file_edges(path)
+    total_mb = sum(os.path.getsize(f) for f in files) / 1024 ** 2
+    print(f"\n# Benchmark pipeline baca: {len(files)} file ({total_mb:.1f} MB) di: {path}")
+    dingin = _kosongkan_cache()
+    if not dingin:
+        print("[!] Page cache tidak bisa dikosongkan (bukan root?), hasil = cache hangat.")
+
+    hasil = {}
+    def ukur(nama, fungsi):
+        if dingin:
+            _kosongkan_cache()
+        w, c = time.perf_counter(), time.process_time()
+        fungsi()
+        hasil[nama] = (time.perf_counter() - w, time.process_time() - c)
+        print(f"   -> {nama:<24} wall={hasil[nama][0]:>7.2f}s cpu={hasil[nama][1]:>7.2f}s")
+
+    def hanya_io():
+        for _ in prefetch(files, n_prefetch=0):
+            pass
+
+    def parse_dengan(n):
+        def jalan():
+            atur_prefetch(n)
+            baca_folder_array(path, verbose=False)
+        return jalan
+
+    ukur('I/O saja', hanya_io)
+    ukur('berurutan (prefetch=0)', parse_dengan(0))
+    ukur(f'pipeline (prefetch={N_PREFETCH})', parse_dengan(N_PREFETCH))
+    atur_prefetch(N_PREFETCH)
+
+    io_w = hasil['I/O saja'][0]
+    seri_w = hasil['berurutan (prefetch=0)'][0]
+    pipa_w = hasil[f'pipeline (prefetch={N_PREFETCH})'][0]
+    parse_w = max(seri_w - io_w, 0.0)
+    print(f"\n# I/O={io_w:.2f}s parse~{parse_w:.2f}s -> jumlah={io_w + parse_w:.2f}s, "
+          f"max={max(io_w, parse_w):.2f}s, pipeline={pipa_w:.2f}s")
+
+
+if __name__ == '__main__':
+    sys.argv = dari_argv(metrik.dari_argv(sys.argv))
+    if len(sys.argv) < 2:
+        print("Usage: python pipeline_baca.py <folder_name> [--metrik[=file.json]] [--profile[=file.prof]]")
+        sys.exit(1)
+
+    path = sys.argv[1]
+    if not os.path.exists(path):
+        print(f"[ERROR] Folder '{path}' tidak ditemukan!")
+        sys.exit(1)
+
+    main(path)
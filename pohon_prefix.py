@@ -0,0 +1,301 @@
+#!/usr/bin/python
+
+# Membangun ulang pohon prefix (prefix tree / trie) hostname dari file kode prefix
+# (prefix_codes.txt untuk g21, id_gt_path_code.txt untuk e1).
+#
+# Setiap kode seperti "b2l7c192_b4l1c16_b1l1c9" adalah jalur dari root:
+# tiap segmen bXlYcZ = cabang ke-X, panjang prefix Y karakter, Z node di subtree.
+# Trie disimpan sebagai array (parent, panjang kumulatif, kedalaman) dan setiap
+# simpul graf punya jalur berupa baris array id node trie. Dengan begitu grouping
+# untuk panjang prefix minimum berapa pun (atau kedalaman berapa pun) dan query
+# longest-common-prefix antar pasangan simpul dihitung langsung di memori,
+# tanpa perlu membuat ulang file groupings.gt.viaPrefixN.txt.
+
+# Contoh:
+#
+# python pohon_prefix.py dir_g21_small_workload_with_gt/prefix_codes.txt
+# python pohon_prefix.py dir_g22_extra_graph_with_gt/id_gt_path_code.txt 1 20 \
+#     dir_g22_extra_graph_with_gt/candidate_gt.minPrefix5.txt
+
+import sys
+import os
+import re
+import csv
+import numpy as np
+
+POLA_SEGMEN = re.compile(r'^b(\d+)l(\d+)[cs](\d+)$')
+
+
+# --- FUNGSI MEMBACA FILE KODE PREFIX ---
+def baca_kode_prefix(kode_file):
+    """Membaca file 'node_id <tab> kode'. Mengembalikan list (node_id, kode)."""
+    hasil = []
+    with open(kode_file, 'r', encoding='utf-8', errors='ignore') as f:
+        for line in f:
+            if line.startswith('#'): continue
+            parts = line.split()
+            if len(parts) < 2: continue
+            hasil.append((parts[0], parts[1]))
+    return hasil
+
+
+# --- FUNGSI MEMBANGUN TRIE ---
+def bangun_trie(node_kode):
+    """
+    node_kode: list (node_id, kode prefix).
+
+    Mengembalikan dict trie:
+      'node_ids'  : list id simpul graf (urutan baris jalur)
+      'kode'      : list kode (string) untuk setiap node trie (prefix kode sampai node tsb)
+      'parent'    : array int32, parent tiap node trie (-1 untuk root)
+      'panjang'   : array int32, panjang prefix kumulatif (karakter) dari root
+      'kedalaman' : array int32, jumlah segmen dari root
+      'ukuran'    : array int32, jumlah node (cZ) menurut kode
+      'jalur'     : array int32 (n_simpul, kedalaman_maks), id node trie di sepanjang
+                    jalur tiap simpul, diisi -1 setelah ujung jalur
+      'ujung'     : array int32, node trie terakhir (daun) untuk tiap simpul
+    """
+    kode_to_id = {'': 0}
+    kode = ['']
+    parent = [-1]
+    panjang = [0]
+    kedalaman = [0]
+    ukuran = [0]
+
+    node_ids = []
+    daftar_jalur = []
+    for nid, k in node_kode:
+        jalur = []
+        cur = 0
+        prefix = ''
+        for seg in k.split('_'):
+            m = POLA_SEGMEN.match(seg)
+            if not m:
+                break
+            prefix = seg if prefix == '' else prefix + '_' + seg
+            nxt = kode_to_id.get(prefix)
+            if nxt is None:
+                nxt = len(kode)
+                kode_to_id[prefix] = nxt
+                kode.append(prefix)
+                parent.append(cur)
+                panjang.append(panjang[cur] + int(m.group(2)))
+                kedalaman.append(kedalaman[cur] + 1)
+                ukuran.append(int(m.group(3)))
+            jalur.append(nxt)
+            cur = nxt
+        if not jalur:
+            continue
+        node_ids.append(nid)
+        daftar_jalur.append(jalur)
+
+    maks = max((len(j) for j in daftar_jalur), default=0)
+    jalur_arr = np.full((len(daftar_jalur), maks), -1, dtype=np.int32)
+    for i, j in enumerate(daftar_jalur):
+        jalur_arr[i, :len(j)] = j
+    ujung = np.array([j[-1] for j in daftar_jalur], dtype=np.int32)
+
+    ukuran[0] = len(node_ids)
+    return {
+        'node_ids': node_ids,
+        'index': {n: i for i, n in enumerate(node_ids)},
+        'kode': kode,
+        'parent': np.array(parent, dtype=np.int32),
+        'panjang': np.array(panjang, dtype=np.int32),
+        'kedalaman': np.array(kedalaman, dtype=np.int32),
+        'ukuran': np.array(ukuran, dtype=np.int32),
+        'jalur': jalur_arr,
+        'ujung': ujung,
+    }
+
+
+def muat_trie(kode_file):
+    return bangun_trie(baca_kode_prefix(kode_file))
+
+
+# --- GROUPING ---
+def _panjang_jalur(trie):
+    """Panjang kumulatif di sepanjang jalur (n_simpul, kedalaman_maks), -1 di luar jalur."""
+    jalur = trie['jalur']
+    return np.where(jalur >= 0, trie['panjang'][np.maximum(jalur, 0)], -1)
+
+
+def grup_node_trie(trie, min_panjang=None, kedalaman=None):
+    """
+    Node trie yang menjadi grup tiap simpul (array int32, sejajar dengan node_ids).
+
+    min_panjang: grup = node trie pertama di jalur dengan panjang prefix kumulatif
+                 >= min_panjang (sama seperti groupings.gt.viaPrefix5.txt untuk 5).
+                 Simpul yang seluruh kodenya lebih pendek masuk grup daunnya sendiri.
+    kedalaman  : grup = node trie pada kedalaman tersebut (atau daun jika jalurnya
+                 lebih pendek).
+    """
+    jalur = trie['jalur']
+    n = jalur.shape[0]
+    if n == 0:
+        return np.zeros(0, dtype=np.int32)
+    baris = np.arange(n)
+
+    if kedalaman is not None:
+        kolom = np.minimum(kedalaman, (jalur >= 0).sum(axis=1)) - 1
+        kolom = np.maximum(kolom, 0)
+        return jalur[baris, kolom]
+
+    if min_panjang is None:
+        min_panjang = 0
+    cukup = _panjang_jalur(trie) >= min_panjang
+    ada = cukup.any(axis=1)
+    kolom = np.argmax(cukup, axis=1)
+    return np.where(ada, jalur[baris, kolom], trie['ujung'])
+
+
+def grouping(trie, min_panjang=None, kedalaman=None):
+    """
+    Mengembalikan list grup (list node id), urut dari grup terbesar,
+    beserta kode node trie tiap grup.
+    """
+    grup = grup_node_trie(trie, min_panjang=min_panjang, kedalaman=kedalaman)
+    ids, label = np.unique(grup, return_inverse=True)
+    ukuran = np.bincount(label)
+    urut_simpul = np.argsort(label, kind='stable')
+    batas = np.concatenate(([0], np.cumsum(ukuran)))
+
+    node_ids = trie['node_ids']
+    hasil = []
+    for g in np.argsort(-ukuran, kind='stable'):
+        anggota = [node_ids[i] for i in urut_simpul[batas[g]:batas[g + 1]]]
+        hasil.append((trie['kode'][ids[g]], anggota))
+    return hasil
+
+
+def node_to_grup(trie, min_panjang=None, kedalaman=None):
+    """Format sama dengan node_gt dari read_gt: dict node id -> nomor grup."""
+    grup = grup_node_trie(trie, min_panjang=min_panjang, kedalaman=kedalaman)
+    _, label = np.unique(grup, return_inverse=True)
+    return {n: int(label[i]) + 1 for i, n in enumerate(trie['node_ids'])}
+
+
+def sweep_grouping(trie, min_awal=1, min_akhir=20):
+    """
+    Label grup untuk setiap panjang prefix minimum sekaligus.
+    Mengembalikan (daftar_threshold, array label (n_threshold, n_simpul)).
+    """
+    thresholds = list(range(min_awal, min_akhir + 1))
+    cum = _panjang_jalur(trie)
+    jalur = trie['jalur']
+    baris = np.arange(jalur.shape[0])
+    labels = np.empty((len(thresholds), jalur.shape[0]), dtype=np.int64)
+    for t, L in enumerate(thresholds):
+        cukup = cum >= L
+        kolom = np.argmax(cukup, axis=1)
+        labels[t] = np.where(cukup.any(axis=1), jalur[baris, kolom], trie['ujung'])
+    return thresholds, labels
+
+
+# --- QUERY LONGEST COMMON PREFIX ---
+def lcp(trie, node_a, node_b):
+    """
+    Panjang longest common prefix (karakter) antara pasangan simpul.
+    node_a, node_b: node id tunggal atau list node id (dihitung sekaligus).
+    """
+    tunggal = isinstance(node_a, str)
+    if tunggal:
+        node_a, node_b = [node_a], [node_b]
+    idx = trie['index']
+    ia = np.array([idx[n] for n in node_a], dtype=np.int64)
+    ib = np.array([idx[n] for n in node_b], dtype=np.int64)
+    hasil = lcp_index(trie, ia, ib)
+    return int(hasil[0]) if tunggal else hasil
+
+
+def lcp_index(trie, ia, ib):
+    """Versi lcp berbasis indeks baris (array int), tanpa lookup dict."""
+    jalur = trie['jalur']
+    sama = (jalur[ia] == jalur[ib]) & (jalur[ia] >= 0)
+    # Jumlah segmen awal yang sama (prefix True berturut-turut)
+    n_sama = np.cumprod(sama, axis=1).sum(axis=1)
+    lca = np.where(n_sama > 0, jalur[ia, np.maximum(n_sama - 1, 0)], 0)
+    return trie['panjang'][lca]
+
+
+def matriks_lcp(trie):
+    """Matriks LCP semua pasangan simpul (n x n), cocok untuk e1 (486 simpul)."""
+    n = len(trie['node_ids'])
+    ia, ib = np.meshgrid(np.arange(n), np.arange(n), indexing='ij')
+    return lcp_index(trie, ia.ravel(), ib.ravel()).reshape(n, n)
+
+
+# --- SIMPAN GROUPING (FORMAT SAMA DENGAN groupings.gt.viaPrefix5.txt) ---
+def simpan_grouping(grup_list, output_file):
+    # File asli menulis grup terkecil lebih dulu
+    with open(output_file, 'w', encoding='utf-8') as f:
+        for i, (kode, anggota) in enumerate(reversed(grup_list), 1):
+            f.write(f"# {i}\t{kode}\n")
+            f.write(','.join(anggota) + '\n')
+
+
+def main(kode_file, min_awal=1, min_akhir=20, gt_file=None):
+    print(f"\n{'='*80}")
+    print(f"{'POHON PREFIX: SWEEP PANJANG PREFIX MINIMUM':^80}")
+    print(f"{'='*80}")
+
+    trie = muat_trie(kode_file)
+    n = len(trie['node_ids'])
+    print(f"# simpul dengan kode={n}  node trie={len(trie['kode'])}  "
+          f"kedalaman maks={trie['jalur'].shape[1]}")
+
+    thresholds, labels = sweep_grouping(trie, min_awal, min_akhir)
+
+    metrik = None
+    if gt_file:
+        from read_gt import read_gt
+        from evaluasi_gt import evaluasi_batch, label_array
+        node_gt, _ = read_gt(gt_file)
+        # Evaluasi pada simpul yang ada di gt dan punya kode prefix
+        umum = [i for i, nid in enumerate(trie['node_ids']) if nid in node_gt]
+        gt_labels = label_array([trie['node_ids'][i] for i in umum], node_gt)
+        metrik, _ = evaluasi_batch(gt_labels, labels[:, umum])
+
+    print(f"{'Min Prefix':<12} {'Jml Grup':<10} {'Grup Terbesar':<15} {'Singleton':<10}", end="")
+    print(f" {'ARI':<8} {'NMI':<8}" if metrik else "")
+    print('-' * 80)
+
+    rows = []
+    for t, L in enumerate(thresholds):
+        ukuran = np.unique(labels[t], return_counts=True)[1]
+        row = [L, len(ukuran), int(ukuran.max()) if len(ukuran) else 0, int((ukuran == 1).sum())]
+        if metrik:
+            row += [f"{metrik['ari'][t]:.4f}", f"{metrik['nmi'][t]:.4f}"]
+        rows.append(row)
+        print(f"{row[0]:<12} {row[1]:<10} {row[2]:<15} {row[3]:<10}", end="")
+        print(f" {row[4]:<8} {row[5]:<8}" if metrik else "")
+
+    # --- SIMPAN KE CSV ---
+    output_csv = "sweep_prefix.csv"
+    try:
+        with open(output_csv, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            header = ['Min Prefix', 'Jumlah Grup', 'Grup Terbesar', 'Jumlah Singleton']
+            if metrik:
+                header += ['ARI', 'NMI']
+            writer.writerow(header)
+            writer.writerows(rows)
+        print(f"\n[SUKSES] Hasil sweep disimpan di: {output_csv}\n")
+    except Exception as e:
+        print(f"\n[ERROR] Gagal menyimpan CSV: {e}")
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        print("Usage: python pohon_prefix.py <file_kode_prefix> [min_awal] [min_akhir] [gt_file]")
+        sys.exit(1)
+
+    kode_file = sys.argv[1]
+    if not os.path.exists(kode_file):
+        print(f"[ERROR] File '{kode_file}' tidak ditemukan!")
+        sys.exit(1)
+
+    min_awal = int(sys.argv[2]) if len(sys.argv) > 2 else 1
+    min_akhir = int(sys.argv[3]) if len(sys.argv) > 3 else 20
+    gt_file = sys.argv[4] if len(sys.argv) > 4 else None
+    main(kode_file, min_awal, min_akhir, gt_file)
@@ -3,14 +3,64 @@
 import sys
 import os
 import re  # Import Regex untuk membersihkan nama file
-import matplotlib.pyplot as plt
-import networkx as nx
+import time
 from collections import defaultdict, Counter
 
+import metrik
+import indeks_graf
+import dedup_file
+import shuffle_graf
+import pipeline_baca
+import checkpoint_graf
+
+# File metadata dan file sampah sistem yang tidak dibaca
+FILTER_METADATA = ('grouping', 'prefix', 'candidate', 'id_gt', '.')
+_POLA_ID = re.compile(r'^[A-Za-z0-9_\-]+$')
+
+
+# --- ATURAN BARIS (dipakai juga oleh shuffle_graf.py) ---
+def parse_baris(line, prefix=None):
+    """
+    Satu baris edge menurut aturan pembaca ini. Mengembalikan string alasan
+    tolak, atau (wload_id, v1, v2, ports) dengan ports = daftar port
+    ('1p6', tanpa jumlah paket, urutan dan kembar dipertahankan) yang boleh
+    kosong (baris tanpa port: graf tetap tercatat, baris tidak dihitung).
+    """
+    # Filter --graph: baris graf lain dibuang sebelum di-split
+    if prefix is not None and not line.startswith(prefix):
+        return 'graf_lain'
+    if line.startswith('#'):
+        return 'komentar'
+    parts = line.split()
+
+    if len(parts) < 3:
+        return 'kolom_kurang'
+
+    # Pastikan kolom 2 & 3 adalah angka (Node ID)
+    if not (parts[1].isdigit() and parts[2].isdigit()):
+        return 'node_bukan_angka'
+
+    wload_id = parts[0]
+
+    # --- FILTER TAMBAHAN: Hapus ID Graf yang aneh-aneh ---
+    # Jika ID mengandung karakter non-printable atau terlalu panjang, skip
+    if len(wload_id) > 15 or not _POLA_ID.match(wload_id):
+        return 'id_graf_tidak_valid'
+
+    ports = []
+    if len(parts) > 3:
+        for port_tuple in parts[3].split(','):
+            if 'p' not in port_tuple: continue
+            port_part = port_tuple.split('-')[0]
+            if port_part == '': continue
+            ports.append(port_part)
+    return wload_id, parts[1], parts[2], ports
+
+
 # --- FUNGSI MEMBACA FILE ---
 def read_edges_with_ports_to_stats(edges_file,
                                    wload_to_graph=None,  wload_to_port_info=None,
-                                   wload_to_directed_longevity=None):
+                                   wload_to_directed_longevity=None, isi=None):
     
     if wload_to_graph is None:  wload_to_graph = {}
     if wload_to_port_info is None: wload_to_port_info = {}
@@ -20,42 +70,38 @@ def read_edges_with_ports_to_stats(edges_file,
 
     filename_only = os.path.basename(edges_file)
     # Filter file metadata dan file sampah sistem
-    if filename_only.startswith(('grouping', 'prefix', 'candidate', 'id_gt', '.')):
+    if filename_only.startswith(FILTER_METADATA):
+        metrik.tambah('file_dilewati')
         return wload_to_graph, wload_to_port_info, wload_to_directed_longevity
 
     print(f"   -> Cek file: {filename_only} ...", end=" ")
 
     try:
-        fopen = open(edges_file, mode='r', encoding='utf-8', errors='ignore')
+        # isi: bytes yang sudah dibaca di depan oleh pipeline_baca (atau exception-nya)
+        if isinstance(isi, Exception):
+            raise isi
+        if isi is not None:
+            fopen = pipeline_baca.buka_isi(isi)
+        else:
+            fopen = open(edges_file, mode='r', encoding='utf-8', errors='ignore')
     except Exception as e:
         print(f"[ERROR] {e}")
         return wload_to_graph, wload_to_port_info, wload_to_directed_longevity
 
     valid_lines_count = 0
-    with fopen: 
+    # Penghitung baris ditolak per alasan (dikirim ke metrik per file, bukan per baris)
+    n_baris = 0
+    tolak = Counter()
+    # Filter --graph: baris graf lain dibuang sebelum di-split
+    prefix = indeks_graf.prefix_graf()
+    with fopen, metrik.fase('baca_parse'): 
         for line in fopen:
-            if line.startswith('#'): continue
-            parts = line.split()
-            
-            if len(parts) < 3: continue
-
-            # Pastikan kolom 2 & 3 adalah angka (Node ID)
-            if not (parts[1].isdigit() and parts[2].isdigit()):
-                continue
-
-            wload_id = parts[0]
-            
-            # --- FILTER TAMBAHAN: Hapus ID Graf yang aneh-aneh ---
-            # Jika ID mengandung karakter non-printable atau terlalu panjang, skip
-            if len(wload_id) > 15 or not re.match(r'^[A-Za-z0-9_\-]+$', wload_id):
+            n_baris += 1
+            hasil = parse_baris(line, prefix)
+            if hasil.__class__ is str:
+                tolak[hasil] += 1
                 continue
-
-            v1 = parts[1]
-            v2 = parts[2]
-            
-            ports = []
-            if len(parts) > 3:
-                ports = parts[3].split(',')
+            wload_id, v1, v2, ports = hasil
 
             if wload_id not in wload_to_graph:
                 wload_to_graph[ wload_id ] = defaultdict(Counter)
@@ -65,22 +111,24 @@ def read_edges_with_ports_to_stats(edges_file,
                 stats = defaultdict(set)
                 wload_to_port_info[ wload_id ] = stats
 
-            ports_added = False
-            for port_tuple in ports:
-                if 'p' not in port_tuple: continue 
-                port_part = port_tuple.split('-')[0]
-                if port_part == '': continue
-                
+            for port_part in ports:
                 port_to_freq[port_part] += 1
                 stats[port_part].add((v1, v2))
-                ports_added = True
                 directed_longevity[wload_id][(v1, v2, port_part)] = 1
                 
-            if ports_added:
+            if ports:
                 wload_to_graph[wload_id][v1][v2] += 1
                 wload_to_graph[wload_id][v2][v1] += 1
                 valid_lines_count += 1
+            else:
+                tolak['tanpa_port'] += 1
     
+    metrik.tambah('file')
+    metrik.tambah('baris', n_baris)
+    metrik.tambah('baris_valid', valid_lines_count)
+    metrik.tambah('byte', os.path.getsize(edges_file))
+    metrik.tolak(tolak)
+
     if valid_lines_count > 0:
         print(f"[OK] {valid_lines_count} edges.")
     else:
@@ -89,9 +137,10 @@ def read_edges_with_ports_to_stats(edges_file,
     if wload_to_directed_longevity is None:
         wload_to_directed_longevity  = directed_longevity
     else:
-        for wload, triples in directed_longevity.items():
-            for trip in triples:
-                wload_to_directed_longevity[wload][trip] += 1
+        with metrik.fase('gabung_longevity'):
+            for wload, triples in directed_longevity.items():
+                for trip in triples:
+                    wload_to_directed_longevity[wload][trip] += 1
     
     return wload_to_graph, wload_to_port_info, wload_to_directed_longevity
 
@@ -114,10 +163,77 @@ def read_edges_with_ports_to_stats_multiple_files(path):
         return {}, {}, {}
     
     print(f'# Menemukan total {len(all_files)} file. Memproses...')
-    
-    for fname in all_files:
-        wload_to_gr, wload_to_stats, wload_to_directed_longevity = read_edges_with_ports_to_stats(
-            fname, wload_to_gr, wload_to_stats, wload_to_directed_longevity)
+    # Filter --graph: file yang tidak berisi graf tsb (menurut indeks) tidak dibuka
+    all_files = indeks_graf.saring_file(all_files)
+    # File yang isinya sama persis dengan file lain tidak dibaca dua kali
+    all_files = dedup_file.saring_file(all_files)
+
+    # Mode --shuffle: parser -> agregator per partisi simpul (shuffle_graf.py)
+    if shuffle_graf.shuffle_aktif():
+        if checkpoint_graf.checkpoint_aktif():
+            print("[!] --checkpoint / --resume tidak didukung di mode --shuffle, diabaikan.")
+        n_parser, n_agregator = shuffle_graf.shuffle_aktif()
+        return shuffle_graf.agregasi_shuffle(all_files, n_parser, n_agregator,
+                                             prefix=indeks_graf.prefix_graf())
+
+    # Checkpoint berkala / --resume (checkpoint_graf.py)
+    file_ckpt = checkpoint_graf.checkpoint_aktif()
+    if file_ckpt:
+        meta = {'path': os.path.abspath(path), 'graf': indeks_graf.graf_aktif(),
+                'containment': dedup_file.mode_containment(), 'selesai': []}
+        if checkpoint_graf.resume_aktif() and os.path.isfile(file_ckpt):
+            try:
+                wload_to_gr, wload_to_stats, wload_to_directed_longevity, meta_lama = \
+                    checkpoint_graf.muat_checkpoint(file_ckpt)
+                selesai = checkpoint_graf.cocokkan_meta(meta_lama, path, meta['graf'],
+                                                        meta['containment'], all_files)
+            except (OSError, ValueError, KeyError) as e:
+                print(f"[ERROR] Checkpoint '{file_ckpt}' tidak bisa dipakai: {e}")
+                sys.exit(1)
+            meta['selesai'] = [f for f in all_files if f in selesai]
+            all_files = [f for f in all_files if f not in selesai]
+            print(f"# Resume dari {file_ckpt}: {len(selesai)} file sudah selesai, "
+                  f"{len(all_files)} file tersisa.")
+        elif checkpoint_graf.resume_aktif():
+            print(f"[!] Checkpoint '{file_ckpt}' belum ada, mulai dari awal.")
+
+    if pipeline_baca.prefetch_aktif():
+        # Isi file berikutnya dibaca di thread latar selagi file ini di-parse
+        # (.gz tidak didekompresi: pembaca ini selalu membuka file sebagai teks biasa)
+        sumber = pipeline_baca.prefetch(all_files, dekompresi=False,
+                                        lewati=lambda f: os.path.basename(f).startswith(FILTER_METADATA))
+    else:
+        sumber = ((fname, None) for fname in all_files)
+
+    terakhir = time.perf_counter()
+    dalam_file = False
+    try:
+        for fname, isi in sumber:
+            dalam_file = True
+            wload_to_gr, wload_to_stats, wload_to_directed_longevity = read_edges_with_ports_to_stats(
+                fname, wload_to_gr, wload_to_stats, wload_to_directed_longevity, isi=isi)
+            dalam_file = False
+            if file_ckpt:
+                meta['selesai'].append(fname)
+                if time.perf_counter() - terakhir >= checkpoint_graf.INTERVAL_DETIK:
+                    checkpoint_graf.simpan_checkpoint(file_ckpt, wload_to_gr, wload_to_stats,
+                                                      wload_to_directed_longevity, meta)
+                    terakhir = time.perf_counter()
+    except KeyboardInterrupt:
+        if file_ckpt:
+            # State file yang sedang dibaca belum lengkap: hanya disimpan bila berhenti di antara file
+            if dalam_file:
+                print(f"\n[!] Dihentikan di tengah file, checkpoint terakhir di '{file_ckpt}' tetap dipakai.")
+            else:
+                checkpoint_graf.simpan_checkpoint(file_ckpt, wload_to_gr, wload_to_stats,
+                                                  wload_to_directed_longevity, meta)
+                print(f"\n[INFO] Checkpoint disimpan: {file_ckpt} ({len(meta['selesai'])} file selesai)")
+        raise
+
+    if file_ckpt:
+        checkpoint_graf.simpan_checkpoint(file_ckpt, wload_to_gr, wload_to_stats,
+                                          wload_to_directed_longevity, meta)
+        print(f"[INFO] Checkpoint disimpan: {file_ckpt} ({len(meta['selesai'])} file selesai)")
         
     return wload_to_gr, wload_to_stats, wload_to_directed_longevity
 
@@ -130,6 +246,10 @@ def visualize_graph(graph_id, edge_data, max_nodes=50):
         clean_id = "unknown_graph"
         
     print(f"   -> Menggambar graf {clean_id} (Top {max_nodes} nodes)...")
+
+    # Library gambar dimuat di sini saja: membaca/statistik tidak butuh matplotlib
+    import matplotlib.pyplot as plt
+    import networkx as nx
     
     G = nx.DiGraph()
     
@@ -175,8 +295,9 @@ def visualize_graph(graph_id, edge_data, max_nodes=50):
 
 # --- MAIN PROGRAM ---
 if __name__ == '__main__':
+    sys.argv = checkpoint_graf.dari_argv(pipeline_baca.dari_argv(shuffle_graf.dari_argv(dedup_file.dari_argv(indeks_graf.dari_argv(metrik.dari_argv(sys.argv))))))
     if len(sys.argv) < 2:
-        print("Usage: python read_graphs.py <folder_name>")
+        print("Usage: python read_graphs.py <folder_name> [--graph <id>] [--containment[=tandai|lewati]] [--shuffle[=P,A]] [--prefetch=N] [--checkpoint[=file.npz]] [--resume[=file.npz]] [--metrik[=file.json]] [--profile[=file.prof]]")
         sys.exit(1)
     
     path = sys.argv[1]
@@ -197,6 +318,7 @@ if __name__ == '__main__':
         
         for w in workloads:
             edge_data = graphs[w]
-            visualize_graph(w, edge_data, max_nodes=50)
+            with metrik.fase('gambar'):
+                visualize_graph(w, edge_data, max_nodes=50)
             
         print('\n[SELESAI] Cek folder tempat script ini berada untuk melihat hasilnya.')
\ No newline at end of file
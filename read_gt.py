@@ -19,7 +19,6 @@
 # ...
 
 import sys, gzip
-import numpy as np
 
 from collections import defaultdict, Counter
 
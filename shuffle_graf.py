@@ -0,0 +1,299 @@
+#!/usr/bin/python
+
+# Mode shuffle untuk ingest read_graphs.py: agregasi multi-proses yang
+# dipartisi dengan hash simpul sumber.
+#
+# Membagi file ke beberapa proses tidak membantu bila satu graph id
+# mendominasi (mis. g2): setiap worker memegang salinan penuh adjacency graf
+# itu dan penggabungan di akhir menjadi bottleneck. Di mode ini:
+#   - P proses parser membaca file (dibagi round-robin) dengan aturan baris
+#     read_graphs.parse_baris (fungsi yang sama, bukan salinan),
+#   - setiap rekaman dikirim ke agregator pemilik simpul sumbernya
+#     (hash(node) % A), dalam batch, lewat socket lokal
+#     (multiprocessing.connection, AF_UNIX),
+#   - setiap dari A proses agregator memegang potongan adjacency yang saling
+#     lepas, jadi penggabungan akhir hanya menyatukan dict (tanpa menjumlah).
+#
+# Rekaman yang dikirim:
+#   adj  (graf, u, v)            -> pemilik(u): graph[w][u][v] += 1
+#                                   (setiap edge dikirim dua arah, seperti read_graphs)
+#   trip (graf, v1, v2, port)    -> pemilik(v1): port_info + longevity,
+#                                   sudah unik per file di parser (longevity = jumlah file)
+#
+# Batas memori: hasil akhir tetap dict Python penuh seperti read_graphs biasa
+# (statistik di read_graphs butuh seluruh graf), jadi koordinator menyatukan
+# semua potongan agregator ke satu proses (fase 'shuffle_gabung'). Yang
+# terbagi per agregator hanyalah memori SELAMA agregasi; puncak memori
+# koordinator tetap sebesar seluruh graf dan tidak turun dengan menambah A.
+#
+# Alamat agregator bisa diberikan sendiri (path socket UNIX atau (host, port)
+# untuk TCP), jadi transport yang sama bisa dipakai lintas mesin.
+#
+# Flag (read_graphs.py):
+#   --shuffle               parser = agregator = jumlah CPU
+#   --shuffle=N             N parser dan N agregator
+#   --shuffle=P,A           P parser dan A agregator
+#
+# Contoh:
+#
+# python read_graphs.py data_graf --shuffle=2,4 --metrik
+
+import sys
+import os
+import shutil
+import tempfile
+import multiprocessing
+from multiprocessing.connection import Listener, Client, wait
+from collections import defaultdict, Counter
+
+import metrik
+
+UKURAN_BATCH = 20000
+
+_shuffle = None    # None atau (n_parser, n_agregator)
+
+
+# --- FUNGSI BANTU ---
+def atur_shuffle(n_parser, n_agregator):
+    """Aktifkan mode shuffle untuk read_graphs (None = mati)."""
+    global _shuffle
+    _shuffle = None if n_parser is None else (max(1, n_parser), max(1, n_agregator))
+
+
+def shuffle_aktif():
+    return _shuffle
+
+
+def pemilik(node, n_agregator):
+    """Indeks agregator pemilik simpul (hash perkalian atas node id, sama di semua mesin)."""
+    return ((int(node) * 2654435761) & 0xFFFFFFFF) % n_agregator
+
+
+# --- PROSES AGREGATOR ---
+def _agregator(alamat, authkey, n_parser, conn_hasil):
+    listener = Listener(alamat, authkey=authkey)
+    conn_hasil.send('siap')
+    masuk = [listener.accept() for _ in range(n_parser)]
+    listener.close()
+
+    graf = {}
+    port_info = {}
+    longevity = defaultdict(Counter)
+    n_batch = 0
+    while masuk:
+        for c in wait(masuk):
+            try:
+                pesan = c.recv()
+            except EOFError:
+                pesan = None
+            if pesan is None:
+                masuk.remove(c)
+                c.close()
+                continue
+            n_batch += 1
+            adj, trip = pesan
+            for w, u, v in adj:
+                g = graf.get(w)
+                if g is None:
+                    g = graf[w] = defaultdict(Counter)
+                g[u][v] += 1
+            for w, v1, v2, port in trip:
+                st = port_info.get(w)
+                if st is None:
+                    st = port_info[w] = defaultdict(set)
+                st[port].add((v1, v2))
+                longevity[w][(v1, v2, port)] += 1
+
+    conn_hasil.send((graf, port_info, longevity, n_batch))
+    conn_hasil.close()
+
+
+# --- PROSES PARSER ---
+def _parse_file(edges_file, prefix, kirim, hitung):
+    """Baca satu file dengan aturan read_graphs, rekaman diteruskan lewat kirim(adj/trip)."""
+    # Aturan baris dan filter file diambil dari read_graphs, jadi kedua mode tidak bisa menyimpang
+    from read_graphs import parse_baris, FILTER_METADATA
+
+    filename_only = os.path.basename(edges_file)
+    if filename_only.startswith(FILTER_METADATA):
+        hitung['file_dilewati'] += 1
+        return
+    try:
+        fopen = open(edges_file, mode='r', encoding='utf-8', errors='ignore')
+    except Exception as e:
+        print(f"   -> Cek file: {filename_only} ... [ERROR] {e}", flush=True)
+        return
+
+    tolak = hitung['tolak']
+    n_baris = valid_lines_count = 0
+    sudah = set()    # (graf, v1, v2, port) yang sudah dikirim untuk file ini
+    with fopen:
+        for line in fopen:
+            n_baris += 1
+            hasil = parse_baris(line, prefix)
+            if hasil.__class__ is str:
+                tolak[hasil] += 1
+                continue
+            wload_id, v1, v2, ports = hasil
+            hitung['graf'].add(wload_id)
+
+            for port_part in ports:
+                trip = (wload_id, v1, v2, port_part)
+                if trip not in sudah:
+                    sudah.add(trip)
+                    kirim('trip', v1, trip)
+            if ports:
+                kirim('adj', v1, (wload_id, v1, v2))
+                kirim('adj', v2, (wload_id, v2, v1))
+                valid_lines_count += 1
+            else:
+                tolak['tanpa_port'] += 1
+
+    hitung['file'] += 1
+    hitung['baris'] += n_baris
+    hitung['baris_valid'] += valid_lines_count
+    hitung['byte'] += os.path.getsize(edges_file)
+    if valid_lines_count > 0:
+        print(f"   -> Cek file: {filename_only} ... [OK] {valid_lines_count} edges.", flush=True)
+    else:
+        print(f"   -> Cek file: {filename_only} ... [SKIP] Bukan data graf.", flush=True)
+
+
+def _parser(files, alamat, authkey, prefix, conn_hasil):
+    conns = [Client(a, authkey=authkey) for a in alamat]
+    n_agregator = len(conns)
+    batch = [([], []) for _ in range(n_agregator)]
+    hitung = {'tolak': Counter(), 'graf': set(), 'file': 0, 'file_dilewati': 0,
+              'baris': 0, 'baris_valid': 0, 'byte': 0, 'batch': 0}
+
+    def kirim(jenis, node, rekaman):
+        a = pemilik(node, n_agregator)
+        adj, trip = batch[a]
+        (adj if jenis == 'adj' else trip).append(rekaman)
+        if len(adj) + len(trip) >= UKURAN_BATCH:
+            conns[a].send(batch[a])
+            batch[a] = ([], [])
+            hitung['batch'] += 1
+
+    for fname in files:
+        _parse_file(fname, prefix, kirim, hitung)
+
+    for a, c in enumerate(conns):
+        if batch[a][0] or batch[a][1]:
+            c.send(batch[a])
+            hitung['batch'] += 1
+        c.send(None)
+        c.close()
+    conn_hasil.send(hitung)
+    conn_hasil.close()
+
+
+# --- FUNGSI UTAMA SHUFFLE ---
+def _terima(conn, proses, semua):
+    try:
+        return conn.recv()
+    except EOFError:
+        for p in semua:
+            if p.is_alive():
+                p.terminate()
+        raise RuntimeError(f"proses {proses.name} berhenti tanpa hasil (exit code {proses.exitcode})")
+
+
+def agregasi_shuffle(files, n_parser, n_agregator, prefix=None, alamat=None):
+    """
+    Sama seperti read_edges_with_ports_to_stats_multiple_files untuk daftar
+    files, tapi lewat P parser -> A agregator (partisi hash simpul sumber).
+    Mengembalikan (wload_to_graph, wload_to_port_info, wload_to_directed_longevity).
+    """
+    files = list(files)
+    n_parser = max(1, min(n_parser, len(files)))
+    tmp = None
+    if alamat is None:
+        tmp = tempfile.mkdtemp(prefix='shuffle_graf_')
+        alamat = [os.path.join(tmp, f'agregator{i}.sock') for i in range(n_agregator)]
+    n_agregator = len(alamat)
+    authkey = os.urandom(16)
+    print(f"# Mode shuffle: {n_parser} parser -> {n_agregator} agregator (partisi hash simpul sumber)")
+
+    semua = []
+    try:
+        agregator = []
+        for i, a in enumerate(alamat):
+            terima, kirim = multiprocessing.Pipe(duplex=False)
+            p = multiprocessing.Process(target=_agregator, name=f'agregator{i}',
+                                        args=(a, authkey, n_parser, kirim))
+            p.start()
+            kirim.close()
+            agregator.append((p, terima))
+            semua.append(p)
+        # Parser baru dijalankan setelah semua agregator siap menerima koneksi
+        for p, terima in agregator:
+            _terima(terima, p, semua)
+
+        parser = []
+        for i in range(n_parser):
+            terima, kirim = multiprocessing.Pipe(duplex=False)
+            p = multiprocessing.Process(target=_parser, name=f'parser{i}',
+                                        args=(files[i::n_parser], alamat, authkey, prefix, kirim))
+            p.start()
+            kirim.close()
+            parser.append((p, terima))
+            semua.append(p)
+
+        with metrik.fase('shuffle_parse'):
+            hitung = [_terima(terima, p, semua) for p, terima in parser]
+        with metrik.fase('shuffle_agregasi'):
+            potongan = [_terima(terima, p, semua) for p, terima in agregator]
+        for p in semua:
+            p.join()
+    finally:
+        if tmp is not None:
+            shutil.rmtree(tmp, ignore_errors=True)
+
+    for h in hitung:
+        for k in ('file', 'file_dilewati', 'baris', 'baris_valid', 'byte'):
+            metrik.tambah(k, h[k])
+        metrik.tambah('batch_shuffle', h['batch'])
+        metrik.tolak(h['tolak'])
+
+    # Potongan agregator saling lepas (per simpul sumber): cukup disatukan
+    wload_to_graph = {}
+    wload_to_port_info = {}
+    wload_to_directed_longevity = defaultdict(Counter)
+    with metrik.fase('shuffle_gabung'):
+        for w in sorted(set().union(*(h['graf'] for h in hitung))):
+            wload_to_graph[w] = defaultdict(Counter)
+            wload_to_port_info[w] = defaultdict(set)
+        for graf, port_info, longevity, _ in potongan:
+            for w, g in graf.items():
+                wload_to_graph[w].update(g)
+            for w, st in port_info.items():
+                tujuan = wload_to_port_info[w]
+                for port, pasangan in st.items():
+                    tujuan[port] |= pasangan
+            for w, trip in longevity.items():
+                wload_to_directed_longevity[w].update(trip)
+    for i, (_, _, _, n_batch) in enumerate(potongan):
+        print(f"   -> Agregator {i}: {n_batch} batch, "
+              f"{sum(len(g) for g in potongan[i][0].values())} simpul sumber")
+    return wload_to_graph, wload_to_port_info, wload_to_directed_longevity
+
+
+# --- FLAG COMMAND LINE ---
+def dari_argv(argv):
+    """Membuang '--shuffle[=N|=P,A]' dari argv dan mengaktifkan mode shuffle."""
+    sisa = []
+    for arg in argv:
+        if arg == '--shuffle' or arg.startswith('--shuffle='):
+            nilai = arg.partition('=')[2]
+            try:
+                angka = [int(x) for x in nilai.split(',')] if nilai else [os.cpu_count() or 1]
+                if len(angka) not in (1, 2) or min(angka) < 1:
+                    raise ValueError
+            except ValueError:
+                print(f"[ERROR] Nilai --shuffle '{nilai}' tidak valid (pakai --shuffle=N atau --shuffle=P,A)")
+                sys.exit(1)
+            atur_shuffle(angka[0], angka[-1])
+        else:
+            sisa.append(arg)
+    return sisa
@@ -0,0 +1,205 @@
+#!/usr/bin/python
+
+# Laporan statistik derajat dan port per graf, seperti tabel di README:
+#
+# Graph, num nodes, undirected edges, directed edges, port-differentiated-directed edges
+# (undirected) num nodes with degree 2+, median degree, max degree
+# Num. of (unique service) ports in graph, on 2+ edges, top ports
+# Num. nodes providing a port, 2+ ports, median, max
+# Num. nodes client of a port, 2+ ports, median, max
+# Num. nodes with positive indegree and outdegree, self-arcs, directed 2-cycles
+#
+# Semua graf (workload) dihitung dari array hasil satu kali baca folder
+# (muat_edges.py), dengan operasi numpy (unique / bincount), tanpa dict per edge.
+
+# Contoh:
+#
+# python statistik_port.py dir_g21_small_workload_with_gt/dir_no_packets_etc
+
+import sys
+import os
+import csv
+import numpy as np
+
+from muat_edges import baca_folder_array, kunci_edge, kunci_port, nama_port, port_per_baris
+import metrik
+import indeks_graf
+import dedup_file
+import pipeline_baca
+
+TOP_N = 10
+
+
+def _median(x):
+    return float(np.median(x)) if len(x) else 0
+
+
+# --- FUNGSI STATISTIK ---
+def hitung_statistik_port(arr, top_n=TOP_N):
+    """Statistik derajat + port untuk satu workload (dict array dari muat_edges)."""
+    src, dst = arr['src'], arr['dst']
+    baris_port = port_per_baris(arr)
+    pkey = kunci_port(arr['port'], arr['proto'])
+
+    # Edge berarah unik; inv = indeks edge unik untuk tiap baris
+    ekey, e_inv = np.unique(kunci_edge(src, dst), return_inverse=True)
+    e_src, e_dst = ekey >> 32, ekey & 0xFFFFFFFF
+
+    nodes, node_inv = np.unique(np.concatenate((e_src, e_dst)), return_inverse=True)
+    n_nodes = len(nodes)
+    n_edge = len(ekey)
+    u_idx, v_idx = node_inv[:n_edge], node_inv[n_edge:]
+
+    # Edge tak berarah unik (pasangan min, max)
+    a, b = np.minimum(u_idx, v_idx), np.maximum(u_idx, v_idx)
+    ukey = np.unique(a.astype(np.int64) * n_nodes + b)
+    ua, ub = ukey // n_nodes, ukey % n_nodes
+    bukan_loop = ua != ub
+    deg = np.bincount(ua, minlength=n_nodes) + np.bincount(ub[bukan_loop], minlength=n_nodes)
+
+    # Edge berarah + port unik (port-differentiated)
+    ports, port_idx = np.unique(pkey, return_inverse=True)
+    n_ports = len(ports)
+    ep = np.unique(e_inv[baris_port].astype(np.int64) * n_ports + port_idx)
+    ep_edge, ep_port = ep // n_ports, ep % n_ports
+
+    # Jumlah edge (berarah) per port
+    edge_per_port = np.bincount(ep_port, minlength=n_ports)
+
+    # Port yang dilayani (server) dan dipakai (client) per simpul
+    node_port_srv = np.unique(v_idx[ep_edge].astype(np.int64) * n_ports + ep_port)
+    node_port_cli = np.unique(u_idx[ep_edge].astype(np.int64) * n_ports + ep_port)
+    srv_count = np.bincount(node_port_srv // n_ports, minlength=n_nodes)
+    cli_count = np.bincount(node_port_cli // n_ports, minlength=n_nodes)
+    srv_count = srv_count[srv_count > 0]
+    cli_count = cli_count[cli_count > 0]
+
+    # Derajat masuk / keluar (edge berarah unik)
+    indeg = np.bincount(v_idx, minlength=n_nodes)
+    outdeg = np.bincount(u_idx, minlength=n_nodes)
+
+    # 2-cycle berarah: u->v dan v->u (u != v); dihitung per arah seperti README
+    balik = kunci_edge(e_dst, e_src)
+    n_2cycle = int(np.isin(balik, ekey, assume_unique=True)[e_src != e_dst].sum())
+
+    # Top port (heavy hitter) menurut jumlah edge
+    k = min(top_n, n_ports)
+    if k > 0:
+        top = np.argpartition(-edge_per_port, k - 1)[:k]
+        top = top[np.argsort(-edge_per_port[top], kind='stable')]
+    else:
+        top = np.zeros(0, dtype=np.int64)
+
+    return {
+        'nodes': n_nodes,
+        'undirected': len(ukey),
+        'directed': n_edge,
+        'port_directed': len(ep),
+        'deg2': int((deg >= 2).sum()),
+        'med_deg': _median(deg),
+        'max_deg': int(deg.max()) if n_nodes else 0,
+        'ports': n_ports,
+        'ports2': int((edge_per_port >= 2).sum()),
+        'providers': len(srv_count),
+        'providers2': int((srv_count >= 2).sum()),
+        'med_srv': _median(srv_count),
+        'max_srv': int(srv_count.max()) if len(srv_count) else 0,
+        'clients': len(cli_count),
+        'clients2': int((cli_count >= 2).sum()),
+        'med_cli': _median(cli_count),
+        'max_cli': int(cli_count.max()) if len(cli_count) else 0,
+        'in_out': int(((indeg > 0) & (outdeg > 0)).sum()),
+        'self_arcs': int((e_src == e_dst).sum()),
+        'cycles2': n_2cycle,
+        'top_ports': [(nama_port(ports[i]), int(edge_per_port[i])) for i in top],
+    }
+
+
+def _fmt(x):
+    return f"{x:g}" if isinstance(x, float) else str(x)
+
+
+def cetak_statistik(w, st):
+    print(f"\nGraph={w} num nodes={st['nodes']}, num undirected edges={st['undirected']}")
+    print(f"(undirected) num nodes with degree 2+={st['deg2']}, "
+          f"median degree={_fmt(st['med_deg'])}, max degree={st['max_deg']}")
+    print(f"Num. of (unique service) ports in graph ={st['ports']}, on 2+ edges={st['ports2']}")
+    print(f"Num. nodes providing a port={st['providers']}, 2+ ports={st['providers2']} "
+          f"med={_fmt(st['med_srv'])} max={st['max_srv']}")
+    print(f"Num. nodes client of a port={st['clients']}, 2+ ports={st['clients2']} "
+          f"med={_fmt(st['med_cli'])} max={st['max_cli']}")
+    print(f"Num. nodes with positive indegree and outdegree = {st['in_out']}")
+    print(f"Num. of self-arcs: {st['self_arcs']}")
+    print(f"Num. directed edges: {st['directed']}")
+    print(f"Num. of directed 2-cycles: {st['cycles2']}")
+    print(f"Top ports: {st['top_ports'][:5]}")
+
+
+def main(path):
+    wload_to_arrays, files = baca_folder_array(path)
+    print(f'\n# Done reading from {len(files)} file(s).')
+
+    if not wload_to_arrays:
+        print("\n[!] Tidak ada graf yang ditemukan.")
+        return
+
+    with metrik.fase('analisis'):
+        hasil = {w: hitung_statistik_port(arr) for w, arr in wload_to_arrays.items()}
+    workloads = sorted(hasil, key=lambda w: hasil[w]['nodes'], reverse=True)
+
+    print('\nGraph, num nodes, undirected edges, directed edges, port-differentiated-directed edges')
+    for w in workloads:
+        st = hasil[w]
+        print(w, st['nodes'], st['undirected'], st['directed'], st['port_directed'])
+
+    for w in workloads:
+        cetak_statistik(w, hasil[w])
+
+    # --- SIMPAN KE CSV ---
+    output_csv = "statistik_port.csv"
+    output_top = "top_port.csv"
+    kolom = [
+        ('Graph ID', None), ('Nodes', 'nodes'), ('Undirected Edges', 'undirected'),
+        ('Directed Edges', 'directed'), ('Port-Differentiated Directed Edges', 'port_directed'),
+        ('Nodes Degree 2+', 'deg2'), ('Median Degree', 'med_deg'), ('Max Degree', 'max_deg'),
+        ('Unique Ports', 'ports'), ('Ports on 2+ Edges', 'ports2'),
+        ('Nodes Providing Port', 'providers'), ('Providing 2+ Ports', 'providers2'),
+        ('Median Ports Provided', 'med_srv'), ('Max Ports Provided', 'max_srv'),
+        ('Nodes Client of Port', 'clients'), ('Client of 2+ Ports', 'clients2'),
+        ('Median Ports Used', 'med_cli'), ('Max Ports Used', 'max_cli'),
+        ('Nodes In&Out Degree > 0', 'in_out'), ('Self-Arcs', 'self_arcs'),
+        ('Directed 2-Cycles', 'cycles2'),
+    ]
+    try:
+        with metrik.fase('tulis_csv'), open(output_csv, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow([nama for nama, _ in kolom])
+            for w in workloads:
+                st = hasil[w]
+                writer.writerow([w] + [_fmt(st[k]) for _, k in kolom[1:]])
+
+        with metrik.fase('tulis_csv'), open(output_top, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(['Graph ID', 'Rank', 'Port', 'Jumlah Edge'])
+            for w in workloads:
+                for rank, (port, n) in enumerate(hasil[w]['top_ports'], 1):
+                    writer.writerow([w, rank, port, n])
+
+        print(f"\n[SUKSES] Statistik disimpan di: {output_csv}")
+        print(f"[SUKSES] Top port disimpan di: {output_top}\n")
+    except Exception as e:
+        print(f"\n[ERROR] Gagal menyimpan CSV: {e}")
+
+
+if __name__ == '__main__':
+    sys.argv = pipeline_baca.dari_argv(dedup_file.dari_argv(indeks_graf.dari_argv(metrik.dari_argv(sys.argv))))
+    if len(sys.argv) < 2:
+        print("Usage: python statistik_port.py <folder_name> [--graph <id>] [--containment[=tandai|lewati]] [--prefetch=N] [--metrik[=file.json]] [--profile[=file.prof]]")
+        sys.exit(1)
+
+    path = sys.argv[1]
+    if not os.path.exists(path):
+        print(f"[ERROR] Folder '{path}' tidak ditemukan!")
+        sys.exit(1)
+
+    main(path)
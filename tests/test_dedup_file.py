@@ -0,0 +1,33 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import dedup_file
+
+
+def _tulis(tmp_path, nama, isi):
+    f = tmp_path / nama
+    f.write_text(isi)
+    return str(f)
+
+
+def test_containment_memperhitungkan_port_dan_paket(tmp_path):
+    besar = _tulis(tmp_path, "besar.txt", "g1 1 2 80p6-5,53p17-1\ng1 2 3 443p6-2\n")
+    bagian = _tulis(tmp_path, "bagian.txt", "g1 1 2 53p17-1\n")
+    # Edge sama, tapi port / jumlah paket yang tidak ada di file besar
+    port_lain = _tulis(tmp_path, "port_lain.txt", "g1 1 2 80p6-5,22p6-1\n")
+    paket_lain = _tulis(tmp_path, "paket_lain.txt", "g1 2 3 443p6-9\n")
+
+    kandung = dedup_file.cari_containment([besar, bagian, port_lain, paket_lain])
+    assert kandung == {bagian: besar}
+
+
+def test_lewati_tidak_membuang_port_tambahan(tmp_path):
+    besar = _tulis(tmp_path, "besar.txt", "g1 1 2 80p6-1\ng1 2 3 443p6-1\n")
+    port_lain = _tulis(tmp_path, "port_lain.txt", "g1 1 2 80p6-1,8080p6-1\n")
+    dedup_file.atur_containment('lewati')
+    try:
+        assert dedup_file.saring_file([besar, port_lain], verbose=False) == [besar, port_lain]
+    finally:
+        dedup_file.atur_containment(None)
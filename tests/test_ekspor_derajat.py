@@ -0,0 +1,44 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import hitung_derajat
+import distribusi_derajat
+
+
+def _folder_multi_file(tmp_path):
+    # Satu graf tersebar di beberapa file per jam, plus graf kedua
+    folder = tmp_path / "dir_edges"
+    folder.mkdir()
+    for jam in range(4):
+        (folder / f"out2021_3_{jam}.txt").write_text(
+            "".join(f"e1 {jam + i} {jam + i + 1} 80p6-1\n" for i in range(5)))
+    (folder / "out_g2.txt").write_text("g2 1 2 443p6-3\ng2 2 3 443p6-3\n")
+    return folder
+
+
+def test_hitung_derajat_rerun_dilewati(tmp_path, monkeypatch, capsys):
+    folder = _folder_multi_file(tmp_path)
+    monkeypatch.chdir(tmp_path)
+
+    hitung_derajat.main(str(folder))
+    assert "2 ditulis, 0 tidak berubah" in capsys.readouterr().out
+
+    # Data tidak berubah: setiap tabel dilewati, tidak ada yang ditulis ulang
+    hitung_derajat.main(str(folder))
+    assert "0 ditulis, 2 tidak berubah" in capsys.readouterr().out
+
+
+def test_distribusi_derajat_rerun_dilewati(tmp_path, monkeypatch, capsys):
+    folder = _folder_multi_file(tmp_path)
+    monkeypatch.chdir(tmp_path)
+
+    distribusi_derajat.main(str(folder))
+    out = capsys.readouterr().out
+    assert out.count("disimpan ke:") == 2
+
+    distribusi_derajat.main(str(folder))
+    out = capsys.readouterr().out
+    assert "disimpan ke:" not in out
+    assert out.count("tidak berubah, penulisan dilewati") == 2
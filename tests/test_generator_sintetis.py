@@ -0,0 +1,22 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import generator_sintetis
+from muat_edges import baca_folder_array
+from statistik_port import hitung_statistik_port
+
+
+@pytest.mark.parametrize("profil,skala", [('e1', 0.01), ('g2', 0.001), ('g4', 0.00005)])
+def test_port_directed_sama_dengan_pembaca(tmp_path, profil, skala):
+    # Kalibrasi README: jumlah edge + port yang dilaporkan generator harus sama
+    # dengan yang dihitung ulang pembaca dari file output
+    folder = str(tmp_path / profil)
+    hasil = generator_sintetis.generate(profil, skala, folder, n_jam=6, verbose=False)
+    arr, _ = baca_folder_array(folder, verbose=False)
+    stat = hitung_statistik_port(arr[profil])
+    assert stat['directed'] == hasil['directed']
+    assert stat['port_directed'] == hasil['port_directed']
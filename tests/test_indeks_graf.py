@@ -0,0 +1,27 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import indeks_graf
+import baris_edge
+
+
+def test_baris_file_simpan_indeks_sekali(tmp_path, monkeypatch):
+    for i in range(5):
+        (tmp_path / f"out_{i}.txt").write_text(f"g1 {i} {i + 1} 80p6-1\ng2 1 2 80p6-1\n")
+    tulis = []
+    asli = indeks_graf._simpan_indeks
+    monkeypatch.setattr(indeks_graf, '_simpan_indeks', lambda folder: (tulis.append(folder), asli(folder)))
+    monkeypatch.setattr(indeks_graf, '_indeks', {})
+    indeks_graf.pilih_graf('g1')
+    try:
+        for i in range(5):
+            assert len(list(baris_edge.baris_file(str(tmp_path / f"out_{i}.txt")))) == 1
+        # Indeks cold: tidak ditulis per file, hanya sekali di akhir
+        assert tulis == []
+        indeks_graf.simpan_indeks_kotor()
+        assert tulis == [str(tmp_path)]
+        assert (tmp_path / indeks_graf.NAMA_INDEKS).exists()
+    finally:
+        indeks_graf.pilih_graf(None)
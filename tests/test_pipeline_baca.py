@@ -0,0 +1,89 @@
+import os
+import gzip
+import sys
+import time
+import threading
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pipeline_baca
+
+
+def _buat_file(tmp_path, n):
+    files = []
+    for i in range(n):
+        f = tmp_path / f"out_{i}.txt"
+        f.write_text(f"g1 {i} {i + 1} 80p6-1\n")
+        files.append(str(f))
+    return files
+
+
+def _selesai_dalam(fungsi, detik=5.0):
+    """Jalankan fungsi di thread; True jika selesai sebelum batas waktu."""
+    t = threading.Thread(target=fungsi, daemon=True)
+    t.start()
+    t.join(detik)
+    return not t.is_alive()
+
+
+def test_urutan_dan_isi(tmp_path):
+    files = _buat_file(tmp_path, 5)
+    hasil = list(pipeline_baca.prefetch(files, n_prefetch=2))
+    assert [f for f, _ in hasil] == files
+    assert all(isi == open(f, 'rb').read() for f, isi in hasil)
+
+
+def test_error_baca_diteruskan(tmp_path):
+    files = _buat_file(tmp_path, 2) + [str(tmp_path / "tidak_ada.txt")]
+    hasil = list(pipeline_baca.prefetch(files, n_prefetch=2))
+    assert isinstance(hasil[-1][1], OSError)
+
+
+def test_berhenti_di_tengah_tidak_hang(tmp_path):
+    # Antrean penuh dan semua file sudah dibaca saat konsumen berhenti
+    files = _buat_file(tmp_path, 4)
+
+    def jalan():
+        g = pipeline_baca.prefetch(files, n_prefetch=2)
+        for i, _ in enumerate(g):
+            time.sleep(0.3)
+            if i == 1:
+                break
+        g.close()
+
+    assert _selesai_dalam(jalan)
+
+
+def test_exception_di_konsumen_tidak_hang(tmp_path):
+    files = _buat_file(tmp_path, 4)
+
+    def jalan():
+        with pytest.raises(RuntimeError):
+            for _ in pipeline_baca.prefetch(files, n_prefetch=2):
+                time.sleep(0.3)
+                raise RuntimeError("parse gagal")
+
+    assert _selesai_dalam(jalan)
+
+
+def test_gz_terpotong_diteruskan(tmp_path):
+    # .gz rusak melempar EOFError (bukan OSError): thread pembaca tidak boleh mati diam-diam
+    rusak = tmp_path / "a.txt.gz"
+    with gzip.open(rusak, 'wb') as f:
+        f.write(b"g1 1 2 80p6-1\n" * 2000)
+    data = rusak.read_bytes()
+    rusak.write_bytes(data[:len(data) // 2])
+    files = [str(rusak)] + _buat_file(tmp_path, 1)
+    hasil = []
+
+    def jalan():
+        hasil.extend(pipeline_baca.prefetch(files, n_prefetch=2))
+
+    assert _selesai_dalam(jalan)
+    assert isinstance(hasil[0][1], EOFError)
+    assert hasil[1][1] == open(files[1], 'rb').read()
+    # Jalur tanpa prefetch melaporkan hal yang sama
+    tanpa = list(pipeline_baca.prefetch(files, n_prefetch=0))
+    assert isinstance(tanpa[0][1], EOFError)
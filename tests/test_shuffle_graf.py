@@ -0,0 +1,37 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import read_graphs
+import shuffle_graf
+
+
+def _normal(hasil):
+    graf, port_info, longevity = hasil
+    return ({w: {u: dict(c) for u, c in g.items()} for w, g in graf.items()},
+            {w: dict(st) for w, st in port_info.items()},
+            {w: dict(c) for w, c in longevity.items() if c})
+
+
+def test_parse_baris_alasan_tolak():
+    assert read_graphs.parse_baris("# komentar\n") == 'komentar'
+    assert read_graphs.parse_baris("g1 1\n") == 'kolom_kurang'
+    assert read_graphs.parse_baris("g1 a 2 1p6-1\n") == 'node_bukan_angka'
+    assert read_graphs.parse_baris("g1@ 1 2 1p6-1\n") == 'id_graf_tidak_valid'
+    assert read_graphs.parse_baris("g2 1 2 1p6-1\n", prefix=("g1\t", "g1 ")) == 'graf_lain'
+    assert read_graphs.parse_baris("g1 1 2 1p6-1,x,-3,1p6-2\n") == ('g1', '1', '2', ['1p6', '1p6'])
+    assert read_graphs.parse_baris("g1 1 2\n") == ('g1', '1', '2', [])
+
+
+def test_shuffle_sama_dengan_pembaca_biasa(tmp_path):
+    (tmp_path / "a.txt").write_text(
+        "# komentar\ng1 1 2 1p6-1,2p17-3\ng1 2 3 80p6-1\ng1 3 4\ng2 5 6 443p6-1\nxx\n")
+    (tmp_path / "b.txt").write_text("g1 1 2 1p6-9\ng1 4 1 22p6-1,22p6-2\ng3 7 8 nop\n")
+    files = sorted(str(f) for f in tmp_path.iterdir())
+
+    biasa = (None, None, None)
+    for f in files:
+        biasa = read_graphs.read_edges_with_ports_to_stats(f, *biasa)
+    hasil = shuffle_graf.agregasi_shuffle(files, 2, 3)
+    assert _normal(hasil) == _normal(biasa)
@@ -0,0 +1,298 @@
+#!/usr/bin/python
+
+# Penelusuran graf (BFS) langsung di atas graf CSR (graf_csr.py), tanpa nx.Graph.
+#
+# Pertanyaan seperti "server mana yang terjangkau klien X dalam 2 hop" atau
+# "jarak hop dari setiap simpul gt ke simpul gt lain" sebelumnya dijawab dengan
+# membangun nx.Graph lalu memanggil rutin single-source dalam loop Python. Di sini:
+#   bfs()            : BFS satu sumber, frontier berupa array (satu level = satu
+#                      gather numpy atas baris CSR frontier)
+#   jarak_titik()    : BFS dua arah untuk jarak titik-ke-titik, selalu
+#                      memperluas sisi dengan frontier lebih kecil
+#   bfs_bit()        : BFS multi-sumber bit-paralel, 64 sumber per word uint64;
+#                      satu level = satu OR-reduce (np.bitwise_or.reduceat) atas
+#                      semua in-edge, jadi biaya per level O(m) untuk 64 sumber
+#   jarak_antar()    : jarak hop semua pasangan di antara sekumpulan simpul
+#                      (batch 64 sumber memakai bfs_bit)
+#
+# Arah penelusuran (--arah):
+#   keluar       : mengikuti edge src -> dst (default)
+#   masuk        : melawan arah edge (siapa yang bisa mencapai X)
+#   tak_berarah  : mengabaikan arah edge
+#
+# Contoh:
+#
+# python traversal.py dir_g22_extra_graph_with_gt/dir_edges \
+#     dir_g22_extra_graph_with_gt/candidate_gt.minPrefix5.txt
+# python traversal.py dir_g21_small_workload_with_gt dir_g21_small_workload_with_gt/groupings.gt.txt --arah=tak_berarah
+
+import sys
+import os
+import csv
+import time
+import numpy as np
+
+from muat_edges import baca_folder_array
+from evaluasi_gt import baca_grouping
+import graf_csr
+import metrik
+import indeks_graf
+import dedup_file
+import pipeline_baca
+
+ARAH = ('keluar', 'masuk', 'tak_berarah')
+LEBAR_WORD = 64
+TAK_TERJANGKAU = -1
+
+_arah = 'keluar'
+
+
+# --- FUNGSI BANTU ---
+def atur_arah(arah):
+    """Arah penelusuran default (salah satu ARAH)."""
+    global _arah
+    if arah not in ARAH:
+        raise ValueError(f"arah '{arah}' tidak dikenal (pilihan: {', '.join(ARAH)})")
+    _arah = arah
+
+
+def arah_aktif():
+    return _arah
+
+
+def adjacency(csr, arah=None):
+    """
+    (indptr, indices, indptr_balik, indices_balik) untuk arah penelusuran:
+    baris u = tetangga yang dicapai dari u, versi balik = yang mencapai u.
+    """
+    arah = _arah if arah is None else arah
+    if arah == 'tak_berarah':
+        indptr, indices = graf_csr.tak_berarah(csr)
+        return indptr, indices, indptr, indices
+    keluar = (csr['indptr'], csr['dst'])
+    masuk = (csr['in_indptr'], csr['in_src'])
+    if arah == 'keluar':
+        return keluar + masuk
+    if arah == 'masuk':
+        return masuk + keluar
+    raise ValueError(f"arah '{arah}' tidak dikenal (pilihan: {', '.join(ARAH)})")
+
+
+def _perluas(indptr, indices, frontier, jarak):
+    """Tetangga frontier yang belum dikunjungi (unik)."""
+    tetangga, _ = graf_csr.ambil_baris(indptr, indices, frontier)
+    return np.unique(tetangga[jarak[tetangga] == TAK_TERJANGKAU])
+
+
+# --- BFS SATU SUMBER ---
+def bfs(indptr, indices, sumber, maks_hop=None):
+    """Jarak hop (int32, -1 = tak terjangkau) dari sumber (id internal) ke semua simpul."""
+    n = len(indptr) - 1
+    jarak = np.full(n, TAK_TERJANGKAU, dtype=np.int32)
+    frontier = np.array([sumber], dtype=np.int64)
+    jarak[frontier] = 0
+    level = 0
+    while len(frontier) and (maks_hop is None or level < maks_hop):
+        level += 1
+        frontier = _perluas(indptr, indices, frontier, jarak)
+        jarak[frontier] = level
+    return jarak
+
+
+def jangkauan(csr, node_id, maks_hop, arah=None):
+    """Node id asli yang terjangkau dari node_id dalam <= maks_hop hop (tanpa dirinya), terurut."""
+    u = graf_csr.indeks_node(csr, node_id)
+    if u < 0:
+        return np.zeros(0, dtype=csr['node_ids'].dtype)
+    indptr, indices, _, _ = adjacency(csr, arah)
+    jarak = bfs(indptr, indices, u, maks_hop)
+    return np.sort(csr['node_ids'][jarak > 0])
+
+
+# --- BFS DUA ARAH ---
+def jarak_titik(indptr, indices, indptr_balik, indices_balik, s, t, maks_hop=None):
+    """
+    Jarak hop s -> t (id internal) dengan BFS dua arah, atau -1. Sisi maju
+    memakai (indptr, indices), sisi mundur dari t memakai adjacency balik.
+    """
+    if s == t:
+        return 0
+    n = len(indptr) - 1
+    sisi = []
+    for awal in (s, t):
+        jarak = np.full(n, TAK_TERJANGKAU, dtype=np.int32)
+        jarak[awal] = 0
+        sisi.append([jarak, np.array([awal], dtype=np.int64), 0])
+    adj = ((indptr, indices), (indptr_balik, indices_balik))
+
+    while len(sisi[0][1]) and len(sisi[1][1]):
+        if maks_hop is not None and sisi[0][2] + sisi[1][2] >= maks_hop:
+            break
+        # Perluas sisi dengan frontier lebih kecil (lebih sedikit edge disentuh)
+        i = 0 if len(sisi[0][1]) <= len(sisi[1][1]) else 1
+        jarak, frontier, level = sisi[i]
+        frontier = _perluas(adj[i][0], adj[i][1], frontier, jarak)
+        level += 1
+        jarak[frontier] = level
+        sisi[i][1], sisi[i][2] = frontier, level
+        # Bertemu: jarak minimum lewat simpul frontier baru yang sudah dicapai sisi lain
+        lain = sisi[1 - i][0][frontier]
+        temu = lain[lain != TAK_TERJANGKAU]
+        if len(temu):
+            return int(level + temu.min())
+    return TAK_TERJANGKAU
+
+
+# --- BFS MULTI-SUMBER BIT-PARALEL ---
+def _or_baris(indptr, nilai):
+    """OR nilai (sejajar indices CSR) per baris; baris kosong = 0."""
+    n = len(indptr) - 1
+    hasil = np.zeros(n, dtype=np.uint64)
+    isi = indptr[1:] > indptr[:-1]
+    if len(nilai):
+        hasil[isi] = np.bitwise_or.reduceat(nilai, indptr[:-1][isi])
+    return hasil
+
+
+def bfs_bit(indptr_balik, indices_balik, sumber, maks_hop=None):
+    """
+    BFS dari maksimal 64 sumber sekaligus. Bit j word simpul v = v sudah
+    dicapai dari sumber[j]; level berikut = OR frontier semua pendahulu v
+    (adjacency balik). Mengembalikan jarak int16 (len(sumber), n), -1 = tak terjangkau.
+    """
+    sumber = np.asarray(sumber, dtype=np.int64)
+    k = len(sumber)
+    if k > LEBAR_WORD:
+        raise ValueError(f"bfs_bit menerima maksimal {LEBAR_WORD} sumber, bukan {k}")
+    n = len(indptr_balik) - 1
+    jarak = np.full((k, n), TAK_TERJANGKAU, dtype=np.int16)
+    bit = np.left_shift(np.uint64(1), np.arange(k, dtype=np.uint64))
+
+    dikunjungi = np.zeros(n, dtype=np.uint64)
+    np.bitwise_or.at(dikunjungi, sumber, bit)
+    frontier = dikunjungi.copy()
+    jarak[np.arange(k), sumber] = 0
+    level = 0
+    while maks_hop is None or level < maks_hop:
+        level += 1
+        aktif = frontier[indices_balik]
+        baru = _or_baris(indptr_balik, aktif) & ~dikunjungi
+        v = np.flatnonzero(baru)
+        if not len(v):
+            break
+        dikunjungi[v] |= baru[v]
+        # Bit baru -> (sumber, simpul) yang jaraknya = level
+        b = np.unpackbits(baru[v].view(np.uint8).reshape(-1, 8), axis=1, bitorder='little')[:, :k]
+        bar, kol = np.nonzero(b)
+        jarak[kol, v[bar]] = level
+        frontier = baru
+    return jarak
+
+
+def jarak_antar(csr, node_asli, arah=None, maks_hop=None):
+    """
+    Matriks jarak hop (int16, -1 = tak terjangkau) di antara node_asli
+    (node id asli yang ada di csr): baris = sumber, kolom = tujuan.
+    """
+    _, _, indptr_balik, indices_balik = adjacency(csr, arah)
+    idx = np.asarray(graf_csr.indeks_node(csr, np.asarray(node_asli, dtype=np.int64)), dtype=np.int64)
+    hasil = np.empty((len(idx), len(idx)), dtype=np.int16)
+    with metrik.fase('bfs_bit'):
+        for a in range(0, len(idx), LEBAR_WORD):
+            jarak = bfs_bit(indptr_balik, indices_balik, idx[a:a + LEBAR_WORD], maks_hop)
+            hasil[a:a + LEBAR_WORD] = jarak[:, idx]
+            metrik.tambah('batch_bfs_bit')
+    return hasil
+
+
+# --- FLAG COMMAND LINE ---
+def dari_argv(argv):
+    """Membuang '--arah=<keluar|masuk|tak_berarah>' dari argv dan mengaturnya."""
+    sisa = []
+    for arg in argv:
+        if arg.startswith('--arah='):
+            nilai = arg.partition('=')[2]
+            if nilai not in ARAH:
+                print(f"[ERROR] Nilai --arah '{nilai}' tidak valid (pilihan: {', '.join(ARAH)})")
+                sys.exit(1)
+            atur_arah(nilai)
+        else:
+            sisa.append(arg)
+    return sisa
+
+
+# --- FUNGSI UTAMA ---
+def main(path, gt_file):
+    node_gt = baca_grouping(gt_file)
+    wload_to_arrays, files = baca_folder_array(path)
+    print(f'\n# Done reading from {len(files)} file(s).')
+    if not wload_to_arrays:
+        print("\n[!] Tidak ada graf yang ditemukan.")
+        return
+
+    gt_ids = np.array(sorted(int(n) for n in node_gt if n.isdigit()), dtype=np.int64)
+    baris_csv = []
+    print(f"\n# Jarak hop antar {len(gt_ids)} simpul gt (arah={_arah})")
+    print(f"{'Graph':<8} {'Simpul GT':>10} {'Pasangan':>10} {'Terjangkau':>11} {'Rata Hop':>9} "
+          f"{'Rata Intra':>11} {'Rata Antar':>11} {'Detik':>7}")
+    print('-' * 86)
+    for w in sorted(wload_to_arrays):
+        csr = graf_csr.bangun_csr(wload_to_arrays[w])
+        ada = gt_ids[graf_csr.indeks_node(csr, gt_ids) >= 0]
+        if not len(ada):
+            print(f"{w:<8} {0:>10}   [SKIP] Tidak ada simpul gt di graf ini.")
+            continue
+
+        mulai = time.perf_counter()
+        jarak = jarak_antar(csr, ada)
+        detik = time.perf_counter() - mulai
+
+        grup = np.array([node_gt[str(n)] for n in ada])
+        bukan_diri = ~np.eye(len(ada), dtype=bool)
+        terjangkau = (jarak >= 0) & bukan_diri
+        intra = terjangkau & (grup[:, None] == grup[None, :])
+        antar = terjangkau & (grup[:, None] != grup[None, :])
+
+        def rata(mask):
+            return float(jarak[mask].mean()) if mask.any() else float('nan')
+
+        n_pasangan = int(bukan_diri.sum())
+        print(f"{w:<8} {len(ada):>10} {n_pasangan:>10} {int(terjangkau.sum()):>11} "
+              f"{rata(terjangkau):>9.3f} {rata(intra):>11.3f} {rata(antar):>11.3f} {detik:>7.2f}")
+
+        a, b = np.nonzero(bukan_diri)
+        for i, j in zip(a.tolist(), b.tolist()):
+            baris_csv.append([w, int(ada[i]), int(ada[j]), int(jarak[i, j]), int(grup[i] == grup[j])])
+
+    # --- SIMPAN KE CSV ---
+    output_csv = "traversal_jarak.csv"
+    try:
+        with metrik.fase('tulis_csv'), open(output_csv, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(['Graph ID', 'Node Asal', 'Node Tujuan', 'Hop', 'Satu Grup GT'])
+            writer.writerows(baris_csv)
+        print(f"\n[SUKSES] Jarak hop antar simpul gt disimpan di: {output_csv} (hop -1 = tak terjangkau)\n")
+    except Exception as e:
+        print(f"\n[ERROR] Gagal menyimpan CSV: {e}")
+
+
+if __name__ == '__main__':
+    sys.argv = dari_argv(graf_csr.dari_argv(pipeline_baca.dari_argv(dedup_file.dari_argv(
+        indeks_graf.dari_argv(metrik.dari_argv(sys.argv))))))
+    if len(sys.argv) < 3:
+        print("Usage: python traversal.py <folder_name> <file_gt> [--arah=keluar|masuk|tak_berarah] "
+              "[--graph <id>] [--urutan=asli|derajat|bfs|rcm] [--prefetch=N] "
+              "[--metrik[=file.json]] [--profile[=file.prof]]")
+        sys.exit(1)
+
+    path = sys.argv[1]
+    if not os.path.exists(path):
+        print(f"[ERROR] Folder '{path}' tidak ditemukan!")
+        sys.exit(1)
+
+    gt_file = sys.argv[2]
+    if not os.path.isfile(gt_file):
+        print(f"[ERROR] File '{gt_file}' tidak ditemukan!")
+        sys.exit(1)
+
+    main(path, gt_file)
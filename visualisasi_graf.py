@@ -1,23 +1,33 @@
 #!/usr/bin/python
 
-print("--- [DEBUG] Script mulai berjalan... ---")
-
 import sys
 import os
 
+from baris_edge import baris_file
+
+nx = None
+plt = None
+
 # 1. CEK LIBRARY DULU
-try:
-    import networkx as nx
-    import matplotlib
-    # PENTING: Gunakan backend 'Agg' agar tidak error di terminal/server
-    matplotlib.use('Agg') 
-    import matplotlib.pyplot as plt
-    print("--- [DEBUG] Library berhasil dimuat ---")
-except ImportError as e:
-    print(f"\n[ERROR FATAL] Library belum lengkap: {e}")
-    print("Silakan jalankan perintah ini di terminal:")
-    print("pip install networkx matplotlib scipy")
-    sys.exit(1)
+# networkx + matplotlib baru dimuat saat akan menggambar (bukan saat import),
+# agar skrip/subcommand lain yang mengimpor modul ini tetap cepat start.
+def muat_library():
+    global nx, plt
+    if nx is not None:
+        return
+    try:
+        import networkx
+        import matplotlib
+        # PENTING: Gunakan backend 'Agg' agar tidak error di terminal/server
+        matplotlib.use('Agg') 
+        import matplotlib.pyplot as pyplot
+        print("--- [DEBUG] Library berhasil dimuat ---")
+    except ImportError as e:
+        print(f"\n[ERROR FATAL] Library belum lengkap: {e}")
+        print("Silakan jalankan perintah ini di terminal:")
+        print("pip install networkx matplotlib scipy")
+        sys.exit(1)
+    nx, plt = networkx, pyplot
 
 def visualize_sample(filepath, limit_nodes=50):
     filename = os.path.basename(filepath)
@@ -33,19 +43,16 @@ def visualize_sample(filepath, limit_nodes=50):
     G = nx.DiGraph()
     
     try:
-        with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-            for line in f:
-                if line.startswith('#'): continue
-                parts = line.split()
-                if len(parts) < 3: continue
-                if not (parts[1].isdigit() and parts[2].isdigit()): continue
-
-                u, v = parts[1], parts[2]
-                G.add_edge(u, v)
-                
-                # Batas sampling (agar tidak berat)
-                if G.number_of_nodes() >= limit_nodes:
-                    break
+        for parts in baris_file(filepath):
+            if len(parts) < 3: continue
+            if not (parts[1].isdigit() and parts[2].isdigit()): continue
+
+            u, v = parts[1], parts[2]
+            G.add_edge(u, v)
+            
+            # Batas sampling (agar tidak berat)
+            if G.number_of_nodes() >= limit_nodes:
+                break
     except Exception as e:
         print(f"[SKIP] Error baca file {filename}: {e}")
         return
@@ -92,6 +99,8 @@ def main(path):
         print(f"[ERROR] Folder '{path}' tidak ditemukan.")
         return
 
+    muat_library()
+
     found = False
     for root, dirs, files in os.walk(path):
         for file in files:
@@ -105,6 +114,8 @@ def main(path):
         print("[INFO] Tidak ditemukan file .txt di folder tersebut.")
 
 if __name__ == '__main__':
+    print("--- [DEBUG] Script mulai berjalan... ---")
+
     if len(sys.argv) < 2:
         print("Usage: python visualisasi_graf.py <folder_name>")
         sys.exit(1)
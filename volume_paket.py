@@ -0,0 +1,206 @@
+#!/usr/bin/python
+
+# Graf berbobot volume paket dan analisis "top talker".
+#
+# Kolom port pada edge file membawa jumlah paket (mis. 1p6-22 = 22 paket), tetapi
+# pembaca lain hanya menghitung berapa kali baris edge muncul. Di sini jumlah
+# paket diakumulasi dalam array int64 (reduceat setelah diurutkan, bukan loop
+# Python per token):
+#   - bobot edge berarah (client -> server) = total paket
+#   - volume per port (port + protokol)
+#   - volume per simpul sebagai client (keluar) dan sebagai server (masuk)
+# Hasilnya: top talker, top port menurut volume, dan distribusi derajat berbobot
+# (bin log2) untuk setiap graf.
+
+# Contoh:
+#
+# python volume_paket.py dir_g22_extra_graph_with_gt/dir_edges
+
+import sys
+import os
+import csv
+import numpy as np
+
+from muat_edges import baca_folder_array, kunci_edge, kunci_port, nama_port
+import metrik
+import indeks_graf
+import dedup_file
+import pipeline_baca
+
+TOP_N = 50
+
+
+# --- FUNGSI AGREGASI ---
+def jumlah_per_kunci(kunci, nilai):
+    """
+    Jumlah nilai (int64, eksak) per kunci unik.
+    Mengembalikan (kunci_unik, total, banyak_elemen_per_kunci).
+    """
+    if len(kunci) == 0:
+        kosong = np.zeros(0, dtype=np.int64)
+        return kosong, kosong, kosong
+    urut = np.argsort(kunci, kind='stable')
+    k = kunci[urut]
+    awal = np.flatnonzero(np.concatenate(([True], k[1:] != k[:-1])))
+    banyak = np.diff(np.append(awal, len(k)))
+    return k[awal], np.add.reduceat(nilai[urut].astype(np.int64), awal), banyak
+
+
+def paket_per_baris(arr):
+    """Total paket tiap baris edge (jumlah semua token port di baris tsb)."""
+    off = arr['port_off']
+    if len(arr['paket']) == 0:
+        return np.zeros(len(off) - 1, dtype=np.int64)
+    # reduceat tidak boleh menerima offset == panjang array -> setiap baris minimal 1 token
+    return np.add.reduceat(arr['paket'], off[:-1])
+
+
+def graf_berbobot(arr):
+    """
+    Edge berarah unik dengan bobot paket.
+    Mengembalikan dict: src, dst, paket (int64), n_baris (berapa kali edge terlihat).
+    """
+    ekey, paket, n_baris = jumlah_per_kunci(kunci_edge(arr['src'], arr['dst']),
+                                            paket_per_baris(arr))
+    return {
+        'src': ekey >> 32,
+        'dst': ekey & 0xFFFFFFFF,
+        'paket': paket,
+        'n_baris': n_baris,
+    }
+
+
+def volume_port(arr):
+    """Total paket dan jumlah token per port. Mengembalikan (port_keys, paket, n_token)."""
+    return jumlah_per_kunci(kunci_port(arr['port'], arr['proto']), arr['paket'])
+
+
+def volume_node(g):
+    """
+    Volume per simpul dari graf berbobot.
+    Mengembalikan dict: node_ids, keluar (sebagai client), masuk (sebagai server),
+    derajat_keluar, derajat_masuk (edge unik).
+    """
+    nodes, inv = np.unique(np.concatenate((g['src'], g['dst'])), return_inverse=True)
+    n = len(g['src'])
+    u, v = inv[:n], inv[n:]
+    keluar = np.zeros(len(nodes), dtype=np.int64)
+    masuk = np.zeros(len(nodes), dtype=np.int64)
+    k, s, _ = jumlah_per_kunci(u, g['paket'])
+    keluar[k] = s
+    k, s, _ = jumlah_per_kunci(v, g['paket'])
+    masuk[k] = s
+    return {
+        'node_ids': nodes,
+        'keluar': keluar,
+        'masuk': masuk,
+        'derajat_keluar': np.bincount(u, minlength=len(nodes)),
+        'derajat_masuk': np.bincount(v, minlength=len(nodes)),
+    }
+
+
+def top_n(nilai, n=TOP_N):
+    """Indeks n nilai terbesar, urut menurun."""
+    k = min(n, len(nilai))
+    if k == 0:
+        return np.zeros(0, dtype=np.int64)
+    idx = np.argpartition(-nilai, k - 1)[:k]
+    return idx[np.argsort(-nilai[idx], kind='stable')]
+
+
+def distribusi_log2(nilai):
+    """Histogram bin log2: bin b berisi nilai di [2^b, 2^(b+1)). Nilai 0 diabaikan."""
+    nilai = nilai[nilai > 0]
+    if len(nilai) == 0:
+        return np.zeros(0, dtype=np.int64)
+    b = np.floor(np.log2(nilai)).astype(np.int64)
+    return np.bincount(b)
+
+
+# --- FUNGSI UTAMA ---
+def main(path, n_top=TOP_N):
+    print(f"\n{'='*90}")
+    print(f"{'VOLUME PAKET DAN TOP TALKER':^90}")
+    print(f"{'='*90}")
+
+    wload_to_arrays, files = baca_folder_array(path)
+    if not wload_to_arrays:
+        print("\n[!] Tidak ada graf yang ditemukan.")
+        return
+
+    workloads = sorted(wload_to_arrays, key=lambda w: len(wload_to_arrays[w]['src']), reverse=True)
+
+    talker_rows, port_rows, dist_rows, ringkas = [], [], [], []
+
+    print(f"\n{'Graph ID':<10} {'Edges':<10} {'Total Paket':<16} {'Top Talker':<12} {'Paket':<14} {'Top Port':<10}")
+    print('-' * 90)
+    for w in workloads:
+        arr = wload_to_arrays[w]
+        with metrik.fase('analisis'):
+            g = graf_berbobot(arr)
+            vn = volume_node(g)
+            ports, port_paket, port_token = volume_port(arr)
+        total_node = vn['keluar'] + vn['masuk']
+        total_paket = int(g['paket'].sum())
+
+        for rank, i in enumerate(top_n(total_node, n_top), 1):
+            talker_rows.append([w, rank, vn['node_ids'][i], vn['keluar'][i], vn['masuk'][i],
+                                total_node[i], vn['derajat_keluar'][i], vn['derajat_masuk'][i]])
+        for rank, i in enumerate(top_n(port_paket, n_top), 1):
+            port_rows.append([w, rank, nama_port(ports[i]), port_paket[i], port_token[i]])
+
+        d_keluar = distribusi_log2(vn['keluar'])
+        d_masuk = distribusi_log2(vn['masuk'])
+        for b in range(max(len(d_keluar), len(d_masuk))):
+            dist_rows.append([w, 2 ** b, 2 ** (b + 1) - 1,
+                              d_keluar[b] if b < len(d_keluar) else 0,
+                              d_masuk[b] if b < len(d_masuk) else 0])
+
+        i_top = top_n(total_node, 1)
+        p_top = top_n(port_paket, 1)
+        top_node = vn['node_ids'][i_top[0]] if len(i_top) else '-'
+        top_node_paket = total_node[i_top[0]] if len(i_top) else 0
+        top_port = nama_port(ports[p_top[0]]) if len(p_top) else '-'
+        ringkas.append([w, len(g['src']), total_paket, top_node, top_node_paket, top_port])
+        print(f"{w:<10} {len(g['src']):<10} {total_paket:<16} {top_node:<12} {top_node_paket:<14} {top_port:<10}")
+
+    # --- SIMPAN KE CSV ---
+    try:
+        with metrik.fase('tulis_csv'), open("volume_paket.csv", 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(['Graph ID', 'Directed Edges', 'Total Paket', 'Top Talker',
+                             'Paket Top Talker', 'Top Port (Volume)'])
+            writer.writerows(ringkas)
+        with metrik.fase('tulis_csv'), open("top_talker.csv", 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(['Graph ID', 'Rank', 'Node ID', 'Paket Keluar (Client)',
+                             'Paket Masuk (Server)', 'Total Paket', 'Out Degree', 'In Degree'])
+            writer.writerows(talker_rows)
+        with metrik.fase('tulis_csv'), open("top_port_volume.csv", 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(['Graph ID', 'Rank', 'Port', 'Total Paket', 'Jumlah Token'])
+            writer.writerows(port_rows)
+        with metrik.fase('tulis_csv'), open("distribusi_bobot_derajat.csv", 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(['Graph ID', 'Paket Dari', 'Paket Sampai', 'Jumlah Node (Keluar)',
+                             'Jumlah Node (Masuk)'])
+            writer.writerows(dist_rows)
+        print(f"\n[SUKSES] Disimpan: volume_paket.csv, top_talker.csv, top_port_volume.csv, "
+              f"distribusi_bobot_derajat.csv\n")
+    except Exception as e:
+        print(f"\n[ERROR] Gagal menyimpan CSV: {e}")
+
+
+if __name__ == '__main__':
+    sys.argv = pipeline_baca.dari_argv(dedup_file.dari_argv(indeks_graf.dari_argv(metrik.dari_argv(sys.argv))))
+    if len(sys.argv) < 2:
+        print("Usage: python volume_paket.py <folder_name> [top_n] [--graph <id>] [--containment[=tandai|lewati]] [--prefetch=N] [--metrik[=file.json]] [--profile[=file.prof]]")
+        sys.exit(1)
+
+    path = sys.argv[1]
+    if not os.path.exists(path):
+        print(f"[ERROR] Folder '{path}' tidak ditemukan!")
+        sys.exit(1)
+
+    n_top = int(sys.argv[2]) if len(sys.argv) > 2 else TOP_N
+    main(path, n_top)